@@ -0,0 +1,27 @@
+"""Shared timing and synthetic data helpers for the benchmarks in this directory."""
+
+import random
+import string
+import time
+from collections.abc import Callable
+from typing import Final
+
+# Number of times each case is timed; the fastest run is reported.
+REPEAT: Final[int] = 3
+
+
+def make_word(rng: random.Random, min_length: int = 3, max_length: int = 9) -> str:
+    """Return a reproducible lowercase ASCII word of ``min_length`` to ``max_length`` characters drawn from ``rng``."""
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(min_length, max_length)))
+
+
+def time_best(function: Callable[[], object]) -> float:
+    """Return the fastest of ``REPEAT`` timings of ``function`` in seconds."""
+    timings = []
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
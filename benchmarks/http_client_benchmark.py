@@ -0,0 +1,100 @@
+"""Benchmarks client requests through the pooled keep-alive session against one-off ``requests`` calls per request.
+
+Starts a local HTTP/1.1 server on a free port, so no timing includes network latency beyond the loopback interface.
+
+Run from the repository root:
+
+    python3 -m benchmarks.http_client_benchmark
+"""
+
+import functools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Final
+
+import requests
+
+from pyrcli.cli.http import client
+
+from .common import REPEAT, time_best
+
+# Number of requests sent per timed run.
+_REQUEST_COUNT: Final[int] = 1000
+
+# Body returned by the local server for every request.
+_RESPONSE_BODY: Final[bytes] = json.dumps({"ip": "127.0.0.1", "city": "Localhost"}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answer every request with a small JSON body and keep the connection open."""
+    protocol_version = "HTTP/1.1"
+
+    # Headers and body are written separately; with Nagle's algorithm, a kept-alive connection waits for a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def do_DELETE(self) -> None:
+        """Answer a DELETE request."""
+        self.send_body()
+
+    def do_GET(self) -> None:
+        """Answer a GET request."""
+        self.send_body()
+
+    def do_POST(self) -> None:
+        """Answer a POST request after reading its body."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_body()
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Discard the request log."""
+
+    def send_body(self) -> None:
+        """Send the JSON response body."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(_RESPONSE_BODY)
+
+
+def _send_one_off(url: str, method: str) -> None:
+    """Send ``_REQUEST_COUNT`` requests, each through a new ``requests`` session as the client did before pooling."""
+    data = json.dumps({"n": 1}) if method == "POST" else None
+
+    for _ in range(_REQUEST_COUNT):
+        requests.request(method, url, data=data, timeout=15.0)
+
+
+def _send_pooled(url: str, method: str) -> None:
+    """Send ``_REQUEST_COUNT`` requests with the client functions."""
+    send = functools.partial(client.post, data={"n": 1}) if method == "POST" else getattr(client, method.lower())
+
+    for _ in range(_REQUEST_COUNT):
+        send(url)
+
+
+def main() -> None:
+    """Run the benchmarks and print timings."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        print(f"{_REQUEST_COUNT:,} requests; best of {REPEAT}; microseconds per request")
+        print(f"{'method':<10}{'one-off':>10}{'pooled':>10}{'speedup':>9}")
+
+        for method in ("GET", "POST", "DELETE"):
+            one_off_time = time_best(lambda: _send_one_off(url, method))
+            pooled_time = time_best(lambda: _send_pooled(url, method))
+            print(f"{method:<10}{one_off_time / _REQUEST_COUNT * 1e6:>10.0f}{pooled_time / _REQUEST_COUNT * 1e6:>10.0f}"
+                  f"{one_off_time / pooled_time:>8.1f}x")
+    finally:
+        client.close_session()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmarks single-pass mapping replacement against one substitution pass per find and replace pair.
+
+Run from the repository root:
+
+    python3 -m benchmarks.mapping_benchmark
+"""
+
+import random
+import re
+import string
+from collections.abc import Callable, Mapping, Sequence
+from typing import Final
+
+from pyrcli.cli import patterns
+
+from .common import REPEAT, make_word, time_best
+
+# Number of synthetic log lines to rewrite.
+_LINE_COUNT: Final[int] = 50_000
+
+# Numbers of find and replace pairs to time.
+_PAIR_COUNTS: Final[tuple[int, ...]] = (10, 100, 1000, 5000)
+
+# Largest number of pairs timed with one pass per pair; more would take minutes.
+_MAX_CHAINED_PAIRS: Final[int] = 100
+
+
+def _make_lines(count: int, tokens: Sequence[str]) -> list[str]:
+    """Return reproducible log-like lines in which about one word in eight is one of ``tokens``."""
+    rng = random.Random(0)
+    lines = []
+
+    for index in range(count):
+        words = [rng.choice(tokens) if rng.random() < 0.125 else make_word(rng) for _ in range(8)]
+        lines.append(f"2024-01-01T00:00:{index % 60:02d} INFO {' '.join(words)}")
+
+    return lines
+
+
+def _make_replacements(count: int) -> dict[str, str]:
+    """Return ``count`` reproducible user name tokens mapped to redacted placeholders."""
+    rng = random.Random(1)
+    tokens = set()
+
+    while len(tokens) < count:
+        tokens.add("user_" + "".join(rng.choices(string.ascii_lowercase + string.digits, k=8)))
+
+    return {token: f"<redacted-{index}>" for index, token in enumerate(sorted(tokens))}
+
+
+def _replace_chained(lines: Sequence[str], replacements: Mapping[str, str]) -> list[str]:
+    """Return ``lines`` rewritten with one substitution pass per pair, as a pipeline of subs invocations does."""
+    compiled = [(re.compile(re.escape(key)), replacement) for key, replacement in replacements.items()]
+    rewritten = list(lines)
+
+    for pattern, replacement in compiled:
+        rewritten = [pattern.sub(replacement, line) for line in rewritten]
+
+    return rewritten
+
+
+def _replace_mapped(lines: Sequence[str], pattern: re.Pattern[str],
+                    replacer: Callable[[re.Match[str]], str]) -> list[str]:
+    """Return ``lines`` rewritten in a single pass, as subs --mapping does."""
+    return [pattern.sub(replacer, line) for line in lines]
+
+
+def main() -> None:
+    """Run the benchmarks and print timings."""
+    print(f"{_LINE_COUNT:,} lines; best of {REPEAT}")
+    print(f"{'pairs':>8}{'chained':>10}{'compile':>10}{'mapped':>10}{'lines/s':>14}")
+
+    for pair_count in _PAIR_COUNTS:
+        replacements = _make_replacements(pair_count)
+        lines = _make_lines(_LINE_COUNT, list(replacements))
+        compile_time = time_best(lambda: patterns.compile_mapping_pattern(replacements, ignore_case=False,
+                                                                           on_error=print))
+        pattern, replacer = patterns.compile_mapping_pattern(replacements, ignore_case=False, on_error=print)
+        mapped_time = time_best(lambda: _replace_mapped(lines, pattern, replacer))
+
+        if pair_count <= _MAX_CHAINED_PAIRS:
+            assert _replace_chained(lines, replacements) == _replace_mapped(lines, pattern, replacer)
+            chained = f"{time_best(lambda: _replace_chained(lines, replacements)):>10.3f}"
+        else:
+            chained = f"{'-':>10}"
+
+        print(f"{pair_count:>8}{chained}{compile_time:>10.3f}{mapped_time:>10.3f}{_LINE_COUNT / mapped_time:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
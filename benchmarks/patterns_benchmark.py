@@ -0,0 +1,84 @@
+"""Benchmarks literal pattern matching against the regular expression path used before literal detection.
+
+Run from the repository root:
+
+    python3 -m benchmarks.patterns_benchmark
+"""
+
+import random
+import re
+from collections.abc import Sequence
+from typing import Final
+
+from pyrcli.cli import patterns
+
+from .common import REPEAT, make_word, time_best
+
+# Number of synthetic log lines to search.
+_LINE_COUNT: Final[int] = 50_000
+
+
+def _make_lines(count: int) -> list[str]:
+    """Return reproducible log-like lines with a rare request ID."""
+    rng = random.Random(0)
+    lines = []
+
+    for index in range(count):
+        request_id = "req-7f3a9c" if index % 1000 == 0 else f"req-{rng.getrandbits(24):06x}"
+        words = " ".join(make_word(rng) for _ in range(8))
+        lines.append(f"2024-01-01T00:00:{index % 60:02d} INFO {request_id} {words}")
+
+    return lines
+
+
+def _count_matching_lines(lines: Sequence[str], compiled_patterns: patterns.CompiledPatterns) -> int:
+    """Return the number of lines that match all patterns, as scan does."""
+    return sum(1 for line in lines if patterns.matches_all_patterns(line, compiled_patterns=compiled_patterns))
+
+
+def _count_matching_lines_with_regex(lines: Sequence[str], compiled_patterns: Sequence[re.Pattern[str]]) -> int:
+    """Return the number of lines that match all patterns, as scan did before literal detection."""
+    return sum(1 for line in lines if all(pattern.search(line) for pattern in compiled_patterns))
+
+
+def _count_substitutions(lines: Sequence[str], pattern: re.Pattern[str]) -> int:
+    """Return the number of lines changed by substituting matches of ``pattern``, as subs does."""
+    return sum(1 for line in lines if pattern.sub("-", line) != line)
+
+
+def main() -> None:
+    """Run the benchmarks and print timings."""
+    lines = _make_lines(_LINE_COUNT)
+    rng = random.Random(1)
+    literals = sorted({make_word(rng, 5) for _ in range(100)})
+
+    print(f"{len(lines):,} lines; best of {REPEAT}")
+    print(f"{'case':<42}{'regex':>10}{'literal':>10}{'speedup':>9}")
+
+    for ignore_case in (False, True):
+        flags = re.IGNORECASE if ignore_case else re.NOFLAG
+        label = " (ignore case)" if ignore_case else ""
+
+        # scan: one literal --find pattern.
+        regex_patterns = [re.compile("req-7f3a9c", flags=flags)]
+        literal_patterns = patterns.compile_patterns(["req-7f3a9c"], ignore_case=ignore_case, on_error=print)
+        assert _count_matching_lines_with_regex(lines, regex_patterns) == _count_matching_lines(lines,
+                                                                                               literal_patterns)
+        regex_time = time_best(lambda: _count_matching_lines_with_regex(lines, regex_patterns))
+        literal_time = time_best(lambda: _count_matching_lines(lines, literal_patterns))
+        print(f"{'scan, 1 literal' + label:<42}{regex_time:>10.3f}{literal_time:>10.3f}"
+              f"{regex_time / literal_time:>8.1f}x")
+
+        # subs: many literal --find patterns combined into one OR-pattern.
+        regex_or_pattern = re.compile("|".join(f"(?:{literal})" for literal in literals), flags=flags)
+        literal_or_pattern = patterns.compile_or_pattern(
+            patterns.compile_patterns(literals, ignore_case=ignore_case, on_error=print), ignore_case=ignore_case)
+        assert _count_substitutions(lines, regex_or_pattern) == _count_substitutions(lines, literal_or_pattern)
+        regex_time = time_best(lambda: _count_substitutions(lines, regex_or_pattern))
+        literal_time = time_best(lambda: _count_substitutions(lines, literal_or_pattern))
+        print(f"{f'subs, {len(literals)} literals' + label:<42}{regex_time:>10.3f}{literal_time:>10.3f}"
+              f"{regex_time / literal_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmarks seek's compiled path filters and formatter against the per-path option checks used before compilation.
+
+Run from the repository root:
+
+    python3 -m benchmarks.seek_benchmark
+"""
+
+import os
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final
+
+from pyrcli.cli.path_index import IndexedPath
+from pyrcli.commands.seek import Seek
+
+from .common import REPEAT, time_best
+
+# Number of synthetic directories, and of files in each.
+_DIRECTORY_COUNT: Final[int] = 1000
+_FILES_PER_DIRECTORY: Final[int] = 1000
+
+
+def _make_entries() -> list[IndexedPath]:
+    """Return a reproducible synthetic tree of index entries, so that no timing includes file system calls."""
+    now = time.time()
+    entries = []
+
+    for directory_index in range(_DIRECTORY_COUNT):
+        parent = os.path.join("src", f"package{directory_index // 100}", f"module{directory_index}")
+
+        for file_index in range(_FILES_PER_DIRECTORY):
+            entries.append(IndexedPath(name=f"file{file_index}.py", parent=parent, depth=3, is_dir=False,
+                                       size=file_index % 7, mtime=now - file_index * 600))
+
+    return entries
+
+
+def _make_seek(arguments: Sequence[str]) -> Seek:
+    """Return a ``Seek`` instance with ``arguments`` parsed and its runtime state initialized."""
+    seek = Seek()
+    seek.args = seek.build_arguments().parse_args(["--color", "off", *arguments])
+    seek._run_option_hooks()
+    return seek
+
+
+def _legacy_format_path(seek: Seek, name_part: str, path_part: str, is_current_directory: bool) -> str:
+    """Return the display path, as ``Seek.print_path`` did before compilation."""
+    if seek.args.abs:
+        if is_current_directory:
+            display_path = os.path.join(Path.cwd(), path_part)
+        else:
+            display_path = os.path.join(Path.cwd(), path_part, name_part)
+    else:
+        if seek.args.dot_prefix and not is_current_directory:
+            display_path = os.path.join(os.curdir, path_part, name_part)
+        else:
+            display_path = os.path.join(path_part, name_part)
+
+    if seek.args.quotes:
+        display_path = f'"{display_path}"'
+
+    return display_path
+
+
+def _legacy_matches_filters(seek: Seek, path_entry: IndexedPath) -> bool:
+    """Return whether ``path_entry`` passes the filters, as ``Seek.path_matches_filters`` did before compilation."""
+    if seek.args.type:
+        is_dir = path_entry.is_dir()
+
+        if seek.args.type == "d" and not is_dir:
+            return False
+
+        if seek.args.type == "f" and is_dir:
+            return False
+
+    if seek.args.empty_only and not path_entry.is_empty():
+        return False
+
+    threshold_seconds = None
+
+    if seek.args.mtime_days:
+        threshold_seconds = seek.args.mtime_days * 86400
+    elif seek.args.mtime_hours:
+        threshold_seconds = seek.args.mtime_hours * 3600
+    elif seek.args.mtime_mins:
+        threshold_seconds = seek.args.mtime_mins * 60
+
+    if threshold_seconds is not None:
+        age_seconds = time.time() - path_entry.get_mtime()
+
+        if threshold_seconds < 0:
+            return age_seconds < abs(threshold_seconds)
+
+        return age_seconds > threshold_seconds
+
+    return True
+
+
+def _run_compiled(seek: Seek, entries: Sequence[IndexedPath]) -> list[str]:
+    """Return the display paths of the entries that pass the compiled filters."""
+    return [seek.format_path(entry.name, entry.parent, False) for entry in entries if
+            seek.path_matches_filters(entry)]
+
+
+def _run_legacy(seek: Seek, entries: Sequence[IndexedPath]) -> list[str]:
+    """Return the display paths of the entries that pass the filters, checked as before compilation."""
+    return [_legacy_format_path(seek, entry.name, entry.parent, False) for entry in entries if
+            _legacy_matches_filters(seek, entry)]
+
+
+def main() -> None:
+    """Run the benchmarks and print timings."""
+    entries = _make_entries()
+    cases = (
+        [],
+        ["--abs", "--quotes"],
+        ["--dot-prefix"],
+        ["--type", "f", "--empty-only"],
+        ["--mtime-hours", "-24", "--abs"],
+        ["--type", "f", "--mtime-days", "1", "--dot-prefix", "--quotes"],
+    )
+
+    print(f"{len(entries):,} entries; best of {REPEAT}; microseconds per entry")
+    print(f"{'options':<52}{'legacy':>9}{'compiled':>10}{'speedup':>9}")
+
+    for arguments in cases:
+        seek = _make_seek(arguments)
+        assert _run_legacy(seek, entries) == _run_compiled(seek, entries)
+        legacy_time = time_best(lambda: _run_legacy(seek, entries))
+        compiled_time = time_best(lambda: _run_compiled(seek, entries))
+        label = " ".join(arguments) or "(none)"
+        print(f"{label:<52}{legacy_time / len(entries) * 1e6:>9.3f}{compiled_time / len(entries) * 1e6:>10.3f}"
+              f"{legacy_time / compiled_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
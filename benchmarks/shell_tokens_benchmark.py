@@ -0,0 +1,92 @@
+"""Benchmarks split_shell_tokens against splitting every line with shlex, as it did before the regular expression path.
+
+Run from the repository root:
+
+    python3 -m benchmarks.shell_tokens_benchmark
+"""
+
+import random
+import shlex
+from collections.abc import Sequence
+from typing import Final
+
+from pyrcli.cli import text
+
+from .common import REPEAT, make_word, time_best
+
+# Number of synthetic shell history lines to split.
+_LINE_COUNT: Final[int] = 100_000
+
+
+def _make_lines(count: int) -> list[str]:
+    """Return reproducible shell history lines with options, paths, quoted arguments, escapes, and comments."""
+    rng = random.Random(0)
+    commands = ("git", "grep", "ls", "docker", "find", "python3", "ssh", "curl", "make", "kubectl")
+
+    def make_argument() -> str:
+        """Return a random word, path, or option."""
+        word = make_word(rng, 2, 8)
+        return rng.choice((word, f"--{word}", f"-{word[0]}", f"./{word}/{word}.txt", f"{word}=1"))
+
+    lines = []
+
+    for _ in range(count):
+        words = [rng.choice(commands)] + [make_argument() for _ in range(rng.randint(1, 8))]
+        kind = rng.random()
+
+        if kind < 0.2:
+            words.append(f'"{make_argument()} {make_argument()}"')
+        elif kind < 0.3:
+            words.append(f"'{make_argument()} \"{make_argument()}\"'")
+        elif kind < 0.35:
+            words.append(f"{make_argument()}\\ {make_argument()}")
+        elif kind < 0.38:
+            words.append(f"# {make_argument()}")
+
+        lines.append(" ".join(words))
+
+    return lines
+
+
+def _split_with_shlex(lines: Sequence[str], literal_quotes: bool) -> list[list[str]]:
+    """Return the tokens of each line, split with a new shlex lexer per line as before."""
+    tokens = []
+
+    for line in lines:
+        lexer = shlex.shlex(line, posix=True, punctuation_chars=False)
+        lexer.whitespace_split = True
+
+        if literal_quotes:
+            lexer.quotes = ""
+
+        try:
+            tokens.append(list(lexer))
+        except ValueError:
+            tokens.append([line])
+
+    return tokens
+
+
+def _split_shell_tokens(lines: Sequence[str], literal_quotes: bool) -> list[list[str]]:
+    """Return the tokens of each line, split with split_shell_tokens."""
+    return [text.split_shell_tokens(line, literal_quotes=literal_quotes) for line in lines]
+
+
+def main() -> None:
+    """Run the benchmarks and print timings."""
+    lines = _make_lines(_LINE_COUNT)
+
+    print(f"{len(lines):,} lines; best of {REPEAT}")
+    print(f"{'case':<20}{'shlex':>10}{'regex':>10}{'speedup':>9}{'lines/s':>14}")
+
+    for literal_quotes in (False, True):
+        assert _split_with_shlex(lines, literal_quotes) == _split_shell_tokens(lines, literal_quotes)
+        shlex_time = time_best(lambda: _split_with_shlex(lines, literal_quotes))
+        regex_time = time_best(lambda: _split_shell_tokens(lines, literal_quotes))
+        label = "literal quotes" if literal_quotes else "shell quotes"
+        print(f"{label:<20}{shlex_time:>10.3f}{regex_time:>10.3f}{shlex_time / regex_time:>8.1f}x"
+              f"{len(lines) / regex_time:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
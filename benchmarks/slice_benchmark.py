@@ -0,0 +1,82 @@
+"""Benchmarks field-limited splitting, as slice --fields uses, against splitting every field and then selecting.
+
+Run from the repository root:
+
+    python3 -m benchmarks.slice_benchmark
+"""
+
+import io
+import random
+from collections.abc import Sequence
+from typing import Any, Final
+
+from pyrcli.cli.text import Splitter
+
+from .common import REPEAT, time_best
+
+# Number of synthetic lines in most inputs.
+_LINE_COUNT: Final[int] = 20_000
+
+
+def _make_lines(column_count: int, *, separator: str, quote_every: int = 0) -> list[str]:
+    """Return reproducible lines of numbers; every ``quote_every``-th field is a quoted field holding the separator."""
+    rng = random.Random(0)
+    lines = []
+
+    for index in range(_LINE_COUNT):
+        fields = [f'"{index}{separator}{column}"' if quote_every and column % quote_every == 1 else
+                  str(rng.randint(0, 99999)) for column in range(column_count)]
+        lines.append(separator.join(fields) + "\n")
+
+    return lines
+
+
+def _select_all(lines: Sequence[str], settings: dict[str, Any], selected_fields: Sequence[int]) -> list[list[str]]:
+    """Return the selected non-empty fields of each line, splitting every field as slice did before field limits."""
+    records = Splitter(**settings).split_stream(io.StringIO("".join(lines)))
+    selected = []
+
+    for fields in records:
+        fields = [field for field in fields if field]
+        selected.append([fields[index] for index in selected_fields if index < len(fields)])
+
+    return selected
+
+
+def _select_limited(lines: Sequence[str], settings: dict[str, Any], selected_fields: Sequence[int]) -> list[list[str]]:
+    """Return the selected non-empty fields of each line, splitting no further than the last selected field."""
+    splitter = Splitter(**settings, drop_empty=True, max_fields=max(selected_fields) + 1)
+    records = splitter.split_stream(io.StringIO("".join(lines)))
+    return [[fields[index] for index in selected_fields if index < len(fields)] for fields in records]
+
+
+def main() -> None:
+    """Run the benchmarks and print timings."""
+    wide_csv = _make_lines(400, separator=",", quote_every=50)
+    narrow_csv = _make_lines(40, separator=",", quote_every=10)
+    wide_text = _make_lines(400, separator="  ")
+    cases = (
+        ("csv, 400 columns, unquoted", _make_lines(400, separator=","), {"mode": "csv", "separator": ","}),
+        ("csv, 400 columns, 8 quoted", wide_csv, {"mode": "csv", "separator": ","}),
+        ("csv, 40 columns, 4 quoted", narrow_csv, {"mode": "csv", "separator": ","}),
+        ("csv, 400 columns, space-aligned", wide_text, {"mode": "csv", "separator": " "}),
+        ("regex, 400 columns", wide_text, {"mode": "regex", "pattern": r"\s+"}),
+        # Splitting every field with shlex is slow; time fewer lines.
+        ("shell, 400 columns", wide_text[:_LINE_COUNT // 10], {"mode": "shell"}),
+    )
+
+    print(f"best of {REPEAT}")
+    print(f"{'case':<34}{'lines':>8}{'fields':>10}{'all':>9}{'limited':>9}{'speedup':>9}")
+
+    for label, lines, settings in cases:
+        for selected_fields in ([0, 2], [0, 4, 19], [1, 299]):
+            all_time = time_best(lambda: _select_all(lines, settings, selected_fields))
+            limited_time = time_best(lambda: _select_limited(lines, settings, selected_fields))
+            assert _select_all(lines, settings, selected_fields) == _select_limited(lines, settings, selected_fields)
+            fields = " ".join(str(index + 1) for index in selected_fields)
+            print(f"{label:<34}{len(lines):>8,}{fields:>10}{all_time:>9.3f}{limited_time:>9.3f}"
+                  f"{all_time / limited_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,12 +27,25 @@ from .ini import (
 )
 from .io import (
     InputFile,
+    MappedLines,
+    PathEntry,
     iter_descendant_paths,
+    iter_path_entries,
     iter_stdin_lines,
     open_text_files,
+    read_last_lines,
+    replace_text_file,
     write_text_file,
 )
+from .output import OutputSink
+from .path_index import (
+    IndexedPath,
+    PathIndex,
+    find_indexed_root,
+)
 from .patterns import (
+    LiteralPattern,
+    compile_mapping_pattern,
     compile_or_pattern,
     compile_patterns,
     matches_all_patterns,
@@ -63,6 +76,7 @@ from .terminal import (
     stdout_is_terminal,
 )
 from .text import (
+    Splitter,
     decode_python_escape_sequences,
     iter_nonempty_lines,
     iter_normalized_lines,
@@ -76,6 +90,7 @@ from .types import (
     CompiledPatterns,
     ErrorReporter,
 )
+from .watch import FileWatcher
 
 __all__ = (
     # ansi
@@ -108,12 +123,27 @@ __all__ = (
 
     # io
     "InputFile",
+    "MappedLines",
+    "PathEntry",
     "iter_descendant_paths",
+    "iter_path_entries",
     "iter_stdin_lines",
     "open_text_files",
+    "read_last_lines",
+    "replace_text_file",
     "write_text_file",
 
+    # output
+    "OutputSink",
+
+    # path_index
+    "IndexedPath",
+    "PathIndex",
+    "find_indexed_root",
+
     # patterns
+    "LiteralPattern",
+    "compile_mapping_pattern",
     "compile_or_pattern",
     "compile_patterns",
     "matches_all_patterns",
@@ -144,6 +174,7 @@ __all__ = (
     "stdout_is_terminal",
 
     # text
+    "Splitter",
     "decode_python_escape_sequences",
     "iter_nonempty_lines",
     "iter_normalized_lines",
@@ -155,4 +186,7 @@ __all__ = (
     # types
     "CompiledPatterns",
     "ErrorReporter",
+
+    # watch
+    "FileWatcher",
 )
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from typing import Final, final
 
 from pyrcli import __version__
+from .output import OutputSink
 from .platform import IS_WINDOWS
 from .terminal import stdout_is_terminal
 
@@ -23,6 +24,7 @@ class CLIProgram(ABC):
         error_exit_code: Exit code when an error occurs (default: ``1``).
         has_errors: Whether the program has encountered errors.
         name: Name of the program.
+        out: Buffered sink for standard output; line-buffered when standard output is attached to a terminal.
         use_color: Whether color output is enabled.
         version: Program version.
     """
@@ -33,8 +35,10 @@ class CLIProgram(ABC):
         self.error_exit_code: Final[int] = error_exit_code
         self.has_errors: bool = False
         self.name: Final[str] = name
+        self.out: OutputSink = OutputSink(line_buffered=stdout_is_terminal())
         self.use_color: bool = False
         self.version: Final[str] = __version__
+        self._deferred_error_messages: list[str] | None = None  # Set in worker processes; see print_error().
 
     def _parse_arguments(self) -> None:
         """Parse command-line arguments and populate ``args``."""
@@ -79,9 +83,17 @@ class CLIProgram(ABC):
 
     @final
     def print_error(self, error_message: str) -> None:
-        """Set the error flag and print ``error_message`` to standard error unless ``--no-messages`` is set."""
+        """Set the error flag and print ``error_message`` to standard error unless ``--no-messages`` is set.
+
+        - Appends ``error_message`` to the deferred messages instead when running in a worker process, so that the
+          main process can report it in input order.
+        """
         self.has_errors = True
 
+        if self._deferred_error_messages is not None:
+            self._deferred_error_messages.append(error_message)
+            return
+
         # --no-messages is a Unix convention to suppress per-file diagnostics but still set the error flag.
         if not getattr(self.args, "no_messages", False):
             print(f"{self.name}: error: {error_message}", file=sys.stderr)
@@ -106,7 +118,7 @@ class CLIProgram(ABC):
           - ``validate_option_ranges()``
           - ``normalize_options()``
           - ``initialize_runtime_state()``
-        - Calls ``execute()``.
+        - Calls ``execute()`` and flushes ``out``, including when ``execute()`` exits early.
         - Normalizes runtime errors and signals to consistent exit behavior.
         - Returns ``0`` on success.
         - Raises ``SystemExit`` with a non-zero code on failure.
@@ -125,7 +137,12 @@ class CLIProgram(ABC):
 
             self._parse_arguments()
             self._run_option_hooks()
-            self.execute()
+
+            try:
+                self.execute()
+            finally:
+                self.out.flush()
+
             self.exit_if_errors()
         except BrokenPipeError:
             raise SystemExit(self.error_exit_code if IS_WINDOWS else _SIGPIPE_EXIT_CODE)
@@ -1,10 +1,12 @@
 """Public API for the http package."""
 
 from .client import (
+    close_session,
     delete,
     get,
     post,
     put,
+    set_pool_size,
     set_timeout,
 )
 from .json import get_body
@@ -21,10 +23,12 @@ from .upload import open_multipart_file
 
 __all__ = (
     # client
+    "close_session",
     "delete",
     "get",
     "post",
     "put",
+    "set_pool_size",
     "set_timeout",
 
     # json
@@ -0,0 +1,85 @@
+"""Asyncio counterparts of the HTTP DELETE, GET, POST, and PUT helpers."""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+
+import requests
+
+from . import client
+from .types import JsonArray, JsonObject, KeyValuePairs, MultipartFiles, QueryParameters
+
+
+async def delete(url: str, *, params: QueryParameters | None = None, accept: str = "application/json",
+                 auth_headers: KeyValuePairs | None = None, raise_on_error: bool = False) -> requests.Response:
+    """Send a DELETE request without blocking the event loop and return the response.
+
+    - Runs ``client.delete`` in the event loop's default executor, so headers, timeout, and connection pooling match.
+    """
+    return await asyncio.to_thread(client.delete, url, params=params, accept=accept, auth_headers=auth_headers,
+                                   raise_on_error=raise_on_error)
+
+
+async def gather[T](requests_to_send: Iterable[Awaitable[T]], *, limit: int = 10,
+                    return_exceptions: bool = False) -> list[T | BaseException]:
+    """Await ``requests_to_send`` with at most ``limit`` in progress at once and return their results in order.
+
+    - Raises ``ValueError`` if ``limit`` is less than 1.
+    - Returns exceptions in place of results when ``return_exceptions`` is ``True``; otherwise raises the first one.
+    - Connections beyond the client pool size (see ``client.set_pool_size``) are closed after use instead of kept alive.
+    """
+    if limit < 1:
+        raise ValueError(f"invalid concurrency limit: {limit}")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def send(request: Awaitable[T]) -> T:
+        """Await ``request`` once a slot is free."""
+        async with semaphore:
+            return await request
+
+    return await asyncio.gather(*map(send, requests_to_send), return_exceptions=return_exceptions)
+
+
+async def get(url: str, *, params: QueryParameters | None = None, accept: str = "application/json",
+              auth_headers: KeyValuePairs | None = None, raise_on_error: bool = False) -> requests.Response:
+    """Send a GET request without blocking the event loop and return the response.
+
+    - Runs ``client.get`` in the event loop's default executor, so headers, timeout, and connection pooling match.
+    """
+    return await asyncio.to_thread(client.get, url, params=params, accept=accept, auth_headers=auth_headers,
+                                   raise_on_error=raise_on_error)
+
+
+async def post(url: str, *, params: QueryParameters | None = None, data: JsonArray | JsonObject | None = None,
+               files: MultipartFiles | None = None, serialize_to_json: bool = True, accept: str = "application/json",
+               auth_headers: KeyValuePairs | None = None, raise_on_error: bool = False) -> requests.Response:
+    """Send a POST request without blocking the event loop and return the response.
+
+    - Runs ``client.post`` in the event loop's default executor, so headers, body serialization, timeout, and
+      connection pooling match.
+    """
+    return await asyncio.to_thread(client.post, url, params=params, data=data, files=files,
+                                   serialize_to_json=serialize_to_json, accept=accept, auth_headers=auth_headers,
+                                   raise_on_error=raise_on_error)
+
+
+async def put(url: str, *, params: QueryParameters | None = None, data: JsonArray | JsonObject | None = None,
+              files: MultipartFiles | None = None, serialize_to_json: bool = True, accept: str = "application/json",
+              auth_headers: KeyValuePairs | None = None, raise_on_error: bool = False) -> requests.Response:
+    """Send a PUT request without blocking the event loop and return the response.
+
+    - Runs ``client.put`` in the event loop's default executor, so headers, body serialization, timeout, and
+      connection pooling match.
+    """
+    return await asyncio.to_thread(client.put, url, params=params, data=data, files=files,
+                                   serialize_to_json=serialize_to_json, accept=accept, auth_headers=auth_headers,
+                                   raise_on_error=raise_on_error)
+
+
+__all__ = (
+    "delete",
+    "gather",
+    "get",
+    "post",
+    "put",
+)
@@ -1,10 +1,13 @@
 """Helpers for sending HTTP DELETE, GET, POST, and PUT requests."""
 
 import json
+import threading
 from enum import StrEnum
-from typing import Callable, Final
+from http.cookiejar import DefaultCookiePolicy
+from typing import Final
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .types import JsonArray, JsonObject, KeyValuePairs, MultipartFiles, QueryParameters
 
@@ -17,17 +20,18 @@ class _HTTPMethod(StrEnum):
     PUT = "PUT"
 
 
-# HTTP method to internal request function dispatch table.
-_REQUEST_DISPATCH: Final[dict[_HTTPMethod, Callable[..., requests.Response]]] = {
-    _HTTPMethod.DELETE: requests.delete,
-    _HTTPMethod.GET: requests.get,
-    _HTTPMethod.POST: requests.post,
-    _HTTPMethod.PUT: requests.put,
-}
+# Module-wide number of connections kept alive per host; use set_pool_size() to change.
+_pool_size: int = 10
 
 # Module-wide request timeout in seconds; use set_timeout() to change.
 _request_timeout: float = 15.0
 
+# Module-wide session that reuses connections across requests; created on first use.
+_session: requests.Session | None = None
+
+# Guards creating, closing, and resizing the module-wide session, which may be used from several threads at once.
+_session_lock: Final[threading.Lock] = threading.Lock()
+
 
 def _build_request_body(*, data: JsonArray | JsonObject | None, files: MultipartFiles | None,
                         enabled: bool) -> JsonArray | JsonObject | str | None:
@@ -66,18 +70,47 @@ def _build_request_headers(*, accept: str, data: JsonArray | JsonObject | None =
     return headers
 
 
+def _close_session() -> None:
+    """Close the module-wide session; the caller must hold ``_session_lock``."""
+    global _session
+
+    if _session is not None:
+        _session.close()
+        _session = None
+
+
+def _get_session() -> requests.Session:
+    """Return the module-wide session, creating it on first use.
+
+    - Creates at most one session when called from several threads at once.
+    - Mounts an ``HTTPAdapter`` that keeps up to ``_pool_size`` connections alive per host for HTTP and HTTPS.
+    - Rejects cookies set by responses, so that, as with one-off ``requests`` calls, no request sends cookies from
+      an earlier one.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            adapter = HTTPAdapter(pool_connections=_pool_size, pool_maxsize=_pool_size)
+            _session = requests.Session()
+            _session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+
+        return _session
+
+
 def _send_request(*, method: _HTTPMethod, url: str, params: QueryParameters | None = None,
                   data: JsonArray | JsonObject | str | None = None, files: MultipartFiles | None = None,
                   headers: KeyValuePairs, raise_on_error: bool) -> requests.Response:
     """Send an HTTP request and return the response.
 
-    - Dispatches to the corresponding ``requests`` function for ``method``.
+    - Sends through the module-wide session, reusing a kept-alive connection to the same host when one is free.
     - Uses the module-wide request timeout (configurable via ``set_timeout``).
     - Calls ``response.raise_for_status()`` when ``raise_on_error`` is ``True``.
     """
-    request_function = _REQUEST_DISPATCH[method]
-    response = request_function(url=url, params=params, data=data, files=files, headers=headers,
-                                timeout=_request_timeout)
+    response = _get_session().request(method, url=url, params=params, data=data, files=files, headers=headers,
+                                      timeout=_request_timeout)
 
     if raise_on_error:
         response.raise_for_status()
@@ -85,6 +118,12 @@ def _send_request(*, method: _HTTPMethod, url: str, params: QueryParameters | No
     return response
 
 
+def close_session() -> None:
+    """Close the module-wide session and its pooled connections; the next request opens a new session."""
+    with _session_lock:
+        _close_session()
+
+
 def delete(url: str, *, params: QueryParameters | None = None, accept: str = "application/json",
            auth_headers: KeyValuePairs | None = None, raise_on_error: bool = False) -> requests.Response:
     """Send a DELETE request and return the response.
@@ -146,6 +185,21 @@ def put(url: str, *, params: QueryParameters | None = None, data: JsonArray | Js
                          raise_on_error=raise_on_error)
 
 
+def set_pool_size(size: int) -> None:
+    """Set the module-wide number of connections kept alive per host; ignored if ``size`` is non-positive.
+
+    - Closes the current session, so that the next request opens a session with the new pool size.
+    """
+    if size <= 0:
+        return
+
+    global _pool_size
+
+    with _session_lock:
+        _pool_size = size
+        _close_session()
+
+
 def set_timeout(timeout: float) -> None:
     """Set the module-wide HTTP request timeout in seconds; ignored if ``timeout`` is non-positive."""
     if timeout <= 0:
@@ -156,9 +210,11 @@ def set_timeout(timeout: float) -> None:
 
 
 __all__ = (
+    "close_session",
     "delete",
     "get",
     "post",
     "put",
+    "set_pool_size",
     "set_timeout",
 )
@@ -1,24 +1,402 @@
 """Utilities for reading and writing text files and traversing filesystem paths."""
 
+import codecs
+import mmap
 import os
+import re
+import shutil
+import stat
 import sys
+import tempfile
 from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import NamedTuple, TextIO
+from typing import BinaryIO, Final, NamedTuple, Self, TextIO
 
 from .text import iter_nonempty_lines, iter_normalized_lines, strip_trailing_newline
 from .types import ErrorReporter
 
+# Codec names of encodings that decode every byte to exactly one character.
+_BYTE_PER_CHARACTER_ENCODINGS: Final[frozenset[str]] = frozenset({"iso8859-1"})
+
+# Approximate number of bytes scanned per block when reading memory-mapped files.
+_MAPPED_BLOCK_SIZE: Final[int] = 1024 * 1024
+
+# Matches a single text-mode line ending.
+_LINE_ENDING_PATTERN: Final[re.Pattern[bytes]] = re.compile(rb"\r\n|\r|\n")
+
+#: Entries of a directory that are directories and entries that are not, as returned by ``_list_directory()``.
+type _DirectoryListing = tuple[list[PathEntry], list[PathEntry]]
+
+# Number of directory listings per thread that may be running or waiting for the consumer at once.
+_LISTINGS_PER_THREAD: Final[int] = 4
+
+# Number of bytes read per step when reading a file backward from the end.
+_REVERSE_BLOCK_SIZE: Final[int] = 64 * 1024
+
+
+class MappedLines:
+    """Lines of a memory-mapped regular file, counted as bytes and decoded only in blocks on request.
+
+    - Lines end at ``b"\\n"``, ``b"\\r\\n"``, or ``b"\\r"``, matching the line boundaries of text-mode reads.
+    - Instances are valid only while the owning ``InputFile`` is valid.
+
+    Attributes:
+        encoding: Encoding used by ``count_characters()`` and ``iter_decoded_blocks()``.
+    """
+
+    def __init__(self, buffer: mmap.mmap, *, encoding: str) -> None:
+        """Initialize a new instance."""
+        self.encoding: Final[str] = encoding
+        self._buffer: Final[mmap.mmap] = buffer
+
+    def count_characters(self) -> int:
+        """Return the number of characters as read in text mode, where ``"\\r\\n"`` counts as one character.
+
+        - Counts bytes without decoding for blocks of ASCII bytes and for encodings with one byte per character;
+          decodes other blocks.
+        - Raises ``UnicodeDecodeError`` if a block that is decoded is invalid in the encoding.
+        """
+        byte_per_character = codecs.lookup(self.encoding).name in _BYTE_PER_CHARACTER_ENCODINGS
+        character_count = 0
+
+        for block in self.iter_blocks():
+            if byte_per_character or block.isascii():
+                character_count += len(block)
+            else:
+                character_count += len(block.decode(self.encoding))
+
+            # Searching for "\r" is much faster than counting it; most files have none.
+            if b"\r" in block:
+                character_count -= block.count(b"\r\n")
+
+        return character_count
+
+    def count_lines(self) -> int:
+        """Return the number of lines, including a final line without a line ending.
+
+        - Counts bytes without decoding; blocks that are not ASCII are decoded only to check that they are valid.
+        - Raises ``UnicodeDecodeError`` if a block is invalid in the encoding.
+        """
+        byte_per_character = codecs.lookup(self.encoding).name in _BYTE_PER_CHARACTER_ENCODINGS
+        line_count = 0
+        last_block = b""
+
+        for block in self.iter_blocks():
+            # Report invalid bytes as reading in text mode would.
+            if not byte_per_character and not block.isascii():
+                block.decode(self.encoding)
+
+            line_count += block.count(b"\n")
+
+            # Count "\r\n" once; blocks end after "\n", so a pair never spans two blocks.
+            if b"\r" in block:
+                line_count += block.count(b"\r") - block.count(b"\r\n")
+
+            last_block = block
+
+        if last_block and not last_block.endswith((b"\n", b"\r")):
+            line_count += 1
+
+        return line_count
+
+    def iter_blocks(self) -> Iterator[bytes]:
+        """Yield the file contents in blocks of about 1 MiB that end after a ``b"\\n"`` or at the end of the file."""
+        buffer = self._buffer
+        size = len(buffer)
+        start = 0
+
+        while start < size:
+            if start + _MAPPED_BLOCK_SIZE >= size:
+                end = size
+            else:
+                # Prefer ending at the last newline in the window; extend the block for lines longer than the window.
+                end = buffer.rfind(b"\n", start, start + _MAPPED_BLOCK_SIZE) + 1
+                end = end or buffer.find(b"\n", start + _MAPPED_BLOCK_SIZE) + 1 or size
+
+            yield buffer[start:end]
+            start = end
+
+    def iter_decoded_blocks(self) -> Iterator[str]:
+        """Yield the blocks of ``iter_blocks()`` decoded with ``encoding``, with text-mode line endings.
+
+        - Each block holds whole lines; ``"\\r\\n"`` and ``"\\r"`` are translated to ``"\\n"``.
+        - Raises ``UnicodeDecodeError`` if a block cannot be decoded.
+        """
+        for block in self.iter_blocks():
+            decoded_block = block.decode(self.encoding)
+
+            if "\r" in decoded_block:
+                decoded_block = decoded_block.replace("\r\n", "\n").replace("\r", "\n")
+
+            yield decoded_block
+
 
 class InputFile(NamedTuple):
-    """File name and open text stream for a readable file.
+    """File name and open streams for a readable file.
 
     Attributes:
         file_name: File name supplied by the caller.
         text_stream: Open text stream valid only during the current iteration.
+        mapped_lines: Byte-level view of a memory-mapped regular file, or ``None`` when the file is not memory-mapped;
+            valid only during the current iteration.
     """
     file_name: str
     text_stream: TextIO
+    mapped_lines: MappedLines | None = None
+
+
+class PathEntry:
+    """Path found while traversing a directory tree, with its file type and ``lstat()`` result cached after first use.
+
+    - Entries yielded by ``iter_path_entries`` are backed by ``os.DirEntry``, so the file type usually comes from the
+      directory listing without a system call.
+    - Paths are normalized like ``pathlib.Path``: ``"./a"`` is ``"a"`` and ``"a//b/"`` is ``"a/b"``.
+
+    Attributes:
+        depth: Depth relative to the starting point; the starting point has depth 0 and its children depth 1.
+        name: Final path component; empty for a starting point without one, such as ``"."`` or ``"/"``.
+        parent: Path of the containing directory; empty when the path has a single component.
+        path: Normalized path.
+    """
+
+    __slots__ = ("_dir_entry", "_is_dir", "_lstat", "depth", "name", "parent", "path")
+
+    def __init__(self, path: str, *, name: str, parent: str, depth: int,
+                 dir_entry: os.DirEntry[str] | None = None) -> None:
+        """Initialize a new instance."""
+        self._dir_entry: Final[os.DirEntry[str] | None] = dir_entry
+        self._is_dir: bool | None = None
+        self._lstat: os.stat_result | None = None
+        self.depth: Final[int] = depth
+        self.name: Final[str] = name
+        self.parent: Final[str] = parent
+        self.path: Final[str] = path
+
+    @classmethod
+    def from_path(cls, path: str) -> Self:
+        """Return an entry for a starting point at ``path``, with depth 0."""
+        normalized = Path(path)
+        parent = str(normalized.parent) if len(normalized.parts) > 1 else ""
+
+        return cls(str(normalized), name=normalized.name, parent=parent, depth=0)
+
+    def get_mtime(self) -> float:
+        """Return the modification time from ``lstat()``.
+
+        - Raises ``OSError`` if the path cannot be examined.
+        """
+        return self.lstat().st_mtime
+
+    def is_dir(self) -> bool:
+        """Return ``True`` if the path is a directory or a symbolic link to one; errors are treated as ``False``."""
+        if self._is_dir is None:
+            try:
+                self._is_dir = self._dir_entry.is_dir() if self._dir_entry else os.path.isdir(self.path)
+            except OSError:
+                self._is_dir = False
+
+        return self._is_dir
+
+    def is_empty(self) -> bool:
+        """Return ``True`` if the path is a directory without entries or a file of size zero.
+
+        - Raises ``OSError`` if the directory cannot be listed or the file cannot be examined.
+        """
+        if self.is_dir():
+            with os.scandir(self.path) as dir_entries:
+                return next(dir_entries, None) is None
+
+        return not self.lstat().st_size
+
+    def is_symlink(self) -> bool:
+        """Return ``True`` if the path is a symbolic link; errors are treated as ``False``."""
+        try:
+            return self._dir_entry.is_symlink() if self._dir_entry else os.path.islink(self.path)
+        except OSError:
+            return False
+
+    def lstat(self) -> os.stat_result:
+        """Return the ``lstat()`` result for the path, calling it at most once.
+
+        - Raises ``OSError`` if the path cannot be examined.
+        """
+        if self._lstat is None:
+            if self._dir_entry:
+                self._lstat = self._dir_entry.stat(follow_symlinks=False)
+            else:
+                self._lstat = os.lstat(self.path)
+
+        return self._lstat
+
+
+def _decode_line_block(data: bytes, *, encoding: str, starts_mid_line: bool) -> list[str]:
+    """Return lines decoded from ``data`` with text-mode line endings.
+
+    - Drops the bytes before the first line ending when ``starts_mid_line`` is ``True``.
+    - Each line ends with ``"\\n"`` except a final line without a line ending.
+    """
+    start_index = 0
+
+    if starts_mid_line:
+        # Line endings are ASCII, so the cut never splits a multibyte character in an ASCII-compatible encoding.
+        first_line_ending = _LINE_ENDING_PATTERN.search(data)
+        start_index = first_line_ending.end() if first_line_ending else len(data)
+
+    parts = data[start_index:].decode(encoding).replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+
+    if parts[-1]:
+        lines.append(parts[-1])
+
+    return lines
+
+
+@contextmanager
+def _map_regular_file(text_stream: TextIO) -> Iterator[mmap.mmap | None]:
+    """Yield a read-only memory map of the file behind ``text_stream``, or ``None`` if it cannot be mapped.
+
+    - Only non-empty regular files are mapped; pipes, devices, and empty files yield ``None``.
+    - The map is closed on exit.
+    """
+    buffer = None
+
+    try:
+        file_descriptor = text_stream.fileno()
+        file_stat = os.fstat(file_descriptor)
+
+        if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size:
+            buffer = mmap.mmap(file_descriptor, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        pass  # Fall back to the text stream only.
+
+    if buffer is None:
+        yield None
+        return
+
+    with buffer:
+        yield buffer
+
+
+def _get_entry_name(path_entry: PathEntry) -> str:
+    """Return the name of ``path_entry``; used as a sort key."""
+    return path_entry.name
+
+
+def _get_traversable_directories(dir_entries: Iterable[PathEntry], *, max_depth: int) -> list[PathEntry]:
+    """Return the entries in ``dir_entries`` whose contents are within ``max_depth`` and are not symbolic links."""
+    return [path_entry for path_entry in dir_entries if path_entry.depth < max_depth and not path_entry.is_symlink()]
+
+
+def _iter_path_entries_concurrently(root: PathEntry, max_depth: int, *, sort_entries: bool, thread_count: int,
+                                    on_error: ErrorReporter | None) -> Iterator[PathEntry]:
+    """Yield entries for descendants of ``root`` while listing directories in a pool of ``thread_count`` threads.
+
+    - Keeps at most ``_LISTINGS_PER_THREAD * thread_count`` listings running or waiting for the consumer, and queues
+      more only as the consumer takes them, so memory grows with the thread count rather than the size of the tree.
+    - Yields entries in serial order when ``sort_entries`` is ``True``, listing the directories that are visited next
+      ahead of the consumer; otherwise, yields the entries of each directory as soon as it is listed.
+    - Pending listings are canceled when the consumer stops early.
+    """
+    executor = ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix="list")
+    max_listings = _LISTINGS_PER_THREAD * thread_count
+
+    try:
+        if sort_entries:
+            # Directories in reverse visiting order, each with its listing once it has been queued.
+            pending_listings: list[tuple[PathEntry, Future[_DirectoryListing] | None]] = [(root, None)]
+            queued_listing_count = 0
+
+            while pending_listings:
+                # Queue the listings of the directories visited next.
+                for index in reversed(range(max(len(pending_listings) - max_listings, 0), len(pending_listings))):
+                    if queued_listing_count >= max_listings:
+                        break
+
+                    directory, future = pending_listings[index]
+
+                    if future is None:
+                        future = executor.submit(_list_directory, directory, sort_entries=True)
+                        pending_listings[index] = (directory, future)
+                        queued_listing_count += 1
+
+                directory, future = pending_listings.pop()
+
+                try:
+                    if future is None:
+                        dir_entries, file_entries = _list_directory(directory, sort_entries=True)
+                    else:
+                        queued_listing_count -= 1
+                        dir_entries, file_entries = future.result()
+                except OSError as error:
+                    _report_listing_error(directory, error, on_error=on_error)
+                    continue
+
+                yield from dir_entries
+                yield from file_entries
+
+                # Push in reverse so that subdirectories are visited in listing order.
+                pending_listings.extend((subdirectory, None) for subdirectory in
+                                        reversed(_get_traversable_directories(dir_entries, max_depth=max_depth)))
+        else:
+            pending_directories = [root]
+            queued_listings: dict[Future[_DirectoryListing], PathEntry] = {}
+
+            while pending_directories or queued_listings:
+                while pending_directories and len(queued_listings) < max_listings:
+                    directory = pending_directories.pop()
+                    queued_listings[executor.submit(_list_directory, directory, sort_entries=False)] = directory
+
+                completed_futures, _ = wait(queued_listings, return_when=FIRST_COMPLETED)
+
+                for future in completed_futures:
+                    directory = queued_listings.pop(future)
+
+                    try:
+                        dir_entries, file_entries = future.result()
+                    except OSError as error:
+                        _report_listing_error(directory, error, on_error=on_error)
+                        continue
+
+                    pending_directories.extend(_get_traversable_directories(dir_entries, max_depth=max_depth))
+
+                    yield from dir_entries
+                    yield from file_entries
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _list_directory(directory: PathEntry, *, sort_entries: bool) -> _DirectoryListing:
+    """Return the entries of ``directory`` that are directories and the entries that are not.
+
+    - Raises ``OSError`` if ``directory`` cannot be listed.
+    """
+    dir_entries = []
+    file_entries = []
+    parent = directory.path if directory.path != os.curdir else ""
+
+    with os.scandir(directory.path) as scandir_iterator:
+        for dir_entry in scandir_iterator:
+            path_entry = PathEntry(os.path.join(parent, dir_entry.name), name=dir_entry.name, parent=parent,
+                                   depth=directory.depth + 1, dir_entry=dir_entry)
+
+            if path_entry.is_dir():
+                dir_entries.append(path_entry)
+            else:
+                file_entries.append(path_entry)
+
+    if sort_entries:
+        dir_entries.sort(key=_get_entry_name)
+        file_entries.sort(key=_get_entry_name)
+
+    return dir_entries, file_entries
+
+
+def _report_listing_error(directory: PathEntry, error: OSError, *, on_error: ErrorReporter | None) -> None:
+    """Call ``on_error(message)`` if ``directory`` could not be listed due to permissions."""
+    if on_error is not None and isinstance(error, PermissionError):
+        on_error(f"{directory.path!r}: permission denied")
 
 
 def iter_descendant_paths(root: Path, max_depth: int = sys.maxsize) -> Iterator[Path]:
@@ -28,22 +406,47 @@ def iter_descendant_paths(root: Path, max_depth: int = sys.maxsize) -> Iterator[
     - The ``root`` path itself is not yielded.
     - Subdirectories deeper than ``max_depth`` are not traversed.
     """
-    root_depth = len(root.parts)
+    for path_entry in iter_path_entries(PathEntry.from_path(os.fspath(root)), max_depth=max_depth):
+        yield Path(path_entry.path)
+
+
+def iter_path_entries(root: PathEntry, max_depth: int = sys.maxsize, *, sort_entries: bool = False,
+                      thread_count: int = 1, on_error: ErrorReporter | None = None) -> Iterator[PathEntry]:
+    """Yield entries for descendants of ``root`` whose depth is less than or equal to ``max_depth``.
+
+    - Visits paths in the same order as a top-down ``os.walk``: the subdirectories of a directory, then its other
+      entries, then the contents of each subdirectory in turn.
+    - Lists each directory with one ``os.scandir`` call; symbolic links to directories are yielded but not traversed.
+    - Sorts the subdirectories and the other entries of each directory by name when ``sort_entries`` is ``True``.
+    - Lists directories in ``thread_count`` threads when it is greater than 1; entries are then yielded as each
+      directory is listed, unless ``sort_entries`` is ``True``, which keeps the serial order.
+    - Calls ``on_error(message)`` for directories that cannot be listed due to permissions; other directories that
+      cannot be listed are skipped, as with ``os.walk``.
+    """
+    if root.depth >= max_depth:
+        return
 
-    for dir_path, dir_names, file_names in os.walk(top=root, topdown=True, followlinks=False):
-        current_path = Path(dir_path)
-        depth = len(current_path.parts) - root_depth
+    if thread_count > 1:
+        yield from _iter_path_entries_concurrently(root, max_depth, sort_entries=sort_entries,
+                                                   thread_count=thread_count, on_error=on_error)
+        return
 
-        # Prevent traversal beyond max_depth.
-        if depth >= max_depth:
-            dir_names[:] = []
+    pending_directories = [root]
+
+    while pending_directories:
+        directory = pending_directories.pop()
+
+        try:
+            dir_entries, file_entries = _list_directory(directory, sort_entries=sort_entries)
+        except OSError as error:
+            _report_listing_error(directory, error, on_error=on_error)
             continue
 
-        for name in dir_names:
-            yield current_path / name
+        yield from dir_entries
+        yield from file_entries
 
-        for name in file_names:
-            yield current_path / name
+        # Push in reverse so that subdirectories are visited in listing order.
+        pending_directories.extend(reversed(_get_traversable_directories(dir_entries, max_depth=max_depth)))
 
 
 def iter_stdin_lines() -> Iterator[str]:
@@ -51,10 +454,13 @@ def iter_stdin_lines() -> Iterator[str]:
     yield from iter_nonempty_lines(sys.stdin)
 
 
-def open_text_files(file_names: Iterable[str], *, encoding: str, on_error: ErrorReporter) -> Iterator[InputFile]:
+def open_text_files(file_names: Iterable[str], *, encoding: str, memory_map: bool = False,
+                    on_error: ErrorReporter) -> Iterator[InputFile]:
     """Yield an ``InputFile`` for each readable file in ``file_names``.
 
     - Each yielded ``InputFile.text_stream`` remains valid only until the next iteration.
+    - When ``memory_map`` is ``True``, non-empty regular files are also memory-mapped and exposed through
+      ``InputFile.mapped_lines``; other files fall back to ``text_stream`` only.
     - Calls ``on_error(message)`` for file-related errors; processing continues with the next file.
     - Reports: directory path, missing file, unknown encoding, permission denied, and other OS read errors.
     """
@@ -65,7 +471,14 @@ def open_text_files(file_names: Iterable[str], *, encoding: str, on_error: Error
                 continue
 
             with open(file_name, mode="rt", encoding=encoding) as text_stream:
-                yield InputFile(file_name, text_stream)
+                if not memory_map:
+                    yield InputFile(file_name, text_stream)
+                    continue
+
+                with _map_regular_file(text_stream) as buffer:
+                    mapped_lines = MappedLines(buffer, encoding=encoding) if buffer is not None else None
+
+                    yield InputFile(file_name, text_stream, mapped_lines)
         except FileNotFoundError:
             on_error(f"{file_name!r}: no such file or directory")
         except LookupError:
@@ -76,6 +489,86 @@ def open_text_files(file_names: Iterable[str], *, encoding: str, on_error: Error
             on_error(f"{file_name!r}: unable to read")
 
 
+def read_last_lines(binary_stream: BinaryIO, line_count: int, *, encoding: str) -> list[str]:
+    """Return the last ``line_count`` lines of a seekable binary stream by reading backward from the end in blocks.
+
+    - Lines are decoded with ``encoding``, which must be ASCII-compatible, and use text-mode line endings:
+      ``"\\r\\n"`` and ``"\\r"`` are returned as ``"\\n"``.
+    - Each line ends with ``"\\n"`` except a final line without a line ending.
+    - Memory use is proportional to the returned lines, not the stream size.
+    - Leaves the stream position unspecified.
+    """
+    if line_count <= 0:
+        return []
+
+    blocks: list[bytes] = []
+    line_ending_count = 0
+    position = binary_stream.seek(0, os.SEEK_END)
+
+    while position > 0:
+        block_size = min(_REVERSE_BLOCK_SIZE, position)
+        position -= block_size
+        binary_stream.seek(position)
+        block = binary_stream.read(block_size)
+        blocks.append(block)
+
+        # A "\r\n" pair split across blocks is counted twice; the decoded line count below is authoritative.
+        line_ending_count += block.count(b"\n") + block.count(b"\r") - block.count(b"\r\n")
+
+        # One more line ending than requested lines guarantees the first returned line is complete, even when the
+        # stream ends with a line ending.
+        if line_ending_count > line_count:
+            lines = _decode_line_block(b"".join(reversed(blocks)), encoding=encoding, starts_mid_line=position > 0)
+
+            if len(lines) >= line_count:
+                return lines[-line_count:]
+
+    return _decode_line_block(b"".join(reversed(blocks)), encoding=encoding, starts_mid_line=False)[-line_count:]
+
+
+def replace_text_file(file_name: str, *, lines: Iterable[str], encoding: str, on_error: ErrorReporter) -> None:
+    """Atomically replace the contents of a file with lines, ensuring each ends with exactly one trailing newline.
+
+    - Streams lines into a temporary file in the same directory, then renames it over the file, so the file is never
+      left partially written; symbolic links are followed.
+    - Keeps the permission bits of the file.
+    - Calls ``on_error(message)`` for file-related errors and leaves the file unchanged.
+    - Reports: unknown encoding, permission denied, encoding failures, and other OS write errors.
+    """
+    target_name = os.path.realpath(file_name)
+    temporary_name = None
+
+    try:
+        codecs.lookup(encoding)
+        file_descriptor, temporary_name = tempfile.mkstemp(dir=os.path.dirname(target_name),
+                                                           prefix=f".{os.path.basename(target_name)}.", suffix=".tmp")
+
+        with open(file_descriptor, mode="wt", encoding=encoding) as f:
+            shutil.copymode(target_name, temporary_name)
+
+            for line in lines:
+                f.write(strip_trailing_newline(line) + "\n")
+
+            # Make the contents durable before the rename makes them visible.
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temporary_name, target_name)
+        temporary_name = None
+    except LookupError:
+        on_error(f"{file_name!r}: unknown encoding {encoding!r}")
+    except PermissionError:
+        on_error(f"{file_name!r}: permission denied")
+    except UnicodeEncodeError:
+        on_error(f"{file_name!r}: unable to write with {encoding!r}")
+    except OSError:
+        on_error(f"{file_name!r}: unable to write")
+    finally:
+        if temporary_name is not None:
+            with suppress(OSError):
+                os.remove(temporary_name)
+
+
 def write_text_file(file_name: str, *, lines: Iterable[str], encoding: str, on_error: ErrorReporter) -> None:
     """Write lines to a file, ensuring each ends with exactly one trailing newline.
 
@@ -98,8 +591,13 @@ def write_text_file(file_name: str, *, lines: Iterable[str], encoding: str, on_e
 
 __all__ = (
     "InputFile",
+    "MappedLines",
+    "PathEntry",
     "iter_descendant_paths",
+    "iter_path_entries",
     "iter_stdin_lines",
     "open_text_files",
+    "read_last_lines",
+    "replace_text_file",
     "write_text_file",
 )
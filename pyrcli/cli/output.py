@@ -0,0 +1,97 @@
+"""Buffered output sink that batches lines into large writes to standard output."""
+
+import os
+import sys
+from collections.abc import Iterable
+from typing import Final, TextIO
+
+# Number of pending characters that triggers a write to the underlying stream.
+_DEFAULT_BUFFER_SIZE: Final[int] = 64 * 1024
+
+
+class OutputSink:
+    """Buffered writer that batches output lines into large writes.
+
+    - Writes to ``sys.stdout`` through its binary buffer when no stream is provided; the stream is resolved at flush
+      time so that replacing ``sys.stdout`` is observed.
+    - Writes to the provided text stream otherwise.
+    - Writes ``sys.stdout`` through its text layer on platforms whose line separator is not ``"\n"`` (Windows), so
+      that newlines are translated as with ``print()``.
+    - Flushes after every line when ``line_buffered`` is enabled.
+
+    Attributes:
+        line_buffered: Whether each line is written as soon as it is complete.
+    """
+
+    def __init__(self, *, stream: TextIO | None = None, line_buffered: bool = False,
+                 buffer_size: int = _DEFAULT_BUFFER_SIZE) -> None:
+        """Initialize a new instance."""
+        self.line_buffered: bool = line_buffered
+        self._buffer_size: Final[int] = buffer_size
+        self._pending: list[str] = []
+        self._pending_size: int = 0
+        self._stream: Final[TextIO | None] = stream
+
+    def flush(self) -> None:
+        """Write pending output to the underlying stream and flush it."""
+        if not self._pending:
+            return
+
+        # Swap the pending list before joining so that concurrent writers start a new batch.
+        pending, self._pending = self._pending, []
+        self._pending_size = 0
+        output = "".join(pending)
+        stream = self._stream or sys.stdout
+        binary_stream = getattr(stream, "buffer", None)
+
+        # The binary buffer bypasses newline translation, which only matters where the line separator is not "\n".
+        if binary_stream is None or os.linesep != "\n":
+            stream.write(output)
+            stream.flush()
+            return
+
+        # Flush text written through print() first so that output stays in order.
+        stream.flush()
+        binary_stream.write(output.encode(stream.encoding, stream.errors))
+        binary_stream.flush()
+
+    def write(self, text: str) -> None:
+        """Write ``text`` without a trailing newline; flushes only when the pending output exceeds the buffer size."""
+        self._pending.append(text)
+        self._pending_size += len(text)
+
+        if self._pending_size >= self._buffer_size:
+            self.flush()
+
+    def write_line(self, line: str = "") -> None:
+        """Write ``line`` followed by a newline."""
+        self._pending.append(line)
+        self._pending.append("\n")
+        self._pending_size += len(line) + 1
+
+        if self.line_buffered or self._pending_size >= self._buffer_size:
+            self.flush()
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        """Write each line in ``lines`` followed by a newline."""
+        if self.line_buffered:
+            for line in lines:
+                self.write_line(line)
+
+            return
+
+        # Bind locals to avoid attribute lookups in the loop.
+        append = self._pending.append
+        buffer_size = self._buffer_size
+
+        for line in lines:
+            append(line)
+            append("\n")
+            self._pending_size += len(line) + 1
+
+            if self._pending_size >= buffer_size:
+                self.flush()
+                append = self._pending.append
+
+
+__all__ = ("OutputSink",)
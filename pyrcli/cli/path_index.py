@@ -0,0 +1,373 @@
+"""Persistent index of the paths under directory trees, stored in an SQLite database."""
+
+import os
+import sqlite3
+import sys
+from collections.abc import Collection, Iterable, Iterator
+from pathlib import Path
+from typing import Final, Self
+
+from .io import PathEntry, iter_path_entries
+from .types import ErrorReporter
+
+# Version of the database schema; databases with another version are not opened as indexes.
+_SCHEMA_VERSION: Final[int] = 2
+
+# Minimum literal length for name lookups through the trigram table.
+_TRIGRAM_LENGTH: Final[int] = 3
+
+# Size recorded for directories that could not be listed, so that they are never reported as empty.
+_UNKNOWN_SIZE: Final[int] = -1
+
+# Modification time recorded for directories that could not be listed, so that every update lists them again.
+_UNLISTED_MTIME_NS: Final[int] = -1
+
+# Tables and indexes of an empty index; roots are absolute paths, directories are stored once with their path relative
+# to the root, and entries store only their name, so paths are front-coded by directory.
+_SCHEMA: Final[str] = """
+CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE directories (
+    id INTEGER PRIMARY KEY,
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    UNIQUE (root, path)
+);
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    directory_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    is_dir INTEGER NOT NULL,
+    is_link INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL
+);
+CREATE INDEX entries_by_directory ON entries (directory_id);
+"""
+
+# FTS5 trigram table over entry names, kept in sync by triggers; created only when SQLite is built with FTS5.
+_TRIGRAM_SCHEMA: Final[str] = """
+CREATE VIRTUAL TABLE names USING fts5 (name, content='entries', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER entries_inserted AFTER INSERT ON entries BEGIN
+    INSERT INTO names (rowid, name) VALUES (new.id, new.name);
+END;
+CREATE TRIGGER entries_deleted AFTER DELETE ON entries BEGIN
+    INSERT INTO names (names, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+"""
+
+
+class IndexedPath:
+    """Path read from a ``PathIndex``, with the file type, size, and modification time recorded when it was indexed.
+
+    - Provides the subset of the ``PathEntry`` interface used for filtering: ``depth``, ``name``, ``parent``,
+      ``path``, ``get_mtime()``, ``is_dir()``, and ``is_empty()``.
+
+    Attributes:
+        depth: Depth relative to the indexed starting point; its children have depth 1.
+        name: Final path component.
+        parent: Path of the containing directory; empty when the path has a single component.
+        path: Normalized path.
+    """
+
+    __slots__ = ("_is_dir", "_mtime", "_size", "depth", "name", "parent", "path")
+
+    def __init__(self, *, name: str, parent: str, depth: int, is_dir: bool, size: int, mtime: float) -> None:
+        """Initialize a new instance."""
+        self._is_dir: Final[bool] = is_dir
+        self._mtime: Final[float] = mtime
+        self._size: Final[int] = size
+        self.depth: Final[int] = depth
+        self.name: Final[str] = name
+        self.parent: Final[str] = parent
+        self.path: Final[str] = os.path.join(parent, name)
+
+    def get_mtime(self) -> float:
+        """Return the modification time recorded when the path was indexed."""
+        return self._mtime
+
+    def is_dir(self) -> bool:
+        """Return ``True`` if the path was a directory or a symbolic link to one when it was indexed."""
+        return self._is_dir
+
+    def is_empty(self) -> bool:
+        """Return ``True`` if the path was a directory without entries or a file of size zero when it was indexed.
+
+        - Returns ``False`` for directories that could not be listed.
+        """
+        return not self._size
+
+
+class PathIndex:
+    """On-disk index of the paths under one or more starting directories.
+
+    - Records the name, file type, size, and modification time of every path, like a traversal with ``lstat()``.
+    - ``update()`` re-lists only directories whose modification time changed since the previous update; the sizes
+      and modification times of files in unchanged directories are not refreshed.
+    - Keys starting directories by absolute path, so that a query from another working directory finds a root only
+      through a path to the same directory; paths are yielded relative to the root as given to the query.
+    - Literal name patterns are looked up through a trigram index when SQLite provides FTS5.
+    - Creates the index only in a database without tables, so other databases are never modified.
+    - Raises ``sqlite3.DatabaseError`` if ``file_name`` is not an index of the current schema version, or if it has no
+      tables and ``read_only`` is ``True``.
+    """
+
+    def __init__(self, file_name: str, *, read_only: bool = False) -> None:
+        """Open the index in ``file_name``, creating it if it does not exist and ``read_only`` is ``False``."""
+        database = f"{Path(file_name).absolute().as_uri()}?mode=ro" if read_only else file_name
+        self._connection: Final[sqlite3.Connection] = sqlite3.connect(database, uri=read_only)
+
+        try:
+            if not read_only and not self._has_tables():
+                self._create_schema()
+            elif self._get_schema_version() != _SCHEMA_VERSION:
+                raise sqlite3.DatabaseError(f"{file_name!r}: not a path index")
+
+            self.uses_trigrams: Final[bool] = self._has_table("names")
+        except BaseException:
+            self._connection.close()
+            raise
+
+    def __enter__(self) -> Self:
+        """Return this index."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close this index."""
+        self.close()
+
+    def _create_schema(self) -> None:
+        """Create the tables of an empty index."""
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+            try:
+                self._connection.executescript(_TRIGRAM_SCHEMA)
+            except sqlite3.OperationalError:  # SQLite was built without FTS5.
+                pass
+
+            self._connection.execute("INSERT INTO metadata (key, value) VALUES ('version', ?)", (str(_SCHEMA_VERSION),))
+
+    def _get_schema_version(self) -> int | None:
+        """Return the schema version of the database, or ``None`` if it is not an index."""
+        if not self._has_table("metadata"):
+            return None
+
+        row = self._connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+
+        return int(row[0]) if row else None
+
+    def _get_subdirectories(self, directory: PathEntry, directory_id: int) -> list[tuple[PathEntry, int]]:
+        """Return the indexed subdirectories of ``directory`` that are not symbolic links, with their entry IDs."""
+        parent = directory.path if directory.path != os.curdir else ""
+        query = "SELECT id, name FROM entries WHERE directory_id = ? AND is_dir AND NOT is_link ORDER BY id DESC"
+
+        return [(PathEntry(os.path.join(parent, name), name=name, parent=parent, depth=directory.depth + 1), entry_id)
+                for entry_id, name in self._connection.execute(query, (directory_id,))]
+
+    def _has_table(self, table: str) -> bool:
+        """Return ``True`` if the database has a table named ``table``."""
+        query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+
+        return self._connection.execute(query, (table,)).fetchone() is not None
+
+    def _has_tables(self) -> bool:
+        """Return ``True`` if the database has any tables."""
+        return self._connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table'").fetchone() is not None
+
+    def _insert_entries(self, directory_id: int, path_entries: Collection[PathEntry]) -> None:
+        """Insert rows for ``path_entries`` in the directory with ``directory_id``, skipping paths that vanished."""
+        rows = []
+
+        for path_entry in path_entries:
+            try:
+                is_dir = path_entry.is_dir()
+                is_link = path_entry.is_symlink()
+                file_stat = path_entry.lstat()
+
+                # Directories that are traversed record their entry count when they are listed.
+                size = int(not path_entry.is_empty()) if is_dir and is_link else file_stat.st_size
+            except OSError:
+                continue
+
+            rows.append((directory_id, path_entry.name, is_dir, is_link, size, file_stat.st_mtime))
+
+        self._connection.executemany("INSERT INTO entries (directory_id, name, is_dir, is_link, size, mtime) "
+                                     "VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def close(self) -> None:
+        """Close the database; the index cannot be used afterward."""
+        self._connection.close()
+
+    def get_roots(self) -> list[str]:
+        """Return the absolute paths of the indexed starting directories in sorted order."""
+        query = "SELECT DISTINCT root FROM directories ORDER BY root"
+
+        return [root for (root,) in self._connection.execute(query)]
+
+    def iter_paths(self, root: str, max_depth: int = sys.maxsize, *, indexed_root: str | None = None,
+                   name_literals: Collection[str] = (), is_dir: bool | None = None, empty_only: bool = False,
+                   min_mtime: float | None = None, max_mtime: float | None = None) -> Iterator[IndexedPath]:
+        """Yield indexed paths under ``root`` whose depth is less than or equal to ``max_depth``.
+
+        - Reads ``root`` from the index of ``indexed_root``, an indexed starting directory that contains it; defaults to
+          the absolute path of ``root``.
+        - Joins each path to ``root`` as given, like a traversal from ``root``.
+        - Yields only paths whose names contain every string in ``name_literals``, ignoring case; callers must still
+          match names exactly.
+        - Yields only directories or only other paths when ``is_dir`` is ``True`` or ``False``, only empty paths when
+          ``empty_only`` is ``True``, and only paths modified within ``min_mtime`` and ``max_mtime``.
+        - Orders paths by directory path, then directories before other paths, then by name.
+        """
+        absolute_root = os.path.abspath(root)
+        indexed_root = indexed_root or absolute_root
+
+        # Directories of a subdirectory of the indexed root are stored under its path relative to the indexed root.
+        prefix = os.path.relpath(absolute_root, indexed_root) if absolute_root != indexed_root else ""
+        prefix_depth = prefix.count(os.sep) + 1 if prefix else 0
+        conditions = ["d.root = ?", "d.depth - ? < ?"]
+        parameters: list[object] = [indexed_root, prefix_depth, max_depth]
+
+        if prefix:
+            conditions.append("(d.path = ? OR substr(d.path, 1, ?) = ?)")
+            parameters.extend((prefix, len(prefix) + 1, prefix + os.sep))
+        source = "entries AS e"
+        trigram_literals = [literal for literal in name_literals if len(literal) >= _TRIGRAM_LENGTH]
+
+        # Start from the names that contain every literal rather than from every entry under the root.
+        if self.uses_trigrams and trigram_literals:
+            source = "names CROSS JOIN entries AS e ON e.id = names.rowid"
+            conditions.append("names MATCH ?")
+            parameters.append(" AND ".join('name:"{}"'.format(literal.replace('"', '""'))
+                                           for literal in trigram_literals))
+
+        if is_dir is not None:
+            conditions.append("e.is_dir = ?")
+            parameters.append(is_dir)
+
+        if empty_only:
+            conditions.append("e.size = 0")
+
+        if min_mtime is not None:
+            conditions.append("e.mtime > ?")
+            parameters.append(min_mtime)
+
+        if max_mtime is not None:
+            conditions.append("e.mtime < ?")
+            parameters.append(max_mtime)
+
+        query = (f"SELECT d.path, d.depth, e.name, e.is_dir, e.size, e.mtime FROM {source} "
+                 "JOIN directories AS d ON d.id = e.directory_id "
+                 f"WHERE {' AND '.join(conditions)} ORDER BY d.path, e.is_dir DESC, e.name")
+
+        # Paths in the current directory have a single component, as in a traversal.
+        root_path = PathEntry.from_path(root).path
+        root_path = root_path if root_path != os.curdir else ""
+
+        for directory_path, directory_depth, name, entry_is_dir, size, mtime in self._connection.execute(query,
+                                                                                                         parameters):
+            directory_path = directory_path[len(prefix) + 1:] if prefix else directory_path
+            parent = os.path.join(root_path, directory_path) if directory_path else root_path
+            yield IndexedPath(name=name, parent=parent, depth=directory_depth + 1 - prefix_depth,
+                              is_dir=bool(entry_is_dir), size=size, mtime=mtime)
+
+    def update(self, root: str, *, on_error: ErrorReporter | None = None) -> None:
+        """Index the directory tree under ``root``, re-listing only directories whose modification time changed.
+
+        - Records ``root`` by its absolute path, and directories by their path relative to ``root``; empty for ``root``.
+        - Directories that no longer exist are removed from the index with everything under them.
+        - Calls ``on_error(message)`` for directories that cannot be listed due to permissions; their size is
+          recorded as unknown, so they are never reported as empty, and they are listed again by every update.
+        """
+        root_entry = PathEntry.from_path(root)
+        absolute_root = os.path.abspath(root)
+        indexed_directories = {path: (directory_id, mtime_ns) for directory_id, path, mtime_ns in
+                               self._connection.execute("SELECT id, path, mtime_ns FROM directories WHERE root = ?",
+                                                        (absolute_root,))}
+        pending_directories: list[tuple[PathEntry, int | None]] = [(root_entry, None)]
+        visited_directory_ids = set()
+        listing_failed = False
+
+        def report_listing_error(message: str) -> None:
+            """Record that the current directory could not be listed and forward ``message`` to ``on_error``."""
+            nonlocal listing_failed
+
+            listing_failed = True
+
+            if on_error is not None:
+                on_error(message)
+
+        with self._connection:
+            while pending_directories:
+                directory, entry_id = pending_directories.pop()
+
+                try:
+                    mtime_ns = os.stat(directory.path).st_mtime_ns
+                except OSError:
+                    continue
+
+                relative_path = os.path.relpath(directory.path, root_entry.path) if directory.depth else ""
+                directory_id, indexed_mtime_ns = indexed_directories.get(relative_path, (None, None))
+
+                listing_failed = False
+
+                # Re-list the directory only if its listing may have changed.
+                if directory_id is None or indexed_mtime_ns != mtime_ns:
+                    path_entries = list(iter_path_entries(directory, max_depth=directory.depth + 1,
+                                                          on_error=report_listing_error))
+
+                    if listing_failed:
+                        mtime_ns = _UNLISTED_MTIME_NS
+
+                    if directory_id is None:
+                        directory_id = self._connection.execute(
+                            "INSERT INTO directories (root, path, depth, mtime_ns) VALUES (?, ?, ?, ?)",
+                            (absolute_root, relative_path, directory.depth, mtime_ns)).lastrowid
+                    else:
+                        self._connection.execute("UPDATE directories SET mtime_ns = ? WHERE id = ?",
+                                                 (mtime_ns, directory_id))
+                        self._connection.execute("DELETE FROM entries WHERE directory_id = ?", (directory_id,))
+
+                    self._insert_entries(directory_id, path_entries)
+
+                # Record the entry count in the directory's own entry so that empty directories can be found; the
+                # entry is new whenever its parent was re-listed.
+                if entry_id is not None and listing_failed:
+                    self._connection.execute("UPDATE entries SET size = ? WHERE id = ?", (_UNKNOWN_SIZE, entry_id))
+                elif entry_id is not None:
+                    self._connection.execute(
+                        "UPDATE entries SET size = (SELECT COUNT(*) FROM entries WHERE directory_id = ?) WHERE id = ?",
+                        (directory_id, entry_id))
+
+                visited_directory_ids.add(directory_id)
+                pending_directories.extend(self._get_subdirectories(directory, directory_id))
+
+            # Remove directories that were deleted or can no longer be reached.
+            for directory_id, _ in indexed_directories.values():
+                if directory_id not in visited_directory_ids:
+                    self._connection.execute("DELETE FROM entries WHERE directory_id = ?", (directory_id,))
+                    self._connection.execute("DELETE FROM directories WHERE id = ?", (directory_id,))
+
+
+def find_indexed_root(directory: str, roots: Iterable[str]) -> str | None:
+    """Return the indexed starting directory in ``roots`` nearest to ``directory`` that contains it, or ``None``.
+
+    - Compares absolute paths without resolving symbolic links, as ``PathIndex`` keys its starting directories.
+    """
+    absolute_directory = os.path.abspath(directory)
+    nearest_root = None
+
+    for root in roots:
+        if absolute_directory == root or absolute_directory.startswith(os.path.join(root, "")):
+            if nearest_root is None or len(root) > len(nearest_root):
+                nearest_root = root
+
+    return nearest_root
+
+
+__all__ = (
+    "IndexedPath",
+    "PathIndex",
+    "find_indexed_root",
+)
@@ -1,19 +1,276 @@
 """Utilities for compiling and matching regular expression patterns in text."""
 
+import itertools
 import re
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Final
 
 from .types import CompiledPatterns, ErrorReporter
 
+# Numbered group references and conditionals; a key that uses them cannot be renumbered inside a combined pattern.
+_NUMBERED_GROUP_REFERENCE: Final[re.Pattern[str]] = re.compile(r"\\[1-9]|\(\?\(\d")
 
-def compile_or_pattern(patterns: Iterable[re.Pattern[str]], *, ignore_case: bool) -> re.Pattern[str]:
+# Characters with special meaning in regular expressions; patterns without them match literally.
+_REGEX_METACHARACTERS: Final[frozenset[str]] = frozenset(".^$*+?{}[]\\|()")
+
+#: Trie of literal characters; each key is the next character and leaves are empty.
+type _TrieNode = dict[str, _TrieNode]
+
+#: Function that returns the replacement text for a match, as accepted by ``re.Pattern.sub()``.
+type _Replacer = Callable[[re.Match[str]], str]
+
+# Minimum number of literals for compile_or_pattern() to build a trie-shaped expression instead of an alternation.
+_TRIE_MIN_LITERALS: Final[int] = 16
+
+
+class LiteralPattern:
+    """Pattern without regular expression metacharacters that is ruled out with ``str`` substring tests.
+
+    - Provides the subset of the ``re.Pattern`` interface used with compiled patterns: ``flags``, ``pattern``,
+      ``finditer()``, ``search()``, and ``sub()``; ``contains()`` tests for a match without building one.
+    - ``search()`` returns ``None`` without running the regular expression when the literal does not occur in the text,
+      and returns the same match as ``re.Pattern.search()`` otherwise.
+    - Case-insensitive substring tests are used only when the literal and the text are ASCII; other text is searched
+      with the regular expression so that matching follows ``re.IGNORECASE`` exactly.
+    """
+
+    __slots__ = ("_folded_literal", "_ignore_case", "_regex", "flags", "pattern")
+
+    def __init__(self, literal: str, *, ignore_case: bool) -> None:
+        """Initialize a new instance."""
+        self._regex: re.Pattern[str] = re.compile(literal, flags=re.IGNORECASE if ignore_case else re.NOFLAG)
+        self._folded_literal: str | None = literal.lower() if ignore_case and literal.isascii() else None
+        self._ignore_case: bool = ignore_case
+        self.flags: int = self._regex.flags
+        self.pattern: str = literal
+
+    def __repr__(self) -> str:
+        """Return a representation that shows the literal and whether case is ignored."""
+        return f"LiteralPattern({self.pattern!r}, ignore_case={self._ignore_case})"
+
+    def contains(self, text: str) -> bool:
+        """Return ``True`` if the literal occurs in ``text``, running the regular expression only when it must."""
+        if not self._ignore_case:
+            return self.pattern in text
+
+        if self._folded_literal is not None and text.isascii():
+            return self._folded_literal in text.lower()
+
+        return self._regex.search(text) is not None
+
+    def finditer(self, text: str) -> Iterator[re.Match[str]]:
+        """Return an iterator over all non-overlapping matches in ``text``."""
+        return self._regex.finditer(text)
+
+    def search(self, text: str) -> re.Match[str] | None:
+        """Return the first match in ``text``, or ``None`` if there is no match."""
+        if not self._ignore_case:
+            if self.pattern not in text:
+                return None
+        elif self._folded_literal is not None and text.isascii():
+            if self._folded_literal not in text.lower():
+                return None
+
+        return self._regex.search(text)
+
+    def sub(self, repl: str, string: str, count: int = 0) -> str:
+        """Return ``string`` with matches replaced by ``repl``, as ``re.Pattern.sub()`` does."""
+        if not self._ignore_case and self.pattern not in string:
+            return string
+
+        return self._regex.sub(repl, string, count=count)
+
+
+class PatternAlternation:
+    """Alternation of separately compiled patterns, for patterns that cannot be combined into one expression.
+
+    - Provides the subset of the ``re.Pattern`` interface used with mapping patterns: ``finditer()``, ``search()``, and
+      ``sub()``.
+    - Matches as ``|`` does: the leftmost match wins, and the first pattern wins among matches at the same position.
+    - Each pattern keeps its own group numbers and names, so backreferences within a pattern refer to its own groups.
+    """
+
+    __slots__ = ("patterns",)
+
+    def __init__(self, patterns: Sequence[re.Pattern[str]]) -> None:
+        """Initialize a new instance."""
+        self.patterns: tuple[re.Pattern[str], ...] = tuple(patterns)
+
+    def __repr__(self) -> str:
+        """Return a representation that shows the patterns."""
+        return f"PatternAlternation({list(self.patterns)!r})"
+
+    def finditer(self, text: str) -> Iterator[re.Match[str]]:
+        """Return an iterator over all non-overlapping matches in ``text``.
+
+        - After an empty match, the next match is not another empty match at the same position, as with
+          ``re.Pattern.finditer()``.
+        """
+        next_matches = [pattern.search(text) for pattern in self.patterns]
+
+        while (match := min(filter(None, next_matches), key=re.Match.start, default=None)) is not None:
+            yield match
+            position = match.end()
+            is_empty = match.start() == position
+
+            # Search again only for patterns whose next match overlaps this one, or is an empty match at its end.
+            for index, (pattern, next_match) in enumerate(zip(self.patterns, next_matches)):
+                if next_match is None or next_match.start() > position:
+                    continue
+
+                if next_match.start() < position:
+                    next_matches[index] = pattern.search(text, position)
+                elif is_empty and next_match.end() == position:
+                    # As with re, a pattern may still match non-empty text here; finditer() skips only the empty match.
+                    pattern_matches = pattern.finditer(text, position)
+                    next(pattern_matches)
+                    next_matches[index] = next(pattern_matches, None)
+
+    def search(self, text: str) -> re.Match[str] | None:
+        """Return the first match in ``text``, or ``None`` if there is no match."""
+        return next(self.finditer(text), None)
+
+    def sub(self, repl: str | _Replacer, string: str, count: int = 0) -> str:
+        """Return ``string`` with matches replaced by ``repl``, as ``re.Pattern.sub()`` does."""
+        pieces = []
+        position = 0
+
+        for match in itertools.islice(self.finditer(string), count or None):
+            pieces.append(string[position:match.start()])
+            pieces.append(repl(match) if callable(repl) else match.expand(repl))
+            position = match.end()
+
+        pieces.append(string[position:])
+        return "".join(pieces)
+
+
+def _build_trie_branch_source(node: _TrieNode) -> str:
+    """Return a regular expression source for the branches below ``node``; leaves produce an empty source."""
+    branches = [re.escape(character) + _build_trie_branch_source(child) for character, child in sorted(node.items())]
+
+    if len(branches) > 1:
+        return f"(?:{'|'.join(branches)})"
+
+    return branches[0] if branches else ""
+
+
+def _build_trie_source(literals: Iterable[str]) -> str:
+    """Return a regular expression source that matches any of ``literals`` by sharing common prefixes.
+
+    - ``literals`` must be non-empty and prefix-free, so that every literal ends at a leaf and at most one literal can
+      match at any position.
+    """
+    trie: _TrieNode = {}
+
+    for literal in literals:
+        node = trie
+
+        for character in literal:
+            node = node.setdefault(character, {})
+
+    return _build_trie_branch_source(trie)
+
+
+def _is_prefix_free(literals: Iterable[str]) -> bool:
+    """Return ``True`` if no literal in ``literals`` is a prefix of another."""
+    sorted_literals = sorted(literals)
+
+    return not any(following.startswith(literal) for literal, following in zip(sorted_literals, sorted_literals[1:]))
+
+
+def compile_mapping_pattern(replacements: Mapping[str, str], *, ignore_case: bool,
+                            on_error: ErrorReporter) -> tuple[re.Pattern[str] | PatternAlternation, _Replacer] | None:
+    """Return a pattern that matches any key of ``replacements`` and a function that returns each match's replacement.
+
+    - Pass both to ``re.Pattern.sub()`` to replace every key in a single pass over the text.
+    - When every key is literal, combines them with ``compile_or_pattern()`` and looks replacements up by the matched
+      text (lowercased if ``ignore_case``; only for ASCII keys).
+    - Otherwise, wraps each key in a capturing group and looks replacements up by the index of the group that matched.
+    - Returns a ``PatternAlternation`` of the separately compiled keys instead when a key refers to its own groups by
+      number, or when the keys cannot be combined into one valid expression.
+    - When several keys match at the same position, the first key in ``replacements`` wins, as with alternation.
+    - Replacements are inserted literally; backslashes and group references are not expanded.
+    - Skips empty keys and calls ``on_error(message)`` for invalid keys; returns ``None`` when no key remains.
+    """
+    flags = re.IGNORECASE if ignore_case else re.NOFLAG
+    keyed_patterns = [(pattern, replacements[key]) for key in replacements for pattern in
+                      compile_patterns([key], ignore_case=ignore_case, on_error=on_error)]
+
+    if not keyed_patterns:
+        return None
+
+    if all(isinstance(pattern, LiteralPattern) and (not ignore_case or pattern.pattern.isascii()) for pattern, _ in
+           keyed_patterns):
+        literal_replacements: dict[str, str] = {}
+
+        # Keep the first replacement for keys that are equal when case is ignored.
+        for pattern, replacement in keyed_patterns:
+            literal_replacements.setdefault(pattern.pattern.lower() if ignore_case else pattern.pattern, replacement)
+
+        pattern = compile_or_pattern([pattern for pattern, _ in keyed_patterns], ignore_case=ignore_case)
+
+        if not ignore_case:
+            return pattern, lambda match: literal_replacements[match.group()]
+
+        def replace_ignoring_case(match: re.Match[str]) -> str:
+            """Return the replacement for the key that ``match`` matched without regard to case."""
+            matched_text = match.group()
+
+            if (replacement := literal_replacements.get(matched_text.lower())) is not None:
+                return replacement
+
+            # A few non-ASCII characters, such as "\u017f", match ASCII letters but do not lowercase to them.
+            return next(replacement for key, replacement in literal_replacements.items() if
+                        re.fullmatch(re.escape(key), matched_text, flags=flags))
+
+        return pattern, replace_ignoring_case
+
+    compiled_keys = [re.compile(pattern.pattern, flags=flags) for pattern, _ in keyed_patterns]
+
+    # A key that refers to its own groups by number would refer to another key's groups once wrapped and combined.
+    if not any(key.groups and _NUMBERED_GROUP_REFERENCE.search(key.pattern) for key in compiled_keys):
+        # The group that wraps a key closes after any groups in the key, so it is the last group that matched.
+        group_replacements: dict[int, str] = {}
+        sources = []
+        group_index = 1
+
+        for key, (_, replacement) in zip(compiled_keys, keyed_patterns):
+            group_replacements[group_index] = replacement
+            group_index += 1 + key.groups
+            sources.append(f"({key.pattern})")
+
+        # Keys that compile alone can still conflict, such as by reusing a group name or setting global inline flags.
+        try:
+            return re.compile("|".join(sources), flags=flags), lambda match: group_replacements[match.lastindex]
+        except re.error:
+            pass
+
+    key_replacements = {key: replacement for key, (_, replacement) in zip(compiled_keys, keyed_patterns)}
+
+    return PatternAlternation(compiled_keys), lambda match: key_replacements[match.re]
+
+
+def compile_or_pattern(patterns: Iterable[re.Pattern[str] | LiteralPattern], *, ignore_case: bool) -> re.Pattern[str]:
     """Return a compiled pattern that matches any of the provided patterns.
 
     - Wraps each pattern as a non-capturing group before combining.
+    - Combines 16 or more ``LiteralPattern`` objects into a trie-shaped expression that matches the same text as the
+      alternation, when no literal is a prefix of another (after lowercasing ASCII literals if ``ignore_case``).
     - Case-insensitive when ``ignore_case`` is ``True``.
     - Raises ``re.error`` if combining the validated patterns produces an invalid composite expression.
     """
     flags = re.IGNORECASE if ignore_case else re.NOFLAG
+    patterns = list(patterns)
+
+    if len(patterns) >= _TRIE_MIN_LITERALS and all(isinstance(pattern, LiteralPattern) for pattern in patterns):
+        literals = {pattern.pattern for pattern in patterns}
+
+        if ignore_case:
+            literals = {literal.lower() for literal in literals} if all(map(str.isascii, literals)) else set()
+
+        if literals and _is_prefix_free(literals):
+            return re.compile(_build_trie_source(literals), flags=flags)
+
     sources = [f"(?:{pattern.pattern})" for pattern in patterns]
 
     return re.compile("|".join(sources), flags=flags)
@@ -25,15 +282,20 @@ def compile_patterns(patterns: Iterable[str], *, ignore_case: bool, on_error: Er
     - Skips empty pattern strings.
     - Case-insensitive when ``ignore_case`` is ``True``.
     - Calls ``on_error(message)`` for invalid patterns and continues.
+    - Returns ``LiteralPattern`` objects for patterns without regular expression metacharacters.
     - Returns only successfully compiled patterns.
     """
-    compiled: list[re.Pattern[str]] = []
+    compiled: list[re.Pattern[str] | LiteralPattern] = []
     flags = re.IGNORECASE if ignore_case else re.NOFLAG
 
     for pattern in patterns:
         if not pattern:
             continue
 
+        if _REGEX_METACHARACTERS.isdisjoint(pattern):
+            compiled.append(LiteralPattern(pattern, ignore_case=ignore_case))
+            continue
+
         try:
             compiled.append(re.compile(pattern, flags=flags))
         except re.error:  # re.PatternError was introduced in Python 3.13; use re.error for Python < 3.13.
@@ -42,12 +304,24 @@ def compile_patterns(patterns: Iterable[str], *, ignore_case: bool, on_error: Er
     return compiled
 
 
-def matches_all_patterns(text: str, *, compiled_patterns: Iterable[re.Pattern[str]]) -> bool:
+def matches_all_patterns(text: str, *, compiled_patterns: Iterable[re.Pattern[str] | LiteralPattern]) -> bool:
     """Return ``True`` if ``text`` matches all patterns."""
-    return all(pattern.search(text) for pattern in compiled_patterns)
+    # A plain loop avoids the generator overhead of all(), which dominates for short lines.
+    for pattern in compiled_patterns:
+        # Literal patterns need only a substring test; a match object is never used.
+        if isinstance(pattern, LiteralPattern):
+            if not pattern.contains(text):
+                return False
+        elif not pattern.search(text):
+            return False
+
+    return True
 
 
 __all__ = (
+    "LiteralPattern",
+    "PatternAlternation",
+    "compile_mapping_pattern",
     "compile_or_pattern",
     "compile_patterns",
     "matches_all_patterns",
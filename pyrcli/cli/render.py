@@ -1,15 +1,13 @@
 """Utilities for styling text with ANSI escape sequences."""
 
-import re
-from collections.abc import Collection
-
 from .ansi import RESET, TextAttributes
+from .types import CompiledPatterns
 
 #: Start and end character position pair representing a match range.
 type _MatchRange = tuple[int, int]
 
 
-def _collect_merged_match_ranges(text: str, *, patterns: Collection[re.Pattern[str]]) -> list[_MatchRange]:
+def _collect_merged_match_ranges(text: str, *, patterns: CompiledPatterns) -> list[_MatchRange]:
     """Return merged non-overlapping match ranges for all patterns within ``text``."""
     ranges: list[_MatchRange] = []
 
@@ -49,7 +47,7 @@ def style(text: str, *, ansi_style: str) -> str:
     return f"{ansi_style}{text}{RESET}"
 
 
-def style_matches(text: str, *, patterns: Collection[re.Pattern[str]], ansi_style: str) -> str:
+def style_matches(text: str, *, patterns: CompiledPatterns, ansi_style: str) -> str:
     """Return ``text`` with pattern matches styled using ``ansi_style``.
 
     - Overlapping matches are merged before styling.
@@ -1,12 +1,439 @@
 """Utilities for parsing, splitting, and normalizing text."""
 
 import csv
+import itertools
 import re
 import shlex
-from collections.abc import Iterable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from typing import Final
 
 from .types import ErrorReporter
 
+# Characters that csv.reader treats specially with the default dialect; they cannot be delimiters, and text without
+# them splits like str.split().
+_CSV_SPECIAL_CHARACTERS: Final[frozenset[str]] = frozenset('"\n\r')
+
+# Estimated number of characters csv.reader reads in the time taken to skip one quote while finding the end of a field
+# in quoted CSV text; scanning pays off only when it spares csv.reader more characters than this per quote.
+_CSV_SCAN_CHARACTERS_PER_QUOTE: Final[int] = 32
+
+# A POSIX shell word as shlex reads it: runs of unquoted characters, quoted strings, and escaped characters. Unquoted
+# "#" starts a comment. Possessive quantifiers keep matching linear.
+_SHELL_WORD_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"""(?:[^ \t\r\n'"\\#]++|'[^']*+'|"(?:[^"\\]|\\.)*+"|\\.)++""", flags=re.DOTALL)
+_LITERAL_QUOTES_SHELL_WORD_PATTERN: Final[re.Pattern[str]] = re.compile(r"(?:[^ \t\r\n\\#]++|\\.)++", flags=re.DOTALL)
+
+# Text that splits into shell words without shlex: words separated by shlex whitespace, then an optional comment.
+_SHELL_LINE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    rf"[ \t\r\n]*+(?:(?:{_SHELL_WORD_PATTERN.pattern})[ \t\r\n]*+)*+(?P<comment>#.*)?", flags=re.DOTALL)
+_LITERAL_QUOTES_SHELL_LINE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    rf"[ \t\r\n]*+(?:(?:{_LITERAL_QUOTES_SHELL_WORD_PATTERN.pattern})[ \t\r\n]*+)*+(?P<comment>#.*)?", flags=re.DOTALL)
+
+# Quoted and escaped segments of a shell word; inside double quotes, a backslash escapes only a backslash or a quote.
+_SHELL_SEGMENT_PATTERN: Final[re.Pattern[str]] = re.compile(r"""'([^']*)'|"((?:[^"\\]|\\.)*)"|\\(.)""", flags=re.DOTALL)
+_SHELL_DOUBLE_QUOTED_ESCAPE_PATTERN: Final[re.Pattern[str]] = re.compile(r'\\([\\"])')
+_SHELL_ESCAPE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\\(.)", flags=re.DOTALL)
+
+
+class Splitter:
+    """Splitter of text into fields, with its mode and settings validated and compiled once for many lines.
+
+    - ``"csv"``: Splits with CSV rules when ``separator``, after decoding escape sequences, is one character other than
+      a quote or a newline; otherwise splits with ``str.split(separator)``.
+    - ``"regex"``: Splits with ``re.split()`` using ``pattern``; case-insensitive when ``ignore_case`` is ``True``.
+    - ``"shell"``: Splits into POSIX shell tokens; quotes are ordinary characters when ``literal_quotes`` is ``True``.
+    - Drops empty fields when ``drop_empty`` is ``True``, so field numbering counts only non-empty fields.
+    - Returns at most the first ``max_fields`` fields when ``max_fields`` is set; text after the last of them is not
+      tokenized, and is scanned only as far as needed to find the end of a quoted CSV field or an unmatched shell quote.
+    - Raises ``ValueError`` when constructed with an invalid mode, separator, pattern, or field limit; the message is
+      suitable for reporting to the user.
+    - ``split_stream()`` reads CSV records, so quoted fields may contain line breaks; other methods split each line on
+      its own.
+
+    Attributes:
+        mode: Splitting mode: ``"csv"``, ``"regex"``, or ``"shell"``.
+    """
+
+    __slots__ = ("_csv_delimiter", "_csv_line_queue", "_csv_line_reader", "_drop_empty", "_literal_quotes",
+                 "_max_fields", "_pattern", "_separator", "_split", "_split_all", "_split_prefix", "mode")
+
+    def __init__(self, mode: str, *, separator: str = " ", pattern: str = r"\s+", ignore_case: bool = False,
+                 literal_quotes: bool = False, drop_empty: bool = False, max_fields: int | None = None) -> None:
+        """Initialize a new instance."""
+        self._csv_delimiter: str = ""
+        self._csv_line_queue: deque[str] = deque()
+        self._csv_line_reader: Iterator[list[str]] = iter(())
+        self._drop_empty: bool = drop_empty
+        self._literal_quotes: bool = literal_quotes
+        self._max_fields: int | None = max_fields
+        self._pattern: re.Pattern[str] | None = None
+        self._separator: str = separator
+        self._split: Callable[[str], list[str]]
+        self._split_all: Callable[[str], list[str]]
+        self._split_prefix: Callable[[str, int], tuple[list[str], bool]]
+        self.mode: str = mode
+
+        match mode:
+            case "csv":
+                try:
+                    self._csv_delimiter = decode_python_escape_sequences(separator)
+                except ValueError:  # UnicodeDecodeError is a subclass of ValueError.
+                    pass
+
+                if not self._csv_delimiter:
+                    raise ValueError(f"invalid separator: {separator!r}")
+
+                if len(self._csv_delimiter) == 1 and self._csv_delimiter not in _CSV_SPECIAL_CHARACTERS:
+                    self._split_all = self._split_csv
+                    self._split_prefix = self._split_csv_prefix
+
+                    # Reads lines queued by _read_csv_line(); one reader is much faster than a new reader per line.
+                    self._csv_line_reader = csv.reader(iter(self._csv_line_queue.popleft, None),
+                                                       delimiter=self._csv_delimiter)
+                else:
+                    self._split_all = self._split_separator
+                    self._split_prefix = self._split_separator_prefix
+            case "regex":
+                try:
+                    self._pattern = re.compile(pattern, flags=re.IGNORECASE if ignore_case else re.NOFLAG)
+                except re.error:  # re.PatternError was introduced in Python 3.13; use re.error for Python < 3.13.
+                    raise ValueError(f"invalid pattern: {pattern!r}") from None
+
+                self._split_all = self._pattern.split
+                self._split_prefix = self._split_pattern_prefix
+            case "shell":
+                self._split_all = self._split_shell_tokens
+                self._split_prefix = self._split_shell_tokens_prefix
+            case _:
+                raise ValueError(f"invalid mode: {mode!r}")
+
+        if max_fields is not None:
+            if max_fields < 1:
+                raise ValueError(f"invalid field limit: {max_fields!r}")
+
+            self._split = self._split_limited
+        elif drop_empty:
+            self._split = self._split_nonempty
+        else:
+            self._split = self._split_all
+
+    def _find_csv_field_end(self, text: str, field_count: int, *, check_rest: bool = False) -> tuple[int, bool]:
+        """Return where CSV field ``field_count`` of ``text`` ends, and whether ``text`` ends inside a quoted field.
+
+        - The end is the index of the delimiter after the field, or ``len(text)`` when no field follows it.
+        - Stops scanning at the end unless ``check_rest`` is ``True``; otherwise ``text`` is reported to end inside a
+          quoted field only if that field opens before the end.
+        - Examines only delimiters and quotes with ``str`` methods; no field is tokenized.
+        """
+        delimiter = self._csv_delimiter
+        quoted_field_start = delimiter + '"'
+        end = -1
+        position = 0
+        remaining = field_count
+
+        if text.startswith('"'):
+            opening = 0
+        elif (opening := text.find(quoted_field_start)) >= 0:
+            opening += 1  # Point at the quote rather than at the delimiter before it.
+
+        while True:
+            if end < 0:
+                stretch_end = len(text) if opening < 0 else opening
+
+                # Outside quoted fields, every delimiter ends a field.
+                delimiter_count = text.count(delimiter, position, stretch_end)
+
+                if delimiter_count >= remaining:
+                    # Find the delimiter from whichever end of the stretch is closer, creating the fewest strings.
+                    if remaining <= delimiter_count // 2:
+                        end = stretch_end - len(text[position:stretch_end].split(delimiter, remaining)[-1]) - 1
+                    else:
+                        end = position + len(text[position:stretch_end].rsplit(delimiter,
+                                                                               delimiter_count - remaining + 1)[0])
+
+                    if not check_rest:
+                        return end, False
+                else:
+                    remaining -= delimiter_count
+
+            if opening < 0:
+                return (len(text) if end < 0 else end), False
+
+            # Skip the quoted field; a doubled quote is an escaped quote inside it.
+            closing = text.find('"', opening + 1)
+
+            while closing >= 0 and text.startswith('"', closing + 1):
+                closing = text.find('"', closing + 2)
+
+            if closing < 0:
+                return (len(text) if end < 0 else end), True
+
+            position = closing + 1
+
+            if (opening := text.find(quoted_field_start, position)) >= 0:
+                opening += 1
+
+    def _is_worth_scanning_csv(self, text: str, field_count: int) -> bool:
+        """Return whether scanning quoted ``text`` for the end of CSV field ``field_count`` likely beats reading it."""
+        # Estimate the characters after the field from the share of fields that are not needed.
+        skipped_length = len(text) * (1 - field_count / (text.count(self._csv_delimiter) + 1))
+        return skipped_length >= text.count('"') * _CSV_SCAN_CHARACTERS_PER_QUOTE
+
+    def _iter_limited_csv_records(self, stream: Iterable[str]) -> Iterator[list[str]]:
+        """Yield the limited fields of each CSV record in ``stream``, reading a record whole when that is cheaper."""
+        lines = iter(stream)
+        queued_lines: deque[str] = deque()
+        records = _iter_csv_records(_iter_queued_then_rest(queued_lines, lines), delimiter=self._csv_delimiter)
+
+        for line in lines:
+            text = strip_trailing_newline(line)
+
+            if "\r" not in text:
+                if '"' not in text:
+                    yield self._split(text)
+                    continue
+
+                if self._is_worth_scanning_csv(text, self._max_fields):
+                    end, ends_in_quoted_field = self._find_csv_field_end(text, self._max_fields, check_rest=True)
+
+                    if not ends_in_quoted_field:
+                        fields, has_more = self._split_csv_before(text, end)
+                        fields = self._limit_fields(fields)
+
+                        # Dropped empty fields may have shifted the numbering past the end.
+                        yield fields if len(fields) == self._max_fields or not has_more else self._split(text)
+                        continue
+
+            # Read the whole record, including any lines that a quoted field continues onto.
+            queued_lines.append(line)
+            yield self._limit_fields(next(records))
+
+    def _limit_fields(self, fields: list[str]) -> list[str]:
+        """Return ``fields`` with empty fields dropped when configured, and at most ``max_fields`` of them."""
+        if self._drop_empty:
+            fields = [field for field in fields if field]
+
+        return fields[:self._max_fields]
+
+    def _read_csv_line(self, text: str) -> list[str]:
+        """Return the fields of ``text``, which must be one line that does not end inside a quoted field."""
+        self._csv_line_queue.append(text)
+        return next(self._csv_line_reader)
+
+    def _split_csv(self, text: str) -> list[str]:
+        """Return fields split from ``text`` with CSV rules."""
+        if not text:
+            return []  # Matches csv.reader, which yields no fields for an empty line.
+
+        # Most lines have no quotes; str.split() is much faster than constructing a csv.reader.
+        if '"' not in text and "\n" not in text and "\r" not in text:
+            return text.split(self._csv_delimiter)
+
+        return next(csv.reader((text,), delimiter=self._csv_delimiter))
+
+    def _split_csv_before(self, text: str, end: int) -> tuple[list[str], bool]:
+        """Return the CSV fields of ``text`` before the delimiter at ``end``, and whether ``text`` has more fields."""
+        if end == len(text):
+            return self._split_csv(text), False
+
+        # Keep the delimiter, so the last field is read even when it is empty; drop the empty field after it.
+        prefix = text[:end + 1]
+        fields = self._read_csv_line(prefix) if '"' in prefix else prefix.split(self._csv_delimiter)
+        return fields[:-1], True
+
+    def _split_csv_prefix(self, text: str, field_count: int) -> tuple[list[str], bool]:
+        """Return the first ``field_count`` CSV fields of ``text``, and whether ``text`` has more fields."""
+        if '"' not in text and "\n" not in text and "\r" not in text:
+            if not text:
+                return [], False
+
+            fields = text.split(self._csv_delimiter, field_count)
+
+            if len(fields) > field_count:
+                return fields[:field_count], True
+
+            return fields, False
+
+        if "\n" in text or "\r" in text or not self._is_worth_scanning_csv(text, field_count):
+            return self._split_csv(text), False
+
+        return self._split_csv_before(text, self._find_csv_field_end(text, field_count)[0])
+
+    def _split_limited(self, text: str) -> list[str]:
+        """Return the first ``max_fields`` fields of ``text``, splitting no further than needed."""
+        field_count = self._max_fields
+
+        while True:
+            fields, has_more = self._split_prefix(text, field_count)
+
+            if self._drop_empty:
+                fields = [field for field in fields if field]
+
+            if len(fields) >= self._max_fields or not has_more:
+                return fields[:self._max_fields]
+
+            # Dropped empty fields shifted the numbering; split further into the text.
+            field_count *= 2
+
+    def _split_nonempty(self, text: str) -> list[str]:
+        """Return the non-empty fields split from ``text``."""
+        return [field for field in self._split_all(text) if field]
+
+    def _split_pattern_prefix(self, text: str, field_count: int) -> tuple[list[str], bool]:
+        """Return at least the first ``field_count`` fields of ``text`` split with the pattern, and whether it has more.
+
+        - Groups in the pattern add their matches as fields, so more than ``field_count`` fields may be returned.
+        """
+        fields = self._pattern.split(text, maxsplit=field_count)
+
+        # After field_count splits, the last item is the unsplit rest of the text.
+        if len(fields) == field_count * (self._pattern.groups + 1) + 1:
+            return fields[:-1], True
+
+        return fields, False
+
+    def _split_separator(self, text: str) -> list[str]:
+        """Return fields split from ``text`` at each occurrence of the separator."""
+        return text.split(self._separator)
+
+    def _split_separator_prefix(self, text: str, field_count: int) -> tuple[list[str], bool]:
+        """Return the first ``field_count`` fields of ``text`` split at the separator, and whether it has more."""
+        fields = text.split(self._separator, field_count)
+
+        if len(fields) > field_count:
+            return fields[:field_count], True
+
+        return fields, False
+
+    def _split_shell_tokens(self, text: str) -> list[str]:
+        """Return POSIX shell tokens split from ``text``."""
+        return split_shell_tokens(text, literal_quotes=self._literal_quotes)
+
+    def _split_shell_tokens_prefix(self, text: str, field_count: int) -> tuple[list[str], bool]:
+        """Return the first ``field_count`` POSIX shell tokens of ``text``, and whether it has more."""
+        if (words := _iter_shell_words(text, literal_quotes=self._literal_quotes)) is None:
+            return self._split_shell_tokens(text), False
+
+        fields = list(itertools.islice(words, field_count + 1))
+        return fields[:field_count], len(fields) > field_count
+
+    def split(self, text: str) -> list[str]:
+        """Return the fields split from ``text``."""
+        return self._split(text)
+
+    def split_lines(self, lines: Iterable[str]) -> Iterator[list[str]]:
+        """Yield the fields split from each of ``lines``, which should already be normalized."""
+        return map(self._split, lines)
+
+    def split_stream(self, stream: Iterable[str]) -> Iterator[list[str]]:
+        """Yield the fields of each record in ``stream``, such as an open text file.
+
+        - In CSV mode with a CSV delimiter, a quoted field that spans lines is read as one field of one record; a quoted
+          field still open at the end of ``stream`` ends without its trailing newline.
+        - Otherwise, each line is a record; trailing newlines are removed before splitting.
+        - Raises ``csv.Error`` for CSV input that cannot be read, such as a field over ``csv.field_size_limit()``.
+        """
+        if self._split_all == self._split_csv:
+            if self._max_fields is not None:
+                return self._iter_limited_csv_records(stream)
+
+            records = _iter_csv_records(stream, delimiter=self._csv_delimiter)
+            return map(self._limit_fields, records) if self._drop_empty else records
+
+        return map(self._split, iter_normalized_lines(stream))
+
+
+def _decode_literal_quotes_shell_word(match: re.Match[str]) -> str:
+    """Return the token for a POSIX shell word matched by ``_LITERAL_QUOTES_SHELL_WORD_PATTERN``."""
+    return _SHELL_ESCAPE_PATTERN.sub(r"\1", match.group())
+
+
+def _decode_shell_segment(match: re.Match[str]) -> str:
+    """Return the text that a quoted or escaped segment of a POSIX shell word stands for."""
+    single_quoted, double_quoted, escaped = match.groups()
+
+    if single_quoted is not None:
+        return single_quoted
+
+    if double_quoted is not None:
+        return _SHELL_DOUBLE_QUOTED_ESCAPE_PATTERN.sub(r"\1", double_quoted)
+
+    return escaped
+
+
+def _decode_shell_word(match: re.Match[str]) -> str:
+    """Return the token for a POSIX shell word matched by ``_SHELL_WORD_PATTERN``."""
+    return _SHELL_SEGMENT_PATTERN.sub(_decode_shell_segment, match.group())
+
+
+def _iter_csv_records(lines: Iterable[str], *, delimiter: str) -> Iterator[list[str]]:
+    """Yield the fields of each CSV record in ``lines``, removing one trailing newline from a field left open at the end.
+
+    - Without the newline, a quote left open on the last line reads the same as when each line is split separately.
+    """
+    at_end = False
+
+    def iter_lines() -> Iterator[str]:
+        """Yield each line in ``lines``, then record that the end was reached."""
+        nonlocal at_end
+
+        yield from lines
+        at_end = True
+
+    for fields in csv.reader(iter_lines(), delimiter=delimiter):
+        # The reader reads past the last line while building a record only when a quoted field is still open.
+        if at_end and fields:
+            fields[-1] = strip_trailing_newline(fields[-1])
+
+        yield fields
+
+
+def _iter_queued_then_rest(queued_lines: deque[str], lines: Iterator[str]) -> Iterator[str]:
+    """Yield each line queued in ``queued_lines`` when it is queued, and otherwise the next line in ``lines``."""
+    while True:
+        while queued_lines:
+            yield queued_lines.popleft()
+
+        if (line := next(lines, None)) is None:
+            return
+
+        yield line
+
+
+def _iter_shell_words(text: str, *, literal_quotes: bool) -> Iterator[str] | None:
+    """Return an iterator over the POSIX shell tokens of ``text``, or ``None`` when only ``shlex`` can split it.
+
+    - Handles whitespace, single and double quotes, backslash escapes, and a comment that ends the text, producing the
+      tokens that ``shlex`` produces with whitespace splitting; quotes are ordinary characters when ``literal_quotes``
+      is ``True``.
+    - Returns ``None`` for an unmatched quote, a trailing backslash, or a comment followed by another line.
+    - Checks the whole text with one regular expression, but decodes tokens only as they are consumed.
+    """
+    if literal_quotes:
+        line_pattern, word_pattern = _LITERAL_QUOTES_SHELL_LINE_PATTERN, _LITERAL_QUOTES_SHELL_WORD_PATTERN
+        decode_word = _decode_literal_quotes_shell_word
+        has_special_characters = "\\" in text
+    else:
+        line_pattern, word_pattern = _SHELL_LINE_PATTERN, _SHELL_WORD_PATTERN
+        decode_word = _decode_shell_word
+        has_special_characters = "\\" in text or '"' in text or "'" in text
+
+    if (match := line_pattern.fullmatch(text)) is None:
+        return None
+
+    end = len(text)
+
+    if (comment_start := match.start("comment")) >= 0:
+        # shlex skips a comment only to the end of its line.
+        if "\n" in text[comment_start:]:
+            return None
+
+        end = comment_start
+
+    words = word_pattern.finditer(text, 0, end)
+    return map(decode_word, words) if has_special_characters else map(re.Match.group, words)
+
 
 def decode_python_escape_sequences(line: str) -> str:
     """Decode Python-style backslash escape sequences in ``line``."""
@@ -31,41 +458,40 @@ def split_csv(text: str, *, separator: str = " ", on_error: ErrorReporter) -> li
 
     - Falls back to ``str.split(separator)`` when ``separator`` is not eligible for CSV parsing.
     - Falls back to ``str.split()`` and calls ``on_error(message)`` when ``separator`` is invalid.
+    - Validates ``separator`` on every call; construct a ``Splitter`` to split many lines.
     """
     try:
-        decoded_separator = decode_python_escape_sequences(separator)
-
-        # Empty decoded separator is invalid; raise to unify with UnicodeDecodeError and csv.Error handling.
-        if not decoded_separator:
-            raise ValueError()
-
-        # CSV requires a single non-quote, non-newline delimiter.
-        if len(decoded_separator) == 1 and decoded_separator not in ('"', "\n", "\r"):
-            return next(csv.reader([text], delimiter=decoded_separator))
-    except (UnicodeDecodeError, ValueError, csv.Error):
+        return Splitter("csv", separator=separator).split(text)
+    except (ValueError, csv.Error):
         on_error(f"invalid separator: {separator!r}")
         return text.split()
 
-    return text.split(separator)
-
 
 def split_pattern(text: str, *, pattern: str, ignore_case: bool = False, on_error: ErrorReporter) -> list[str]:
     """Split ``text`` using a regular expression.
 
     - Falls back to ``str.split()`` if the pattern is invalid.
+    - Validates ``pattern`` on every call; construct a ``Splitter`` to split many lines.
     """
-    flags = re.IGNORECASE if ignore_case else re.NOFLAG
-
     try:
-        return re.split(pattern=pattern, string=text, flags=flags)
-    except re.error:  # re.PatternError was introduced in Python 3.13; use re.error for Python < 3.13.
-        on_error(f"invalid pattern: {pattern!r}")
+        splitter = Splitter("regex", pattern=pattern, ignore_case=ignore_case)
+    except ValueError as error:
+        on_error(str(error))
+        return text.split()
 
-    return text.split()
+    return splitter.split(text)
 
 
 def split_shell_tokens(text: str, *, literal_quotes: bool = False) -> list[str]:
-    """Return tokens parsed from ``text`` using POSIX shell rules."""
+    """Return tokens parsed from ``text`` using POSIX shell rules.
+
+    - Produces the tokens of ``shlex.shlex(text, posix=True)`` with whitespace splitting; common text is split with
+      regular expressions, and ``shlex`` is used only for text they do not handle.
+    - Falls back to a single field for an unmatched quote or a trailing backslash.
+    """
+    if (words := _iter_shell_words(text, literal_quotes=literal_quotes)) is not None:
+        return list(words)
+
     lexer = shlex.shlex(text, posix=True, punctuation_chars=False)
 
     lexer.whitespace_split = True  # Prevents punctuation-based tokenization.
@@ -86,6 +512,7 @@ def strip_trailing_newline(line: str) -> str:
 
 
 __all__ = (
+    "Splitter",
     "decode_python_escape_sequences",
     "iter_nonempty_lines",
     "iter_normalized_lines",
@@ -2,16 +2,68 @@
 
 import io
 import os
+import pickle
 import sys
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Iterable
-from typing import final, override
+from concurrent.futures import ProcessPoolExecutor
+from typing import Final, NamedTuple, final, override
 
 from .ansi import RESET
 from .cli_program import CLIProgram
 from .io import InputFile, iter_stdin_lines, open_text_files
+from .output import OutputSink
+from .platform import IS_WINDOWS
 from .terminal import stdin_is_redirected
 
+# Number of files sent to a worker process at a time; amortizes inter-process overhead for small files.
+_PARALLEL_CHUNK_SIZE: Final[int] = 8
+
+# Pickled program that each worker process copies for every file; set by _initialize_worker().
+_initial_program_data: bytes = b""
+
+
+class _WorkerResult(NamedTuple):
+    """Output, deferred errors, and exported state from processing one file in a worker process."""
+    output: str
+    error_messages: list[str]
+    processed_files: list[str]
+    state: object
+    system_exit: SystemExit | None
+
+
+def _initialize_worker(program_data: bytes) -> None:
+    """Store the pickled program for ``_process_file_in_worker()``."""
+    global _initial_program_data
+
+    _initial_program_data = program_data
+
+
+def _process_file_in_worker(file_name: str) -> _WorkerResult:
+    """Process ``file_name`` with a fresh copy of the program and return its captured output and state.
+
+    - Each file gets its own copy of the program in its initial state, so exported state covers only that file.
+    """
+    program = pickle.loads(_initial_program_data)
+    stream = io.StringIO()
+
+    processed_files = []
+    system_exit = None
+
+    program.out = OutputSink(stream=stream)
+    program._deferred_error_messages = []
+
+    # Return SystemExit (for example, from an early exit on a match) so that it is raised in input order.
+    try:
+        processed_files = program._process_input_files_serially([file_name])
+    except SystemExit as error:
+        system_exit = error
+
+    program.out.flush()
+
+    return _WorkerResult(stream.getvalue(), program._deferred_error_messages, processed_files,
+                         program.export_worker_state(), system_exit)
+
 
 class TextProgram(CLIProgram, ABC):
     """Base class for command-line programs that process text files and streams.
@@ -25,6 +77,13 @@ class TextProgram(CLIProgram, ABC):
         super().__init__(name=name, error_exit_code=error_exit_code)
 
         self.encoding: str = "utf-8"
+        self._worker_program_data: bytes = b""  # Pickled copy of the program in its initial state; see execute().
+
+    def _get_parallel_jobs(self) -> int:
+        """Return the number of worker processes for input files, or 1 to process them in the main process."""
+        jobs = getattr(self.args, "jobs", 1)
+
+        return jobs if jobs > 1 and self.supports_parallel_processing() else 1
 
     def _invoke_redirected_input(self) -> None:
         """Invoke ``handle_redirected_input()`` when redirected standard input contains data."""
@@ -41,11 +100,58 @@ class TextProgram(CLIProgram, ABC):
     def _process_input_files(self, file_names: Iterable[str]) -> list[str]:
         """Process files and return the names of those successfully processed.
 
+        - Processes files in ``--jobs`` worker processes when ``--jobs`` is greater than 1 and the command supports
+          parallel processing; otherwise processes them one after another.
+        """
+        jobs = self._get_parallel_jobs()
+
+        if jobs > 1:
+            return self._process_input_files_in_parallel(file_names, jobs=jobs)
+
+        return self._process_input_files_serially(file_names)
+
+    def _process_input_files_in_parallel(self, file_names: Iterable[str], *, jobs: int) -> list[str]:
+        """Process files in ``jobs`` worker processes and return the names of those successfully processed.
+
+        - Writes each file's output and reports its errors via print_error() in input order, as if the files were
+          processed one after another; a ``SystemExit`` raised for a file is re-raised after the preceding files.
+        - Combines per-file state with ``merge_worker_state()``.
+        """
+        processed_files = []
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_initialize_worker,
+                                 initargs=(self._worker_program_data,)) as executor:
+            for result in executor.map(_process_file_in_worker, file_names, chunksize=_PARALLEL_CHUNK_SIZE):
+                # Flush each file's output before its errors so that stdout and stderr stay interleaved in input order.
+                self.out.write(result.output)
+                self.out.flush()
+
+                for error_message in result.error_messages:
+                    self.print_error(error_message)
+
+                self.merge_worker_state(result.state)
+                processed_files.extend(result.processed_files)
+
+                if result.system_exit is not None:
+                    executor.shutdown(cancel_futures=True)
+                    raise result.system_exit
+
+        return processed_files
+
+    def _process_input_files_serially(self, file_names: Iterable[str]) -> list[str]:
+        """Process files one after another and return the names of those successfully processed.
+
         - Skips unreadable files and reports errors via print_error().
+        - Memory-maps regular files when the command supports memory mapping, so that ``process_input_file()`` can
+          use ``InputFile.mapped_lines``; pipes and standard input use the text stream only.
         """
         processed_files = []
 
-        for input_file in open_text_files(file_names, encoding=self.encoding, on_error=self.print_error):
+        # Windows cannot truncate or replace a mapped file, which would break commands that rewrite their input.
+        memory_map = self.supports_memory_mapping() and not IS_WINDOWS
+
+        for input_file in open_text_files(file_names, encoding=self.encoding, memory_map=memory_map,
+                                          on_error=self.print_error):
             try:
                 self.process_input_file(input_file)
                 processed_files.append(input_file.file_name)
@@ -79,10 +185,15 @@ class TextProgram(CLIProgram, ABC):
         """Route input using the configured handlers.
 
         - Handles redirected standard input, file arguments, or terminal input.
+        - Processes input files in worker processes when ``--jobs`` is greater than 1 and the command supports it.
         - Always calls ``post_execute()`` after processing completes.
         """
         processed_files = []
 
+        # Copy the program before any input is processed so that worker processes start from its initial state.
+        if self._get_parallel_jobs() > 1:
+            self._worker_program_data = pickle.dumps(self)
+
         if stdin_is_redirected():
             processed_files.extend(self._process_redirected_input())
         elif self.args.files:
@@ -92,6 +203,13 @@ class TextProgram(CLIProgram, ABC):
 
         self.post_execute(processed_files)
 
+    def export_worker_state(self) -> object:
+        """Return state accumulated while processing one file in a worker process, for ``merge_worker_state()``.
+
+        - Must be picklable; returns ``None`` by default.
+        """
+        return None
+
     @final
     def format_file_header(self, file_name: str, *, file_name_style: str, colon_style: str) -> str:
         """Return a styled ``file_name:`` header, or ``"(standard input):"`` when the file name is empty."""
@@ -127,6 +245,10 @@ class TextProgram(CLIProgram, ABC):
 
         self.encoding = "iso-8859-1" if self.args.latin1 else "utf-8"
 
+    def merge_worker_state(self, state: object) -> None:
+        """Combine ``state`` returned by ``export_worker_state()`` in a worker process into this program."""
+        pass  # Optional hook; no action by default.
+
     def post_execute(self, processed_files: Collection[str]) -> None:
         """Run post-execution logic after all input processing completes."""
         pass  # Optional hook; no action by default.
@@ -141,5 +263,23 @@ class TextProgram(CLIProgram, ABC):
         """Return ``True`` if file headers should be printed."""
         return not getattr(self.args, "no_file_name", False)
 
+    def supports_memory_mapping(self) -> bool:
+        """Return ``True`` if ``process_input_file()`` reads regular files through ``InputFile.mapped_lines``.
+
+        - Regular files are then memory-mapped in addition to being opened as text streams, except on Windows.
+        - Returns ``False`` by default.
+        """
+        return False
+
+    def supports_parallel_processing(self) -> bool:
+        """Return ``True`` if ``process_input_file()`` can run in worker processes for ``--jobs``.
+
+        - ``process_input_file()`` must only write output through ``out`` and report errors via print_error().
+        - State that spans files must be exported with ``export_worker_state()`` and combined with
+          ``merge_worker_state()``.
+        - Returns ``False`` by default.
+        """
+        return False
+
 
 __all__ = ("TextProgram",)
@@ -2,9 +2,13 @@
 
 import re
 from collections.abc import Callable, Collection
+from typing import TYPE_CHECKING
 
-#: Sequence of compiled regular expression patterns.
-type CompiledPatterns = Collection[re.Pattern[str]]
+if TYPE_CHECKING:
+    from .patterns import LiteralPattern  # patterns imports this module; the alias below is evaluated lazily.
+
+#: Collection of compiled regular expression or literal patterns.
+type CompiledPatterns = Collection[re.Pattern[str] | LiteralPattern]
 
 #: Callback for reporting error messages.
 type ErrorReporter = Callable[[str], None]
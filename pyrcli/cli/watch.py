@@ -0,0 +1,247 @@
+"""Wait for changes to files using inotify on Linux, falling back to stat polling elsewhere."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Final, Self
+
+from .platform import IS_LINUX
+
+# Default interval in seconds between stat polls when inotify is unavailable.
+_DEFAULT_POLLING_INTERVAL: Final[float] = 0.5
+
+# inotify flags and event masks from <sys/inotify.h>.
+_IN_ATTRIB: Final[int] = 0x00000004
+_IN_CLOEXEC: Final[int] = 0o2000000
+_IN_CLOSE_WRITE: Final[int] = 0x00000008
+_IN_CREATE: Final[int] = 0x00000100
+_IN_DELETE: Final[int] = 0x00000200
+_IN_IGNORED: Final[int] = 0x00008000
+_IN_MODIFY: Final[int] = 0x00000002
+_IN_MOVED_FROM: Final[int] = 0x00000040
+_IN_MOVED_TO: Final[int] = 0x00000080
+_IN_NONBLOCK: Final[int] = 0o4000
+_IN_Q_OVERFLOW: Final[int] = 0x00004000
+
+# Directory events that can change the content or identity of a file in the directory.
+_DIRECTORY_MASK: Final[int] = (_IN_ATTRIB | _IN_CLOSE_WRITE | _IN_CREATE | _IN_DELETE | _IN_MODIFY | _IN_MOVED_FROM |
+                               _IN_MOVED_TO)
+
+# Header of struct inotify_event: int wd, uint32_t mask, uint32_t cookie, uint32_t len.
+_EVENT_HEADER: Final[struct.Struct] = struct.Struct("iIII")
+
+# Size of each read from the inotify file descriptor; large enough for many events at once.
+_EVENT_BUFFER_SIZE: Final[int] = 64 * 1024
+
+
+def _load_inotify() -> ctypes.CDLL | None:
+    """Return the C library if it provides inotify, or ``None``."""
+    if not IS_LINUX:
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+    except OSError:
+        return None
+
+    if not all(hasattr(libc, name) for name in ("inotify_add_watch", "inotify_init1")):
+        return None
+
+    return libc
+
+
+def _stat_signature(file_name: str) -> tuple[int, int, int, int] | None:
+    """Return the identity, size, and modification time of ``file_name``, or ``None`` if it cannot be read."""
+    try:
+        file_stat = os.stat(file_name)
+    except OSError:
+        return None
+
+    return file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns
+
+
+class FileWatcher:
+    """Single-threaded watcher that blocks until any of a set of files changes.
+
+    - Uses one inotify watch per parent directory on Linux, so files that are created, replaced, or renamed are
+      reported as well as files that are written; symbolic links are watched in their own directory and in the
+      directory of their target.
+    - Compares ``os.stat()`` results every ``polling_interval`` seconds: as the only check when inotify is unavailable,
+      and alongside inotify for changes that produce no events, such as writes on network file systems.
+    - May report files that did not change (for example, after an event queue overflow); callers must tolerate this.
+
+    Attributes:
+        polling_interval: Seconds between stat polls.
+        uses_inotify: Whether changes are detected with inotify.
+    """
+
+    def __init__(self, *, polling_interval: float = _DEFAULT_POLLING_INTERVAL, use_inotify: bool = True) -> None:
+        """Initialize a new instance."""
+        self.polling_interval: Final[float] = polling_interval
+        self._directory_watches: dict[str, int] = {}
+        self._file_names: set[str] = set()
+        self._inotify_fd: int = -1
+        self._libc: ctypes.CDLL | None = _load_inotify() if use_inotify else None
+        self._next_poll_time: float = 0.0
+        self._signatures: dict[str, tuple[int, int, int, int] | None] = {}
+        self._watched_names: dict[tuple[int, bytes], set[str]] = {}
+
+        if self._libc is not None:
+            self._inotify_fd = self._libc.inotify_init1(_IN_CLOEXEC | _IN_NONBLOCK)
+
+        self.uses_inotify: Final[bool] = self._inotify_fd >= 0
+
+    def __enter__(self) -> Self:
+        """Return this watcher."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close this watcher."""
+        self.close()
+
+    def _add_directory_watch(self, directory: str) -> int:
+        """Return the inotify watch descriptor for ``directory``, adding a watch if it has none.
+
+        - Raises ``OSError`` if ``directory`` cannot be watched.
+        """
+        watch_descriptor = self._directory_watches.get(directory)
+
+        if watch_descriptor is None:
+            watch_descriptor = self._libc.inotify_add_watch(self._inotify_fd, os.fsencode(directory), _DIRECTORY_MASK)
+
+            if watch_descriptor < 0:
+                error_number = ctypes.get_errno()
+                raise OSError(error_number, os.strerror(error_number), directory)
+
+            self._directory_watches[directory] = watch_descriptor
+
+        return watch_descriptor
+
+    def _get_directory_file_names(self, watch_descriptor: int) -> set[str]:
+        """Return the watched file names in the directory watched by ``watch_descriptor``."""
+        directory_file_names = set()
+
+        for (descriptor, _), file_names in self._watched_names.items():
+            if descriptor == watch_descriptor:
+                directory_file_names.update(file_names)
+
+        return directory_file_names
+
+    def _poll_changes(self) -> set[str]:
+        """Return the watched file names whose stat signature changed since the previous poll."""
+        changed = set()
+
+        for file_name in self._file_names:
+            signature = _stat_signature(file_name)
+
+            if signature != self._signatures.get(file_name):
+                self._signatures[file_name] = signature
+                changed.add(file_name)
+
+        return changed
+
+    def _read_events(self) -> set[str]:
+        """Read pending inotify events and return the watched file names they affect."""
+        try:
+            data = os.read(self._inotify_fd, _EVENT_BUFFER_SIZE)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+
+        while offset < len(data):
+            watch_descriptor, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            # Events were dropped, or a watched directory is gone: report every file that may be affected.
+            if mask & _IN_Q_OVERFLOW:
+                return set(self._file_names)
+
+            if mask & _IN_IGNORED:
+                changed.update(self._get_directory_file_names(watch_descriptor))
+                continue
+
+            changed.update(self._watched_names.get((watch_descriptor, name), ()))
+
+        return changed
+
+    def add(self, file_name: str) -> None:
+        """Start watching ``file_name``.
+
+        - Raises ``OSError`` if the parent directory of ``file_name`` cannot be watched.
+        """
+        if file_name in self._file_names:
+            return
+
+        if self.uses_inotify:
+            absolute_path = os.path.abspath(file_name)
+            watch_descriptor = self._add_directory_watch(os.path.dirname(absolute_path))
+            self._watched_names.setdefault((watch_descriptor, os.fsencode(os.path.basename(absolute_path))),
+                                           set()).add(file_name)
+
+            # Writes to the target of a symbolic link produce events only in the target's directory.
+            if (real_path := os.path.realpath(file_name)) != absolute_path:
+                try:
+                    watch_descriptor = self._add_directory_watch(os.path.dirname(real_path))
+                except OSError:  # Stat polling still detects changes to the target.
+                    pass
+                else:
+                    self._watched_names.setdefault((watch_descriptor, os.fsencode(os.path.basename(real_path))),
+                                                   set()).add(file_name)
+
+        self._signatures[file_name] = _stat_signature(file_name)
+        self._file_names.add(file_name)
+
+    def close(self) -> None:
+        """Release the inotify file descriptor; the watcher cannot be used afterward."""
+        if self._inotify_fd >= 0:
+            os.close(self._inotify_fd)
+            self._inotify_fd = -1
+
+    def remove(self, file_name: str) -> None:
+        """Stop watching ``file_name``; directory watches are kept until ``close()``."""
+        self._file_names.discard(file_name)
+        self._signatures.pop(file_name, None)
+
+        for file_names in self._watched_names.values():
+            file_names.discard(file_name)
+
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """Block until at least one watched file changes and return the changed file names.
+
+        - Returns an empty set if ``timeout`` seconds elapse first; waits indefinitely when ``timeout`` is ``None``.
+        - Never blocks for longer than ``polling_interval`` at a time, so that stat polling runs even without events.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            interval = self.polling_interval if remaining is None else min(self.polling_interval, remaining)
+
+            if self.uses_inotify:
+                readable, _, _ = select.select([self._inotify_fd], [], [], interval)
+                changed = self._read_events() if readable else set()
+
+                # Files reported by events are not reported again by the next poll.
+                for file_name in changed:
+                    self._signatures[file_name] = _stat_signature(file_name)
+
+                # Poll at most once per interval, however often events arrive.
+                if time.monotonic() >= self._next_poll_time:
+                    self._next_poll_time = time.monotonic() + self.polling_interval
+                    changed |= self._poll_changes()
+            else:
+                time.sleep(interval)
+                changed = self._poll_changes()
+
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+
+__all__ = ("FileWatcher",)
@@ -1,13 +1,21 @@
 """Implements a program that filters duplicate or unique lines from files."""
 
 import argparse
+import hashlib
+import io
 import sys
-from collections.abc import Collection, Iterable
-from typing import Final, NoReturn, override
+import tempfile
+from array import array
+from collections.abc import Collection, Iterable, Iterator
+from typing import Final, NoReturn, TextIO, override
 
 from pyrcli.cli import TextProgram, text
 from pyrcli.cli.ansi import ForegroundColors, RESET
 from pyrcli.cli.io import InputFile
+from pyrcli.cli.text import Splitter
+
+# Size in bytes of the comparison key digests used by --digest.
+_DIGEST_SIZE: Final[int] = 8
 
 #: Group of lines sharing the same comparison key.
 type _LineGroups = list[str]
@@ -21,12 +29,19 @@ class _Styles:
 
 
 class Dupe(TextProgram):
-    """Command implementation for filtering duplicate or unique lines from files."""
+    """
+    Command implementation for filtering duplicate or unique lines from files.
+
+    Attributes:
+        field_splitter: Splitter compiled from ``--field-separator`` for ``--skip-fields``.
+    """
 
     def __init__(self) -> None:
         """Initialize a new instance."""
         super().__init__(name="dupe")
 
+        self.field_splitter: Splitter = Splitter("csv")
+
     @override
     def build_arguments(self) -> argparse.ArgumentParser:
         """Return an argument parser describing the command-line interface."""
@@ -47,6 +62,8 @@ class Dupe(TextProgram):
         parser.add_argument("-H", "--no-file-name", action="store_true", help="suppress file name prefixes")
         parser.add_argument("-a", "--adjacent", action="store_true",
                             help="compare adjacent lines only (do not search entire file)")
+        parser.add_argument("--digest", action="store_true",
+                            help="compare 64-bit digests of lines to bound memory on large inputs (reads input twice)")
         parser.add_argument("-i", "--ignore-case", action="store_true", help="ignore case when comparing")
         parser.add_argument("--ignore-blank", action="store_true", help="ignore blank lines")
         parser.add_argument("-f", "--skip-fields", help="skip the first N non-empty fields when comparing (N >= 1)",
@@ -74,6 +91,36 @@ class Dupe(TextProgram):
         if self.args.field_separator is not None and self.args.skip_fields is None:
             self.print_error_and_exit("--field-separator requires --skip-fields")
 
+        # Adjacent comparison never holds more than one group of lines; digests only help when searching entire files.
+        if self.args.digest and self.args.adjacent:
+            self.print_error_and_exit("--digest cannot be used with --adjacent")
+
+    def count_key_digests(self, lines: Iterable[str]) -> tuple[dict[bytes, int], array]:
+        """
+        Return group indexes keyed by comparison key digest and the number of lines in each group.
+
+        - Group indexes follow the order in which each key is first seen.
+        - Memory grows with the number of distinct keys, not with the number or length of lines.
+        """
+        group_indexes: dict[bytes, int] = {}
+        group_counts = array("Q")
+
+        for line in text.iter_normalized_lines(lines):
+            key = self.get_compare_key(line)
+
+            if not self.should_include_key(key):
+                continue
+
+            digest = self.get_key_digest(key)
+            group_index = group_indexes.setdefault(digest, len(group_indexes))
+
+            if group_index == len(group_counts):
+                group_counts.append(1)
+            else:
+                group_counts[group_index] += 1
+
+        return group_indexes, group_counts
+
     def get_compare_key(self, line: str) -> str:
         """Return a comparison key for ``line`` according to the configured normalization options."""
         compare_key = line
@@ -82,10 +129,9 @@ class Dupe(TextProgram):
             compare_key = compare_key.strip()
 
         if self.args.skip_fields:
-            separator = self.args.field_separator or " "
-            fields = text.split_csv(compare_key, separator=separator, on_error=self.print_error_and_exit)
+            fields = self.field_splitter.split(compare_key)
 
-            compare_key = separator.join(fields[self.args.skip_fields:])
+            compare_key = (self.args.field_separator or " ").join(fields[self.args.skip_fields:])
 
         if self.args.max_chars or self.args.skip_chars:
             start_index = self.args.skip_chars or 0
@@ -98,6 +144,11 @@ class Dupe(TextProgram):
 
         return compare_key
 
+    @staticmethod
+    def get_key_digest(key: str) -> bytes:
+        """Return a fixed-size BLAKE2b digest of ``key``."""
+        return hashlib.blake2b(key.encode(), digest_size=_DIGEST_SIZE).digest()
+
     def group_adjacent_matching_lines(self, lines: Iterable[str]) -> list[_LineGroups]:
         """Return groups of adjacent lines that share the same comparison key, preserving input order."""
         groups: list[_LineGroups] = []
@@ -119,6 +170,10 @@ class Dupe(TextProgram):
 
     def group_and_print_lines(self, lines: Iterable[str]) -> None:
         """Group lines by the configured strategy and print the resulting groups."""
+        if self.args.digest:
+            self.group_and_print_lines_by_digest(lines)
+            return
+
         if self.args.adjacent:
             line_groups = self.group_adjacent_matching_lines(lines)
         else:
@@ -126,6 +181,29 @@ class Dupe(TextProgram):
 
         self.print_line_groups(line_groups)
 
+    def group_and_print_lines_by_digest(self, lines: Iterable[str]) -> None:
+        """
+        Group lines by comparison key digest in a counting pass and print the groups in a second pass.
+
+        - Reads seekable streams twice; other input is copied to a temporary file during the counting pass.
+        - Lines with different keys are grouped together if their 64-bit digests collide, which is unlikely for fewer
+          than billions of distinct keys.
+        """
+        if isinstance(lines, io.TextIOBase) and lines.seekable():
+            start_position = lines.tell()
+            group_indexes, group_counts = self.count_key_digests(lines)
+            lines.seek(start_position)
+            self.print_counted_line_groups(self.iter_digest_groups(lines, group_indexes=group_indexes,
+                                                                   group_counts=group_counts))
+            return
+
+        # Split the spool only at "\n", as the counting pass split the input, so that both passes see the same keys.
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8", newline="\n") as spool_file:
+            group_indexes, group_counts = self.count_key_digests(self.iter_spooled_lines(lines, spool_file))
+            spool_file.seek(0)
+            self.print_counted_line_groups(self.iter_digest_groups(spool_file, group_indexes=group_indexes,
+                                                                   group_counts=group_counts))
+
     def group_lines_by_key(self, lines: Iterable[str]) -> dict[str, _LineGroups]:
         """Return a mapping from comparison keys to grouped lines."""
         group_map: dict[str, _LineGroups] = {}
@@ -151,6 +229,67 @@ class Dupe(TextProgram):
         """Read and process input interactively from the terminal."""
         self.group_and_print_lines(sys.stdin)
 
+    @override
+    def initialize_runtime_state(self) -> None:
+        """
+        Initialize runtime state derived from parsed options.
+
+        - Compiles the ``--field-separator`` splitter once, exiting with an error if the separator is invalid.
+        """
+        super().initialize_runtime_state()
+
+        if self.args.skip_fields:
+            try:
+                self.field_splitter = Splitter("csv", separator=self.args.field_separator or " ")
+            except ValueError as error:
+                self.print_error_and_exit(str(error))
+
+    def iter_digest_groups(self, lines: Iterable[str], *, group_indexes: dict[bytes, int],
+                           group_counts: array) -> Iterator[tuple[list[str], int]]:
+        """
+        Yield ``(lines, group_count)`` for each printed group, in the order its key was first seen.
+
+        - Keeps lines only for groups that will be printed, and only until the group can be yielded: after its first
+          line when one line per group is printed, or after its last line otherwise.
+        """
+        print_all_lines = self.should_print_all_group_lines()
+        remaining_counts = array("Q", group_counts)
+        pending_groups: dict[int, list[str]] = {}
+        next_group_index = 0
+
+        for line in text.iter_normalized_lines(lines):
+            key = self.get_compare_key(line)
+
+            if not self.should_include_key(key):
+                continue
+
+            group_index = group_indexes[self.get_key_digest(key)]
+            remaining_counts[group_index] -= 1
+
+            if self.should_print_group(group_counts[group_index]):
+                group_lines = pending_groups.setdefault(group_index, [])
+
+                if print_all_lines or not group_lines:
+                    group_lines.append(line)
+
+            # Yield groups in order as soon as they are complete; skipped groups never hold up later groups.
+            while next_group_index < len(group_counts):
+                if not self.should_print_group(group_counts[next_group_index]):
+                    next_group_index += 1
+                elif remaining_counts[next_group_index] == 0 or (not print_all_lines and
+                                                                 next_group_index in pending_groups):
+                    yield pending_groups.pop(next_group_index), group_counts[next_group_index]
+                    next_group_index += 1
+                else:
+                    break
+
+    @staticmethod
+    def iter_spooled_lines(lines: Iterable[str], spool_file: TextIO) -> Iterator[str]:
+        """Yield each line in ``lines`` after writing it to ``spool_file``."""
+        for line in lines:
+            spool_file.write(line)
+            yield line
+
     @override
     def normalize_options(self) -> None:
         """Apply derived defaults and adjust option values for consistent internal use."""
@@ -158,23 +297,16 @@ class Dupe(TextProgram):
         if not self.args.files and not self.args.stdin_files:
             self.args.no_file_name = True
 
-    def print_file_header(self, file_name: str) -> None:
-        """Print the file header for ``file_name``."""
-        if self.should_print_file_header():
-            print(self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME, colon_style=_Styles.COLON))
-
-    def print_line_groups(self, line_groups: Iterable[Collection[str]]) -> None:
-        """Print line groups as duplicates, unique lines, or grouped output."""
-        printed_line_count = 0
-
-        for line_group in line_groups:
-            group_count = len(line_group)
+    def print_counted_line_groups(self, counted_line_groups: Iterable[tuple[Iterable[str], int]]) -> None:
+        """Print ``(lines, group_count)`` pairs as duplicates, unique lines, or grouped output."""
+        printed_group = False
 
+        for line_group, group_count in counted_line_groups:
             if not self.should_print_group(group_count):
                 continue
 
-            if self.args.group and printed_line_count:
-                print()
+            if self.args.group and printed_group:
+                self.out.write_line()
 
             for line_index, line in enumerate(line_group):
                 if self.args.count:
@@ -192,15 +324,27 @@ class Dupe(TextProgram):
                     else:
                         group_count_str = f"{' ':>{self.args.count_width}} "  # Ensure lines align.
 
-                    print(f"{group_count_str}{line}")
+                    self.out.write_line(f"{group_count_str}{line}")
                 else:
-                    print(line)
+                    self.out.write_line(line)
 
-                printed_line_count += 1
+                printed_group = True
 
                 if not self.should_print_all_group_lines():
                     break
 
+    def print_file_header(self, file_name: str) -> None:
+        """Print the file header for ``file_name``."""
+        if self.should_print_file_header():
+            file_header = self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME,
+                                                  colon_style=_Styles.COLON)
+
+            self.out.write_line(file_header)
+
+    def print_line_groups(self, line_groups: Iterable[Collection[str]]) -> None:
+        """Print line groups as duplicates, unique lines, or grouped output."""
+        self.print_counted_line_groups((line_group, len(line_group)) for line_group in line_groups)
+
     @override
     def process_input_file(self, input_file: InputFile) -> None:
         """Process the text stream from ``input_file``."""
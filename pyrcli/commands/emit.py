@@ -60,7 +60,7 @@ class Emit(CLIProgram):
         self.write_strings(strings)
 
         if not self.args.no_newline:
-            print()
+            self.out.write_line()
 
     def write_strings(self, strings: Iterable[str]) -> None:
         """Write strings to standard output separated by spaces."""
@@ -70,7 +70,7 @@ class Emit(CLIProgram):
             string = text.strip_trailing_newline(raw_string)
 
             if needs_space:
-                sys.stdout.write(" ")
+                self.out.write(" ")
 
             if self.args.escapes:
                 try:
@@ -79,7 +79,7 @@ class Emit(CLIProgram):
                     if self.args.strict_escapes:
                         self.print_error_and_exit(f"invalid escape sequence at index {error.start}: {string!r}")
 
-            sys.stdout.write(string)
+            self.out.write(string)
             needs_space = True
 
 
@@ -99,7 +99,7 @@ class Glue(TextProgram):
                 self.line_number += 1
                 line = self.render_number(line)
 
-            print(line)
+            self.out.write_line(line)
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
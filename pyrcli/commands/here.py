@@ -50,19 +50,19 @@ class Here(CLIProgram):
 
             # Print geolocation information.
             for key in ("city", "region", "postal", "country", "timezone"):
-                print(f"{key}: {self.get_json_value(data=data, key=key)}")
+                self.out.write_line(f"{key}: {self.get_json_value(data=data, key=key)}")
 
             # Optionally print geographic coordinates and public IP address.
             if self.args.coordinates:
                 coordinates = self.get_json_value(data=data, key='loc')
 
                 if self.args.cardinal:
-                    print(f"coordinates: {self.format_coordinates_cardinal(coordinates)}")
+                    self.out.write_line(f"coordinates: {self.format_coordinates_cardinal(coordinates)}")
                 else:
-                    print(f"coordinates: {coordinates}")
+                    self.out.write_line(f"coordinates: {coordinates}")
 
             if self.args.ip:
-                print(f"ip: {self.get_json_value(data=data, key='ip')}")
+                self.out.write_line(f"ip: {self.get_json_value(data=data, key='ip')}")
         except (ValueError, requests.RequestException):
             self.print_error_and_exit("unable to retrieve location")
 
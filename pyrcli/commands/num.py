@@ -51,6 +51,8 @@ class Num(TextProgram):
         blank_group.add_argument("-s", "--squeeze-blank", action="store_true", help="suppress repeated blank lines")
         blank_group.add_argument("--no-blank", action="store_true", help="suppress blank lines")
         parser.add_argument("-H", "--no-file-name", action="store_true", help="suppress file name prefixes")
+        parser.add_argument("-j", "--jobs", default=1, help="process N files in parallel (default: 1; N >= 1)",
+                            metavar="N", type=int)
         parser.add_argument("--color", choices=("on", "off"), default="on",
                             help="use color for file names and line numbers (default: on)")
         parser.add_argument("--latin1", action="store_true", help="read FILES as latin-1 (default: utf-8)")
@@ -107,12 +109,15 @@ class Num(TextProgram):
                 line_number += 1
                 line = self.render_line_number(line, line_number, format_prefix=format_prefix)
 
-            print(line)
+            self.out.write_line(line)
 
     def print_file_header(self, file_name: str) -> None:
         """Print the file header for ``file_name``."""
         if self.should_print_file_header():
-            print(self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME, colon_style=_Styles.COLON))
+            file_header = self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME,
+                                                  colon_style=_Styles.COLON)
+
+            self.out.write_line(file_header)
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
@@ -147,9 +152,17 @@ class Num(TextProgram):
 
         return False
 
+    @override
+    def supports_parallel_processing(self) -> bool:
+        """Return ``True``; files are processed independently."""
+        return True
+
     @override
     def validate_option_ranges(self) -> None:
         """Validate that option values fall within their allowed numeric or logical ranges."""
+        if self.args.jobs < 1:
+            self.print_error_and_exit("--jobs must be >= 1")
+
         if self.args.number_start < 0:
             self.print_error_and_exit("--number-start must be >= 0")
 
@@ -2,26 +2,44 @@
 
 import argparse
 import datetime
+import functools
+import heapq
+import itertools
+import os
 import random
 import re
 import sys
-from collections.abc import Iterable
-from typing import Any, Callable, Final, NoReturn, override
+import tempfile
+from collections.abc import Collection, Iterable, Iterator
+from typing import Any, Callable, Final, NoReturn, TextIO, override
 
 from dateutil.parser import ParserError, parse
 
 from pyrcli.cli import TextProgram, text
 from pyrcli.cli.ansi import ForegroundColors
 from pyrcli.cli.io import InputFile
+from pyrcli.cli.text import Splitter
+
+# Multipliers for --buffer-size suffixes.
+_BUFFER_SIZE_MULTIPLIERS: Final[dict[str, int]] = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+# Matches a --buffer-size value: a positive integer with an optional K, M, or G suffix.
+_BUFFER_SIZE_PATTERN: Final[re.Pattern[str]] = re.compile(r"([0-9]+)([KMG]?)")
+
+# Maximum number of sorted runs merged at once; more runs are merged in passes to bound open files.
+_MAX_MERGE_WIDTH: Final[int] = 64
 
 # Matches one or more consecutive characters that are not digits, commas, or periods.
-_CURRENCY_SANITIZE_REGEX: Final[str] = r"[^0-9,.]+"
+_CURRENCY_SANITIZE_PATTERN: Final[re.Pattern[str]] = re.compile(r"[^0-9,.]+")
 
 # Matches (and captures) one or more decimal digits.
-_DIGIT_TOKEN_REGEX: Final[str] = r"(\d+)"
+_DIGIT_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"(\d+)")
 
 # Matches one or more consecutive characters that are not Unicode word characters or whitespace.
-_NON_WORD_OR_WHITESPACE_REGEX: Final[str] = r"[^\w\s]+"
+_NON_WORD_OR_WHITESPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r"[^\w\s]+")
+
+# Maximum number of distinct fields whose parsed date or number is remembered.
+_PARSE_CACHE_SIZE: Final[int] = 64 * 1024
 
 #: Sort key segment where ``0`` indicates a parsed date and ``1`` indicates a text fallback.
 type _DateSortSegment = tuple[int, datetime.datetime | str]
@@ -43,6 +61,12 @@ class Order(TextProgram):
         """Initialize a new instance."""
         super().__init__(name="order")
 
+        self.field_splitter: Splitter = Splitter("csv")  # Compiled from --field-separator.
+        self.parse_date_field_cached: Callable[[str], _DateSortSegment] = (
+            functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)(self.parse_date_field))
+        self.parse_number_field_cached: Callable[[str], tuple[_NumericSortSegment, ...]] = (
+            functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)(self.parse_number_field))
+
     @override
     def build_arguments(self) -> argparse.ArgumentParser:
         """Return an argument parser describing the command-line interface."""
@@ -67,6 +91,14 @@ class Order(TextProgram):
                             help="split lines into fields using SEP (default: <space>; requires --skip-fields)",
                             metavar="SEP")
         parser.add_argument("-r", "--reverse", action="store_true", help="reverse the order of the sort")
+        parser.add_argument("-S", "--buffer-size",
+                            help="sort runs of at most SIZE characters in memory and merge them from temporary files "
+                                 "(SIZE may end in K, M, or G)", metavar="SIZE")
+        parser.add_argument("-T", "--temporary-directory",
+                            help="write temporary files to DIR (default: system temporary directory; requires "
+                                 "--buffer-size)", metavar="DIR")
+        parser.add_argument("--cache-stats", action="store_true",
+                            help="print date and number parsing cache hit rates to standard error")
         parser.add_argument("--no-blank", action="store_true", help="suppress blank lines")
         parser.add_argument("-H", "--no-file-name", action="store_true", help="suppress file name prefixes")
         parser.add_argument("--color", choices=("on", "off"), default="on",
@@ -88,6 +120,14 @@ class Order(TextProgram):
         if self.args.decimal_comma and not any((self.args.currency_sort, self.args.natural_sort)):
             self.print_error_and_exit("--decimal-comma requires --currency-sort or --natural-sort")
 
+        # --temporary-directory is only meaningful with --buffer-size.
+        if self.args.temporary_directory is not None and self.args.buffer_size is None:
+            self.print_error_and_exit("--temporary-directory requires --buffer-size")
+
+        # A random order cannot be produced by merging sorted runs.
+        if self.args.buffer_size is not None and self.args.random_sort:
+            self.print_error_and_exit("--buffer-size cannot be used with --random-sort")
+
     def generate_currency_sort_key(self, line: str) -> list[_NumericSortSegment]:
         """
         Return a sort key that orders currency-like values numerically when possible.
@@ -99,13 +139,7 @@ class Order(TextProgram):
         segments: list[_NumericSortSegment] = []
 
         for field in self.get_sort_fields(line, filter_empty_fields=True):
-            negative = "-" in field or ("(" in field and ")" in field)
-            number = self.normalize_number(re.sub(pattern=_CURRENCY_SANITIZE_REGEX, repl="", string=field))
-
-            try:
-                segments.append((0, float(number) * (-1 if negative else 1)))
-            except ValueError:
-                segments.append((1, field))
+            segments.extend(self.parse_number_field_cached(field))
 
         return segments
 
@@ -117,15 +151,7 @@ class Order(TextProgram):
         - Each tuple is ``(0, date)`` when the text parses as a date.
         - Otherwise returns ``(1, text)`` to fall back to lexicographic comparison.
         """
-        segments: list[_DateSortSegment] = []
-
-        for field in self.get_sort_fields(line, filter_empty_fields=True):
-            try:
-                segments.append((0, parse(field)))
-            except ParserError:
-                segments.append((1, field))
-
-        return segments
+        return [self.parse_date_field_cached(field) for field in self.get_sort_fields(line, filter_empty_fields=True)]
 
     def generate_default_sort_key(self, line: str) -> list[str]:
         """Return a sort key that orders lines lexicographically."""
@@ -137,7 +163,7 @@ class Order(TextProgram):
 
         for field in self.get_sort_fields(line):
             # Remove everything except Unicode word characters and whitespace.
-            sort_fields.append(re.sub(pattern=_NON_WORD_OR_WHITESPACE_REGEX, repl="", string=field))
+            sort_fields.append(_NON_WORD_OR_WHITESPACE_PATTERN.sub("", field))
 
         return sort_fields
 
@@ -152,27 +178,16 @@ class Order(TextProgram):
         segments: list[_NumericSortSegment] = []
 
         for field in self.get_sort_fields(line, filter_empty_fields=True):
-            try:
-                segments.append((0, float(self.normalize_number(field))))
-            except ValueError:
-                # Fall back to splitting on digit boundaries for mixed alphanumeric fields.
-                for chunk in re.split(pattern=_DIGIT_TOKEN_REGEX, string=field):
-                    if not chunk:  # Skip empty chunks.
-                        continue
-
-                    if chunk.isdigit():
-                        segments.append((0, int(chunk)))
-                    else:
-                        segments.append((1, chunk))
+            segments.extend(self.parse_number_field_cached(field))
 
         return segments
 
     def get_sort_fields(self, line: str, *, filter_empty_fields: bool = False) -> list[str]:
         """Return normalized sort fields after optional empty-field filtering and applying ``--skip-fields``."""
         normalized = self.normalize_line(line)
-        separator = self.args.field_separator or " "
         skip = self.args.skip_fields
-        fields = text.split_csv(normalized, separator=separator, on_error=self.print_error_and_exit)
+
+        fields = self.field_splitter.split(normalized)
 
         # When skipping fields, discard empty tokens first so skip counts apply to "real" fields.
         if filter_empty_fields or skip:
@@ -202,15 +217,74 @@ class Order(TextProgram):
     @override
     def handle_redirected_input(self, input_lines: Iterable[str]) -> None:
         """Process input received from redirected standard input."""
-        lines = list(input_lines)  # Materialize to a list; sort_and_print_lines requires a list for in-place sorting.
-
         self.print_file_header(file_name="")
-        self.sort_and_print_lines(lines)
+        self.sort_and_print_lines(input_lines)
 
     @override
     def handle_terminal_input(self) -> None:
         """Read and process input interactively from the terminal."""
-        self.sort_and_print_lines(sys.stdin.readlines())  # sort_and_print_lines requires a list for in-place sorting.
+        self.sort_and_print_lines(sys.stdin)
+
+    def iter_externally_sorted_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Yield lines sorted in runs of at most ``--buffer-size`` characters that are merged from temporary files.
+
+        - Produces the same order as sorting all lines at once, including the order of equal lines with ``--reverse``.
+        - Sorts in memory without temporary files when all lines fit in one run.
+        """
+        key = self.get_sort_key()
+        line_iterator = iter(lines)
+        run = self.read_run(line_iterator)
+
+        # Check for more input before spilling, so that small inputs never touch the disk.
+        if (next_line := next(line_iterator, None)) is None:
+            run.sort(key=key, reverse=self.args.reverse)
+            yield from run
+            return
+
+        line_iterator = itertools.chain([next_line], line_iterator)
+
+        with tempfile.TemporaryDirectory(prefix="order-", dir=self.args.temporary_directory) as temp_dir:
+            run_paths = []
+
+            while run:
+                run.sort(key=key, reverse=self.args.reverse)
+                run_paths.append(self.write_run(run, directory=temp_dir, run_number=len(run_paths)))
+                run = self.read_run(line_iterator)
+
+            # Merge consecutive groups of runs until one pass can merge the rest; keeping runs in input order keeps
+            # the merge stable.
+            while len(run_paths) > _MAX_MERGE_WIDTH:
+                merged_paths = []
+
+                for index in range(0, len(run_paths), _MAX_MERGE_WIDTH):
+                    group = run_paths[index:index + _MAX_MERGE_WIDTH]
+                    merged_path = os.path.join(temp_dir, f"merge-{len(run_paths)}-{index}")
+
+                    with open(merged_path, mode="w", encoding="utf-8", newline="\n") as merged_file:
+                        merged_file.writelines(self.iter_merged_runs(group, key=key))
+
+                    for path in group:
+                        os.remove(path)
+
+                    merged_paths.append(merged_path)
+
+                run_paths = merged_paths
+
+            yield from self.iter_merged_runs(run_paths, key=key)
+
+    def iter_merged_runs(self, run_paths: Iterable[str], *, key: Callable[[str], Any]) -> Iterator[str]:
+        """Yield lines from sorted run files in merged order; equal lines are taken from earlier runs first."""
+        run_files: list[TextIO] = []
+
+        try:
+            for path in run_paths:
+                run_files.append(open(path, encoding="utf-8", newline="\n"))
+
+            yield from heapq.merge(*run_files, key=key, reverse=self.args.reverse)
+        finally:
+            for run_file in run_files:
+                run_file.close()
 
     def normalize_line(self, line: str) -> str:
         """Return the line with trailing whitespace removed and optional leading-blank and case normalization."""
@@ -244,29 +318,127 @@ class Order(TextProgram):
         if not self.args.files and not self.args.stdin_files:
             self.args.no_file_name = True
 
+        # Compile --field-separator once rather than validating it for every line.
+        try:
+            self.field_splitter = Splitter("csv", separator=self.args.field_separator or " ")
+        except ValueError as error:
+            self.print_error_and_exit(str(error))
+
+        # Convert --buffer-size to a number of characters.
+        if self.args.buffer_size is not None:
+            if not (match := _BUFFER_SIZE_PATTERN.fullmatch(self.args.buffer_size.upper())) or not int(match[1]):
+                self.print_error_and_exit(f"invalid --buffer-size: {self.args.buffer_size!r}")
+
+            self.args.buffer_size = int(match[1]) * _BUFFER_SIZE_MULTIPLIERS[match[2]]
+
+    def parse_date_field(self, field: str) -> _DateSortSegment:
+        """Return ``(0, date)`` when ``field`` parses as a date; otherwise, return ``(1, field)``."""
+        try:
+            return 0, parse(field)
+        except ParserError:
+            return 1, field
+
+    def parse_number_field(self, field: str) -> tuple[_NumericSortSegment, ...]:
+        """
+        Return the numeric sort segments of ``field`` for ``--currency-sort`` or ``--natural-sort``.
+
+        - Returns ``((0, number),)`` when the field parses as a number.
+        - Otherwise, returns ``((1, field),)`` for ``--currency-sort``, or the field split on digit boundaries for
+          ``--natural-sort``.
+        """
+        if self.args.currency_sort:
+            negative = "-" in field or ("(" in field and ")" in field)
+            number = self.normalize_number(_CURRENCY_SANITIZE_PATTERN.sub("", field))
+
+            try:
+                return ((0, float(number) * (-1 if negative else 1)),)
+            except ValueError:
+                return ((1, field),)
+
+        try:
+            return ((0, float(self.normalize_number(field))),)
+        except ValueError:
+            pass
+
+        # Fall back to splitting on digit boundaries for mixed alphanumeric fields.
+        segments: list[_NumericSortSegment] = []
+
+        for chunk in _DIGIT_TOKEN_PATTERN.split(field):
+            if not chunk:  # Skip empty chunks.
+                continue
+
+            if chunk.isdigit():
+                segments.append((0, int(chunk)))
+            else:
+                segments.append((1, chunk))
+
+        return tuple(segments)
+
+    @override
+    def post_execute(self, processed_files: Collection[str]) -> None:
+        """Run post-execution logic after all input has been processed."""
+        if self.args.cache_stats:
+            self.print_cache_stats()
+
+    def print_cache_stats(self) -> None:
+        """Print the hit rates of the date and number parsing caches to standard error after pending output."""
+        self.out.flush()
+
+        for label, cached_function in (("date", self.parse_date_field_cached),
+                                       ("number", self.parse_number_field_cached)):
+            hits, misses, _, size = cached_function.cache_info()
+            lookups = hits + misses
+            hit_rate = hits / lookups * 100 if lookups else 0.0
+            print(f"{self.name}: {label} cache: {hits} hits, {misses} misses, {size} entries "
+                  f"({hit_rate:.1f}% hit rate)", file=sys.stderr)
+
     def print_file_header(self, file_name: str) -> None:
         """Print the file header for ``file_name``."""
         if self.should_print_file_header():
-            print(self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME, colon_style=_Styles.COLON))
+            file_header = self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME,
+                                                  colon_style=_Styles.COLON)
+
+            self.out.write_line(file_header)
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
         """Process the text stream from ``input_file``."""
         self.print_file_header(input_file.file_name)
-        self.sort_and_print_lines(input_file.text_stream.readlines())
+        self.sort_and_print_lines(input_file.text_stream)
+
+    def read_run(self, line_iterator: Iterator[str]) -> list[str]:
+        """Return the next lines from ``line_iterator`` until they total at least ``--buffer-size`` characters."""
+        run = []
+        run_size = 0
+
+        for line in line_iterator:
+            run.append(line)
+            run_size += len(line)
 
-    def sort_and_print_lines(self, lines: list[str]) -> None:
-        """Sort and print lines to standard output according to command-line options."""
-        if self.args.random_sort:
+            if run_size >= self.args.buffer_size:
+                break
+
+        return run
+
+    def sort_and_print_lines(self, lines: Iterable[str]) -> None:
+        """
+        Sort and print lines to standard output according to command-line options.
+
+        - Sorts with temporary files when ``--buffer-size`` is set.
+        """
+        if self.args.buffer_size is not None:
+            lines = self.iter_externally_sorted_lines(lines)
+        elif self.args.random_sort:
+            lines = list(lines)
             random.shuffle(lines)
         else:
-            lines.sort(key=self.get_sort_key(), reverse=self.args.reverse)
+            lines = sorted(lines, key=self.get_sort_key(), reverse=self.args.reverse)
 
         for line in text.iter_normalized_lines(lines):
             if self.args.no_blank and not line.rstrip():
                 continue
 
-            print(line)
+            self.out.write_line(line)
 
     @override
     def validate_option_ranges(self) -> None:
@@ -274,6 +446,31 @@ class Order(TextProgram):
         if self.args.skip_fields is not None and self.args.skip_fields < 1:
             self.print_error_and_exit("--skip-fields must be >= 1")
 
+        # Report an unusable directory before any output rather than when the first run is written.
+        if (temporary_directory := self.args.temporary_directory) is not None:
+            if not os.path.exists(temporary_directory):
+                self.print_error_and_exit(f"--temporary-directory: {temporary_directory!r}: no such directory")
+
+            if not os.path.isdir(temporary_directory):
+                self.print_error_and_exit(f"--temporary-directory: {temporary_directory!r}: not a directory")
+
+            if not os.access(temporary_directory, os.W_OK | os.X_OK):
+                self.print_error_and_exit(f"--temporary-directory: {temporary_directory!r}: permission denied")
+
+    @staticmethod
+    def write_run(run: Iterable[str], *, directory: str, run_number: int) -> str:
+        """
+        Write sorted ``run`` to a new file in ``directory`` and return its path.
+
+        - Ends every line with a newline so that lines read back match the lines written; output strips it again.
+        """
+        path = os.path.join(directory, f"run-{run_number}")
+
+        with open(path, mode="w", encoding="utf-8", newline="\n") as run_file:
+            run_file.writelines(line if line.endswith("\n") else f"{line}\n" for line in run)
+
+        return path
+
 
 def main() -> int | NoReturn:
     """Run the command and return the exit code."""
@@ -35,6 +35,8 @@ class Peek(TextProgram):
                             help="print the first N lines, or all but the last N if N < 0 (default: 10)", metavar="N",
                             type=int)
         parser.add_argument("-H", "--no-file-name", action="store_true", help="suppress file name prefixes")
+        parser.add_argument("-j", "--jobs", default=1, help="process N files in parallel (default: 1; N >= 1)",
+                            metavar="N", type=int)
         parser.add_argument("--color", choices=("on", "off"), default="on",
                             help="use color for file names (default: on)")
         parser.add_argument("--latin1", action="store_true", help="read FILES as latin-1 (default: utf-8)")
@@ -65,7 +67,10 @@ class Peek(TextProgram):
     def print_file_header(self, file_name: str) -> None:
         """Print the file header for ``file_name``."""
         if self.should_print_file_header():
-            print(self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME, colon_style=_Styles.COLON))
+            file_header = self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME,
+                                                  colon_style=_Styles.COLON)
+
+            self.out.write_line(file_header)
 
     def print_lines(self, lines: Iterable[str]) -> None:
         """Print lines to standard output."""
@@ -75,7 +80,7 @@ class Peek(TextProgram):
                 if index >= self.args.lines:
                     break
 
-                print(line)
+                self.out.write_line(line)
 
             return
 
@@ -84,7 +89,7 @@ class Peek(TextProgram):
 
         for line in text.iter_normalized_lines(lines):
             if len(buffer) == buffer.maxlen:
-                print(buffer.popleft())
+                self.out.write_line(buffer.popleft())
 
             buffer.append(line)
 
@@ -94,6 +99,17 @@ class Peek(TextProgram):
         self.print_file_header(input_file.file_name)
         self.print_lines(input_file.text_stream)
 
+    @override
+    def supports_parallel_processing(self) -> bool:
+        """Return ``True``; files are processed independently."""
+        return True
+
+    @override
+    def validate_option_ranges(self) -> None:
+        """Validate that option values fall within their allowed numeric or logical ranges."""
+        if self.args.jobs < 1:
+            self.print_error_and_exit("--jobs must be >= 1")
+
 
 def main() -> int | NoReturn:
     """Run the command and return the exit code."""
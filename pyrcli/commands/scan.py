@@ -2,7 +2,7 @@
 
 import argparse
 import sys
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator
 from typing import Final, NamedTuple, NoReturn, override
 
 from pyrcli.cli import CompiledPatterns, TextProgram, patterns, render, text
@@ -64,6 +64,8 @@ class Scan(TextProgram):
         parser.add_argument("-q", "--quiet", "--silent", action="store_true",
                             help="suppress normal output (matches, counts, and file names)")
         parser.add_argument("-s", "--no-messages", action="store_true", help="suppress file error messages")
+        parser.add_argument("-j", "--jobs", default=1, help="process N files in parallel (default: 1; N >= 1)",
+                            metavar="N", type=int)
         parser.add_argument("--color", choices=("on", "off"), default="on",
                             help="use color for file names, matches, and line numbers (default: on)")
         parser.add_argument("--latin1", action="store_true", help="read FILES as latin-1 (default: utf-8)")
@@ -73,30 +75,6 @@ class Scan(TextProgram):
 
         return parser
 
-    def collect_matches(self, lines: Iterable[str]) -> list[_Match]:
-        """
-        Return matched lines with line numbers for the configured patterns.
-
-        - Applies match styling when color is enabled and ``--invert-match`` is not set.
-        - Raises ``SystemExit(0)`` immediately when ``--quiet`` is set and a match is found.
-        """
-        matches: list[_Match] = []
-
-        for line_number, line in enumerate(text.iter_normalized_lines(lines), start=1):
-            if patterns.matches_all_patterns(line, compiled_patterns=self.patterns) != self.args.invert_match:
-                # Exit early if --quiet.
-                if self.args.quiet:
-                    raise SystemExit(0)
-
-                self.match_found = True
-
-                if self.use_color and not self.args.invert_match:
-                    line = render.style_matches(line, patterns=self.patterns, ansi_style=_Styles.MATCH)
-
-                matches.append(_Match(line_number, line))
-
-        return matches
-
     @override
     def exit_if_errors(self) -> None:
         """Raise ``SystemExit`` if a match was not found."""
@@ -105,6 +83,11 @@ class Scan(TextProgram):
         if not self.match_found:
             raise SystemExit(_NO_MATCHES_EXIT_CODE)
 
+    @override
+    def export_worker_state(self) -> bool:
+        """Return whether a match was found in a worker process."""
+        return self.match_found
+
     @override
     def handle_redirected_input(self, input_lines: Iterable[str]) -> None:
         """Process input received from redirected standard input."""
@@ -113,11 +96,7 @@ class Scan(TextProgram):
     @override
     def handle_terminal_input(self) -> None:
         """Read and process input interactively from the terminal."""
-        # Printing counts requires the input to be buffered.
-        if self.is_printing_counts():
-            self.print_matches(sys.stdin.readlines(), source_file="")
-        else:
-            self.print_matches(sys.stdin, source_file="")
+        self.print_matches(sys.stdin, source_file="")
 
     @override
     def initialize_runtime_state(self) -> None:
@@ -139,6 +118,26 @@ class Scan(TextProgram):
         """Return ``True`` if line counts will be printed."""
         return self.args.count or self.args.count_nonzero
 
+    def iter_matches(self, lines: Iterable[str]) -> Iterator[_Match]:
+        """
+        Yield matched lines with line numbers for the configured patterns.
+
+        - Raises ``SystemExit(0)`` immediately when ``--quiet`` is set and a match is found.
+        """
+        for line_number, line in enumerate(text.iter_normalized_lines(lines), start=1):
+            if patterns.matches_all_patterns(line, compiled_patterns=self.patterns) != self.args.invert_match:
+                # Exit early if --quiet.
+                if self.args.quiet:
+                    raise SystemExit(0)
+
+                self.match_found = True
+                yield _Match(line_number, line)
+
+    @override
+    def merge_worker_state(self, state: bool) -> None:
+        """Record a match found in a worker process."""
+        self.match_found = self.match_found or state
+
     @override
     def normalize_options(self) -> None:
         """Apply derived defaults and adjust option values for consistent internal use."""
@@ -146,8 +145,13 @@ class Scan(TextProgram):
         if not self.args.files and not self.args.stdin_files:
             self.args.no_file_name = True
 
-    def print_match_results(self, matches: Sequence[_Match], *, source_file: str) -> None:
-        """Print match counts or matched lines according to command-line options."""
+    def print_matches(self, lines: Iterable[str], *, source_file: str) -> None:
+        """
+        Search lines and print matches or counts according to command-line options.
+
+        - Prints each match as soon as it is found; the file name is printed before the first match.
+        - Counts matches without storing lines when printing counts.
+        """
         file_name = ""
 
         if self.should_print_file_header():
@@ -155,43 +159,53 @@ class Scan(TextProgram):
                                                 colon_style=_Styles.COLON)
 
         if self.is_printing_counts():
-            print(f"{file_name}{len(matches)}")
-        elif matches:
-            padding = len(str(matches[-1].line_number))  # Line number from the last match determines pad width.
+            match_count = sum(1 for _ in self.iter_matches(lines))
+
+            # With --count-nonzero, suppress output for inputs with zero matches.
+            if match_count or not self.args.count_nonzero:
+                self.out.write_line(f"{file_name}{match_count}")
+
+            return
+
+        style_matches = self.use_color and not self.args.invert_match
 
+        for line_number, line in self.iter_matches(lines):
             if file_name:
-                print(file_name)
-
-            for line_number, line in matches:
-                if self.args.line_number:
-                    if self.use_color:
-                        print(
-                            f"{_Styles.LINE_NUMBER}"
-                            f"{line_number:>{padding}}"
-                            f"{_Styles.COLON}:"
-                            f"{RESET}",
-                            end=""
-                        )
-                    else:
-                        print(f"{line_number:>{padding}}:", end="")
-
-                print(line)
+                self.out.write_line(file_name)
+                file_name = ""
 
-    def print_matches(self, lines: Iterable[str], *, source_file: str) -> None:
-        """Search lines and print matches or counts according to command-line options."""
-        matches = self.collect_matches(lines)
+            if self.args.line_number:
+                if self.use_color:
+                    self.out.write(
+                        f"{_Styles.LINE_NUMBER}"
+                        f"{line_number}"
+                        f"{_Styles.COLON}:"
+                        f"{RESET}"
+                    )
+                else:
+                    self.out.write(f"{line_number}:")
 
-        # With --count-nonzero, suppress output for inputs with zero matches.
-        if self.args.count_nonzero and not matches:
-            return
+            if style_matches:
+                line = render.style_matches(line, patterns=self.patterns, ansi_style=_Styles.MATCH)
 
-        self.print_match_results(matches, source_file=source_file)
+            self.out.write_line(line)
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
         """Process the text stream from ``input_file``."""
         self.print_matches(input_file.text_stream, source_file=input_file.file_name)
 
+    @override
+    def supports_parallel_processing(self) -> bool:
+        """Return ``True``; whether a match was found is combined with ``merge_worker_state()``."""
+        return True
+
+    @override
+    def validate_option_ranges(self) -> None:
+        """Validate that option values fall within their allowed numeric or logical ranges."""
+        if self.args.jobs < 1:
+            self.print_error_and_exit("--jobs must be >= 1")
+
 
 def main() -> int | NoReturn:
     """Run the command and return the exit code."""
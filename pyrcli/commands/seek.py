@@ -2,18 +2,27 @@
 
 import argparse
 import os
+import sqlite3
 import sys
 import time
-from collections.abc import Iterable
-from pathlib import Path
+from collections.abc import Callable, Iterable, Iterator
 from typing import Final, NoReturn, override
 
 from pyrcli.cli import CLIProgram, CompiledPatterns, io, patterns, render, terminal, text
 from pyrcli.cli.ansi import ForegroundColors
+from pyrcli.cli.io import PathEntry
+from pyrcli.cli.path_index import IndexedPath, PathIndex, find_indexed_root
+from pyrcli.cli.patterns import LiteralPattern
 
 # Exit code when no matches are found.
 _NO_MATCHES_EXIT_CODE: Final[int] = 1
 
+#: Check that a path must pass to be printed.
+type _PathFilter = Callable[[PathEntry | IndexedPath], bool]
+
+#: Function that returns the display path for a name part, a path part, and whether the path is a current directory.
+type _PathFormatter = Callable[[str, str, bool], str]
+
 
 class _Styles:
     """Namespace for ANSI styling constants."""
@@ -25,18 +34,26 @@ class Seek(CLIProgram):
     Command implementation for searching for files in a directory hierarchy.
 
     Attributes:
+        format_path: Display path formatter compiled from ``--abs``, ``--dot-prefix``, and ``--quotes``.
         match_found: Whether any match was found.
         name_patterns: Compiled name patterns to match.
+        path_filters: Checks compiled from ``--type``, ``--empty-only``, and ``--mtime-*``; only enabled checks.
+        path_index: Index opened for ``--index`` or ``--update-index``, or ``None``.
         path_patterns: Compiled path patterns to match.
+        reference_time: Time at startup that ``--mtime-*`` ages are measured from.
     """
 
     def __init__(self) -> None:
         """Initialize a new instance."""
         super().__init__(name="seek", error_exit_code=2)
 
+        self.format_path: _PathFormatter = os.path.join
         self.match_found: bool = False
         self.name_patterns: CompiledPatterns = []
+        self.path_filters: list[_PathFilter] = []
+        self.path_index: PathIndex | None = None
         self.path_patterns: CompiledPatterns = []
+        self.reference_time: float = time.time()
 
     @override
     def build_arguments(self) -> argparse.ArgumentParser:
@@ -44,6 +61,7 @@ class Seek(CLIProgram):
         parser = argparse.ArgumentParser(allow_abbrev=False, description="search for files in a directory hierarchy",
                                          epilog="use the current directory as the default starting point",
                                          prog=self.name)
+        index_group = parser.add_mutually_exclusive_group()
         modified_group = parser.add_mutually_exclusive_group()
 
         parser.add_argument("directories", help="search starting points", metavar="DIRECTORIES", nargs="*")
@@ -68,6 +86,17 @@ class Seek(CLIProgram):
                                     metavar="N", type=int)
         parser.add_argument("--max-depth", default=sys.maxsize,
                             help="descend at most N levels below the starting points (N >= 1)", metavar="N", type=int)
+        parser.add_argument("--threads", default=1,
+                            help="list directories in N threads; output order varies unless --sort is set "
+                                 "(default: 1; N >= 1)", metavar="N", type=int)
+        parser.add_argument("--sort", action="store_true",
+                            help="sort paths by name within each directory, in the same order for any --threads")
+        index_group.add_argument("--index",
+                                 help="search the paths recorded in index FILE instead of traversing DIRECTORIES "
+                                      "(default DIRECTORIES: all indexed directories)", metavar="FILE")
+        index_group.add_argument("--update-index",
+                                 help="record the paths under DIRECTORIES in index FILE and exit, re-listing only "
+                                      "directories that changed since the last update", metavar="FILE")
         parser.add_argument("--abs", action="store_true", help="print absolute paths")
         parser.add_argument("--dot-prefix", action="store_true",
                             help="prefix relative paths with './' (print '.' for current directory)")
@@ -79,35 +108,142 @@ class Seek(CLIProgram):
 
         return parser
 
+    def build_path_filters(self) -> list[_PathFilter]:
+        """Return the checks for the enabled ``--type``, ``--empty-only``, and ``--mtime-*`` options, cheapest first."""
+        path_filters: list[_PathFilter] = []
+        min_mtime, max_mtime = self.get_mtime_bounds()
+
+        if self.args.type == "d":
+            path_filters.append(lambda path_entry: path_entry.is_dir())
+        elif self.args.type == "f":
+            path_filters.append(lambda path_entry: not path_entry.is_dir())
+
+        if self.args.empty_only:
+            path_filters.append(lambda path_entry: path_entry.is_empty())
+
+        if min_mtime is not None:
+            path_filters.append(lambda path_entry: path_entry.get_mtime() > min_mtime)
+
+        if max_mtime is not None:
+            path_filters.append(lambda path_entry: path_entry.get_mtime() < max_mtime)
+
+        return path_filters
+
+    def build_path_formatter(self) -> _PathFormatter:
+        """
+        Return a display path formatter for ``--abs``, ``--dot-prefix``, and ``--quotes``.
+
+        - Resolves the current working directory once.
+        - Reuses the joined directory prefix while consecutive paths share a path part.
+        """
+        # Do not join the current directory with '.'.
+        absolute = self.args.abs
+
+        if absolute:
+            base_directory = current_directory_base = os.getcwd()
+        elif self.args.dot_prefix:
+            base_directory, current_directory_base = os.curdir, ""
+        else:
+            base_directory = current_directory_base = ""
+
+        quotes = self.args.quotes
+        last_path_part = None
+        last_prefix = ""
+
+        def format_path(name_part: str, path_part: str, is_current_directory: bool) -> str:
+            """Return the display path for ``name_part`` in ``path_part``."""
+            nonlocal last_path_part, last_prefix
+
+            if is_current_directory:
+                # Do not join the current working directory with '.'.
+                if absolute:
+                    display_path = os.path.join(current_directory_base, path_part)
+                else:
+                    display_path = os.path.join(current_directory_base, path_part, name_part)
+            else:
+                if path_part != last_path_part:
+                    last_path_part = path_part
+                    last_prefix = os.path.join(base_directory, path_part)
+
+                display_path = os.path.join(last_prefix, name_part)
+
+            return f'"{display_path}"' if quotes else display_path
+
+        return format_path
+
     @override
     def execute(self) -> None:
         """Execute the command using the prepared runtime state."""
-        if terminal.stdin_is_redirected():
-            self.print_paths(io.iter_stdin_lines())
+        index_file_name = self.args.index or self.args.update_index
+        process_directories = self.update_index if self.args.update_index else self.print_paths
 
-            # Process any additional directories.
-            if self.args.directories:
-                self.print_paths(self.args.directories)
-        else:
-            self.print_paths(self.args.directories or [os.curdir])
+        if self.args.index and not os.path.isfile(self.args.index):
+            self.print_error_and_exit(f"{self.args.index!r}: no such file")
+
+        if index_file_name:
+            try:
+                self.path_index = PathIndex(index_file_name, read_only=bool(self.args.index))
+            except sqlite3.Error:
+                self.print_error_and_exit(f"{index_file_name!r}: not a path index")
+
+        try:
+            if terminal.stdin_is_redirected():
+                process_directories(io.iter_stdin_lines())
+
+                # Process any additional directories.
+                if self.args.directories:
+                    process_directories(self.args.directories)
+            elif self.args.index and not self.args.directories:
+                process_directories(self.path_index.get_roots())
+            else:
+                process_directories(self.args.directories or [os.curdir])
+        finally:
+            if self.path_index:
+                self.path_index.close()
 
     @override
     def exit_if_errors(self) -> None:
         """Raise ``SystemExit`` if a match was not found."""
         super().exit_if_errors()
 
-        if not self.match_found:
+        if not self.match_found and not self.args.update_index:
             raise SystemExit(_NO_MATCHES_EXIT_CODE)
 
+    def get_mtime_bounds(self) -> tuple[float | None, float | None]:
+        """
+        Return the modification time bounds ``(min_mtime, max_mtime)`` for ``--mtime-*``, measured from startup.
+
+        - ``-N`` (within the last N units) sets a lower bound; ``+N`` (older than N units) sets an upper bound.
+        - Returns ``(None, None)`` when no ``--mtime-*`` option is set.
+        """
+        # --mtime options are mutually exclusive; only one may be provided.
+        if self.args.mtime_days:
+            threshold_seconds = self.args.mtime_days * 86400
+        elif self.args.mtime_hours:
+            threshold_seconds = self.args.mtime_hours * 3600
+        elif self.args.mtime_mins:
+            threshold_seconds = self.args.mtime_mins * 60
+        else:
+            return None, None
+
+        if threshold_seconds < 0:
+            return self.reference_time + threshold_seconds, None
+
+        return None, self.reference_time - threshold_seconds
+
     @override
     def initialize_runtime_state(self) -> None:
         """
         Initialize runtime state derived from parsed options.
 
         - Compiles ``--name`` and ``--path`` patterns when provided.
+        - Compiles the enabled filters and the display path formatter.
         """
         super().initialize_runtime_state()
 
+        self.format_path = self.build_path_formatter()
+        self.path_filters = self.build_path_filters()
+
         if self.args.name:
             self.name_patterns = patterns.compile_patterns(self.args.name, ignore_case=self.args.ignore_case,
                                                            on_error=self.print_error_and_exit)
@@ -116,43 +252,38 @@ class Seek(CLIProgram):
             self.path_patterns = patterns.compile_patterns(self.args.path, ignore_case=self.args.ignore_case,
                                                            on_error=self.print_error_and_exit)
 
-    def path_matches_filters(self, path: Path) -> bool:
-        """Return ``True`` if the path matches all enabled filters."""
-        try:
-            if self.args.type:
-                is_dir = path.is_dir()
-
-                if self.args.type == "d" and not is_dir:
-                    return False
+    def iter_indexed_paths(self, root: PathEntry, indexed_root: str) -> Iterator[IndexedPath]:
+        """
+        Yield the paths recorded under ``root`` in the index of ``indexed_root``, the starting directory containing it.
 
-                if self.args.type == "f" and is_dir:
-                    return False
+        - Narrows the query with literal ``--name`` patterns, ``--type``, ``--empty-only``, and ``--mtime-*``, unless
+          ``--invert-match`` is set; the paths must still be matched with ``print_path()``.
+        """
+        if self.args.invert_match:
+            yield from self.path_index.iter_paths(root.path, max_depth=self.args.max_depth, indexed_root=indexed_root)
+            return
 
-            if self.args.empty_only:
-                if path.is_dir():
-                    if os.listdir(path):
-                        return False
-                else:
-                    if path.lstat().st_size:
-                        return False
-
-            # --mtime options are mutually exclusive; only one may be provided.
-            if self.args.mtime_days or self.args.mtime_hours or self.args.mtime_mins:
-                if self.args.mtime_days is not None:
-                    threshold_seconds = self.args.mtime_days * 86400
-                elif self.args.mtime_hours is not None:
-                    threshold_seconds = self.args.mtime_hours * 3600
-                else:
-                    threshold_seconds = self.args.mtime_mins * 60
+        name_literals = [pattern.pattern for pattern in self.name_patterns if isinstance(pattern, LiteralPattern)]
+        is_dir = {"d": True, "f": False}.get(self.args.type)
+        min_mtime, max_mtime = self.get_mtime_bounds()
 
-                age_seconds = time.time() - path.lstat().st_mtime
+        yield from self.path_index.iter_paths(root.path, max_depth=self.args.max_depth, indexed_root=indexed_root,
+                                              name_literals=name_literals, is_dir=is_dir,
+                                              empty_only=self.args.empty_only, min_mtime=min_mtime,
+                                              max_mtime=max_mtime)
 
-                if threshold_seconds < 0:
-                    return age_seconds < abs(threshold_seconds)
+    def path_matches_filters(self, path_entry: PathEntry | IndexedPath) -> bool:
+        """
+        Return ``True`` if the path matches all enabled filters.
 
-                return age_seconds > threshold_seconds
+        - Uses the file type and ``lstat()`` result cached on ``path_entry``, or the values recorded in the index.
+        """
+        try:
+            for path_filter in self.path_filters:
+                if not path_filter(path_entry):
+                    return False
         except PermissionError:
-            self.print_error(f"{path!r}: permission denied")
+            self.print_error(f"{path_entry.path!r}: permission denied")
             return False
 
         # All active filters passed.
@@ -168,17 +299,17 @@ class Seek(CLIProgram):
 
         return True
 
-    def print_path(self, path: Path) -> None:
+    def print_path(self, path_entry: PathEntry | IndexedPath) -> None:
         """Print the path if it matches the specified search criteria."""
-        is_current_directory = path.name == ""
-        name_part = path.name or os.curdir  # The current directory has no name component.
-        path_part = str(path.parent) if len(path.parts) > 1 else ""  # Do not include '.' in the path part.
+        is_current_directory = path_entry.name == ""
+        name_part = path_entry.name or os.curdir  # The current directory has no name component.
+        path_part = path_entry.parent  # Empty rather than '.' for paths with a single component.
 
         # Skip the current directory unless --dot-prefix is set.
         if is_current_directory and not self.args.dot_prefix:
             return
 
-        matches = self.path_matches_patterns(name_part, path_part) and self.path_matches_filters(path)
+        matches = self.path_matches_patterns(name_part, path_part) and self.path_matches_filters(path_entry)
 
         if matches == self.args.invert_match:
             return
@@ -193,46 +324,55 @@ class Seek(CLIProgram):
             name_part = render.style_matches(name_part, patterns=self.name_patterns, ansi_style=_Styles.MATCH)
             path_part = render.style_matches(path_part, patterns=self.path_patterns, ansi_style=_Styles.MATCH)
 
-        if self.args.abs:
-            # Do not join the current working directory with '.'.
-            if is_current_directory:
-                display_path = os.path.join(Path.cwd(), path_part)
-            else:
-                display_path = os.path.join(Path.cwd(), path_part, name_part)
-        else:
-            # Do not join the current directory with '.'.
-            if self.args.dot_prefix and not is_current_directory:
-                display_path = os.path.join(os.curdir, path_part, name_part)
-            else:
-                display_path = os.path.join(path_part, name_part)
-
-        if self.args.quotes:
-            display_path = f'"{display_path}"'
-
-        print(display_path)
+        self.out.write_line(self.format_path(name_part, path_part, is_current_directory))
 
     def print_paths(self, directories: Iterable[str]) -> None:
         """Traverse starting directories up to ``--max-depth`` and print matching paths."""
+        indexed_roots = self.path_index.get_roots() if self.path_index else []
+
         for directory in text.iter_normalized_lines(directories):
-            if os.path.exists(directory):
-                root = Path(directory)
+            root = PathEntry.from_path(directory)
 
+            if self.path_index:
+                # Directories under an indexed starting directory are read from its index.
+                indexed_root = find_indexed_root(directory, indexed_roots)
+
+                if indexed_root is None:
+                    self.print_error(f"{directory!r}: not in index {self.args.index!r}")
+                    continue
+
+                if os.path.exists(directory):
+                    self.print_path(root)
+
+                for indexed_path in self.iter_indexed_paths(root, indexed_root):
+                    self.print_path(indexed_path)
+            elif os.path.exists(directory):
                 self.print_path(root)
 
-                try:
-                    for path in io.iter_descendant_paths(root, max_depth=self.args.max_depth):
-                        self.print_path(path)
-                except PermissionError as error:
-                    self.print_error(f"{error.filename!r}: permission denied")
+                for path_entry in io.iter_path_entries(root, max_depth=self.args.max_depth,
+                                                       sort_entries=self.args.sort, thread_count=self.args.threads,
+                                                       on_error=self.print_error):
+                    self.print_path(path_entry)
             else:
                 self.print_error(f"{directory!r}: no such file or directory")
 
+    def update_index(self, directories: Iterable[str]) -> None:
+        """Record the paths under each directory in the index opened for ``--update-index``."""
+        for directory in text.iter_normalized_lines(directories):
+            if os.path.isdir(directory):
+                self.path_index.update(directory, on_error=self.print_error)
+            else:
+                self.print_error(f"{directory!r}: no such directory")
+
     @override
     def validate_option_ranges(self) -> None:
         """Validate that option values fall within their allowed numeric or logical ranges."""
         if self.args.max_depth < 1:
             self.print_error_and_exit("--max-depth must be >= 1")
 
+        if self.args.threads < 1:
+            self.print_error_and_exit("--threads must be >= 1")
+
 
 def main() -> int | NoReturn:
     """Run the command and return the exit code."""
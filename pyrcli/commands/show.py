@@ -95,7 +95,10 @@ class Show(TextProgram):
     def print_file_header(self, file_name: str) -> None:
         """Print the file header for ``file_name``."""
         if self.should_print_file_header():
-            print(self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME, colon_style=_Styles.COLON))
+            file_header = self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME,
+                                                  colon_style=_Styles.COLON)
+
+            self.out.write_line(file_header)
 
     def print_lines(self, lines: Collection[str]) -> None:
         """Print lines to standard output, applying numbering and whitespace rendering."""
@@ -118,7 +121,7 @@ class Show(TextProgram):
                 if self.args.line_numbers:
                     rendered = self.render_line_number(rendered, line_number, padding=padding)
 
-                print(rendered)
+                self.out.write_line(rendered)
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
@@ -1,13 +1,15 @@
 """Implements a program that splits lines in files into fields."""
 
 import argparse
+import csv
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Final, NoReturn, override
 
-from pyrcli.cli import TextProgram, text
+from pyrcli.cli import TextProgram
 from pyrcli.cli.ansi import ForegroundColors
 from pyrcli.cli.io import InputFile
+from pyrcli.cli.text import Splitter
 
 
 class _Styles:
@@ -21,6 +23,7 @@ class Slice(TextProgram):
     Command implementation for splitting lines in files into fields.
 
     Attributes:
+        field_splitter: Splitter compiled from ``--mode`` and its options.
         selected_fields: Zero-based field indices to print.
     """
 
@@ -28,6 +31,7 @@ class Slice(TextProgram):
         """Initialize a new instance."""
         super().__init__(name="slice")
 
+        self.field_splitter: Splitter = Splitter("shell")
         self.selected_fields: list[int] = []
 
     @override
@@ -110,12 +114,47 @@ class Slice(TextProgram):
     def handle_redirected_input(self, input_lines: Iterable[str]) -> None:
         """Process input received from redirected standard input."""
         self.print_file_header(file_name="")
-        self.split_and_print_lines(input_lines)
+        self.split_and_print_lines(input_lines, file_name="(standard input)")
 
     @override
     def handle_terminal_input(self) -> None:
         """Read and process input interactively from the terminal."""
-        self.split_and_print_lines(sys.stdin)
+        self.split_and_print_lines(sys.stdin, file_name="(standard input)")
+
+    @override
+    def initialize_runtime_state(self) -> None:
+        """
+        Initialize runtime state derived from parsed options.
+
+        - Compiles the field splitter for ``--mode``, exiting with an error for an invalid separator or pattern.
+        - With ``--fields``, the splitter stops after the highest selected field, so later fields are never tokenized.
+        """
+        super().initialize_runtime_state()
+
+        try:
+            self.field_splitter = Splitter(self.args.mode, separator=self.args.field_separator or " ",
+                                           pattern=self.args.field_pattern or r"\s+",
+                                           literal_quotes=self.args.literal_quotes, drop_empty=not self.args.keep_empty,
+                                           max_fields=max(self.selected_fields) + 1 if self.selected_fields else None)
+        except ValueError as error:
+            self.print_error_and_exit(str(error))
+
+    def iter_formatted_records(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield each record split from ``lines`` as output fields joined by ``--separator``."""
+        quote = self.get_field_quote()
+        separator = self.args.separator
+
+        for fields in self.field_splitter.split_stream(lines):
+            fields = self.select_fields(fields)
+
+            # Skip blank lines unless --keep-empty-lines is set.
+            if not fields and not self.args.keep_empty_lines:
+                continue
+
+            if quote:
+                yield separator.join(f"{quote}{field}{quote}" for field in fields)
+            else:
+                yield separator.join(fields)
 
     @override
     def normalize_options(self) -> None:
@@ -134,53 +173,37 @@ class Slice(TextProgram):
     def print_file_header(self, file_name: str) -> None:
         """Print the file header for ``file_name``."""
         if self.should_print_file_header():
-            print(self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME, colon_style=_Styles.COLON))
+            file_header = self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME,
+                                                  colon_style=_Styles.COLON)
+
+            self.out.write_line(file_header)
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
         """Process the text stream from ``input_file``."""
         self.print_file_header(input_file.file_name)
-        self.split_and_print_lines(input_file.text_stream)
-
-    def split_and_print_lines(self, lines: Iterable[str]) -> None:
-        """Split lines into fields and print them."""
-        quote = self.get_field_quote()
-
-        for line in text.iter_normalized_lines(lines):
-            fields = self.split_line(line)
-
-            # Skip blank lines unless --keep-empty-lines is set.
-            if not fields and not self.args.keep_empty_lines:
-                continue
-
-            print(self.args.separator.join(f"{quote}{field}{quote}" for field in fields))
-
-    def split_line(self, line: str) -> list[str]:
-        """Split a line into fields and apply configured filtering and selection."""
-        fields = []
-
-        match self.args.mode:
-            case "csv":
-                field_separator = self.args.field_separator or " "
-
-                fields = text.split_csv(line, separator=field_separator, on_error=self.print_error_and_exit)
-            case "regex":
-                field_pattern = self.args.field_pattern or r"\s+"
-
-                fields = text.split_pattern(line, pattern=field_pattern, on_error=self.print_error_and_exit)
-            case _:
-                fields = text.split_shell_tokens(line, literal_quotes=self.args.literal_quotes)
-
-        # Filter empty fields unless --keep-empty=True.
-        if not self.args.keep_empty:
-            fields = [field for field in fields if field]
+        self.split_and_print_lines(input_file.text_stream, file_name=input_file.file_name)
 
+    def select_fields(self, fields: list[str]) -> list[str]:
+        """Return the fields selected by ``--fields``, or all ``fields`` when none are selected."""
         # If --fields, collect the selected fields.
         if self.selected_fields:
             fields = [fields[index] for index in self.selected_fields if index < len(fields)]
 
         return fields
 
+    def split_and_print_lines(self, lines: Iterable[str], *, file_name: str) -> None:
+        """
+        Split lines into fields and print them.
+
+        - In csv mode, quoted fields may span lines.
+        - Reports CSV errors for ``file_name`` via print_error().
+        """
+        try:
+            self.out.write_lines(self.iter_formatted_records(lines))
+        except csv.Error as error:
+            self.print_error(f"{file_name!r}: unable to read CSV: {error}")
+
     @override
     def validate_option_ranges(self) -> None:
         """Validate that option values fall within their allowed numeric or logical ranges."""
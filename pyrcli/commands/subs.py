@@ -3,7 +3,8 @@
 import argparse
 import re
 import sys
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, islice
 from typing import Final, NoReturn, override
 
 from pyrcli.cli import TextProgram, io, patterns, text
@@ -23,13 +24,15 @@ class Subs(TextProgram):
 
     Attributes:
         pattern: Compiled pattern to match.
+        replacement: ``--replace`` string, or a function that returns the ``--mapping`` replacement for a match.
     """
 
     def __init__(self) -> None:
         """Initialize a new instance."""
         super().__init__(name="subs")
 
-        self.pattern: re.Pattern[str] | None = None
+        self.pattern: re.Pattern[str] | patterns.PatternAlternation | None = None
+        self.replacement: str | Callable[[re.Match[str]], str] = ""
 
     @override
     def build_arguments(self) -> argparse.ArgumentParser:
@@ -39,9 +42,11 @@ class Subs(TextProgram):
 
         parser.add_argument("files", help="read from FILES", metavar="FILES", nargs="*")
         parser.add_argument("-e", "--find", action="extend", help="match PATTERN (repeat --find to match any pattern)",
-                            metavar="PATTERN", nargs=1, required=True)
-        parser.add_argument("-r", "--replace", help="replace matches with literal STRING", metavar="STRING",
-                            required=True)
+                            metavar="PATTERN", nargs=1)
+        parser.add_argument("-r", "--replace", help="replace matches with literal STRING", metavar="STRING")
+        parser.add_argument("-m", "--mapping",
+                            help="replace matches of each PATTERN with its literal STRING, read from FILE as one "
+                                 "PATTERN<TAB>STRING pair per line (instead of --find and --replace)", metavar="FILE")
         parser.add_argument("-i", "--ignore-case", action="store_true", help="ignore case when matching")
         parser.add_argument("--max-replacements", default=sys.maxsize, help="limit replacements to N per line (N >= 1)",
                             metavar="N", type=int)
@@ -58,7 +63,18 @@ class Subs(TextProgram):
 
     @override
     def check_option_dependencies(self) -> None:
-        """Enforce relationships and mutual constraints between command-line options."""
+        """
+        Enforce relationships and mutual constraints between command-line options.
+
+        - Reports missing or conflicting ``--find``, ``--replace``, and ``--mapping`` as usage errors, as argparse
+          reports missing required options.
+        """
+        if self.args.mapping:
+            if self.args.find or self.args.replace is not None:
+                self.build_arguments().error("--mapping cannot be used with --find or --replace")
+        elif not self.args.find or self.args.replace is None:
+            self.build_arguments().error("--find and --replace, or --mapping, are required")
+
         # --in-place is only meaningful with FILES.
         if self.args.in_place and not self.args.files and not self.args.stdin_files:
             self.print_error_and_exit("--in-place requires FILES")
@@ -80,12 +96,21 @@ class Subs(TextProgram):
         Initialize runtime state derived from parsed options.
 
         - Compiles ``--find`` patterns into a single OR-pattern.
+        - Compiles ``--mapping`` patterns into a single pattern whose replacement is looked up per match.
         """
         super().initialize_runtime_state()
 
-        if compiled := patterns.compile_patterns(self.args.find, ignore_case=self.args.ignore_case,
-                                                 on_error=self.print_error_and_exit):
-            self.pattern = patterns.compile_or_pattern(compiled, ignore_case=self.args.ignore_case)
+        if self.args.mapping:
+            if compiled_mapping := patterns.compile_mapping_pattern(self.read_mapping_file(),
+                                                                    ignore_case=self.args.ignore_case,
+                                                                    on_error=self.print_error_and_exit):
+                self.pattern, self.replacement = compiled_mapping
+        else:
+            self.replacement = self.args.replace
+
+            if compiled := patterns.compile_patterns(self.args.find, ignore_case=self.args.ignore_case,
+                                                     on_error=self.print_error_and_exit):
+                self.pattern = patterns.compile_or_pattern(compiled, ignore_case=self.args.ignore_case)
 
     def iter_replaced_lines(self, lines: Iterable[str]) -> Iterator[str]:
         """
@@ -96,7 +121,7 @@ class Subs(TextProgram):
         # Check pattern once rather than per line.
         if self.pattern:
             for line in text.iter_normalized_lines(lines):
-                yield self.pattern.sub(repl=self.args.replace, string=line, count=self.args.max_replacements)
+                yield self.pattern.sub(repl=self.replacement, string=line, count=self.args.max_replacements)
         else:
             yield from text.iter_normalized_lines(lines)
 
@@ -110,26 +135,85 @@ class Subs(TextProgram):
     def print_file_header(self, file_name: str) -> None:
         """Print the file header for ``file_name``."""
         if self.should_print_file_header():
-            print(self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME, colon_style=_Styles.COLON))
+            file_header = self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME,
+                                                  colon_style=_Styles.COLON)
+
+            self.out.write_line(file_header)
 
     def print_replaced_lines(self, lines: Iterable[str]) -> None:
         """Print lines with pattern matches replaced."""
-        for line in self.iter_replaced_lines(lines):
-            print(line)
+        self.out.write_lines(self.iter_replaced_lines(lines))
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
         """Process the text stream from ``input_file``."""
         if self.args.in_place:
-            # Buffer before writing to avoid reading and writing the same file simultaneously.
-            lines = input_file.text_stream.readlines()
-
-            io.write_text_file(input_file.file_name, lines=self.iter_replaced_lines(lines), encoding=self.encoding,
-                               on_error=self.print_error)
+            self.replace_lines_in_place(input_file)
         else:
             self.print_file_header(input_file.file_name)
             self.print_replaced_lines(input_file.text_stream)
 
+    def read_mapping_file(self) -> dict[str, str]:
+        """
+        Return the pattern and replacement pairs read from the ``--mapping`` file.
+
+        - Each non-empty line holds a pattern and a replacement, which may be empty, separated by the first tab.
+        - Keeps the first replacement when a pattern is repeated.
+        - Exits with an error if the file cannot be read or a line has no tab.
+        """
+        mapping = {}
+
+        for input_file in io.open_text_files([self.args.mapping], encoding=self.encoding,
+                                             on_error=self.print_error_and_exit):
+            try:
+                for line_number, line in enumerate(text.iter_normalized_lines(input_file.text_stream), start=1):
+                    if not line:
+                        continue
+
+                    pattern, separator, replacement = line.partition("\t")
+
+                    if not separator:
+                        self.print_error_and_exit(f"{self.args.mapping!r}: line {line_number}: missing tab")
+
+                    mapping.setdefault(pattern, replacement)
+            except UnicodeDecodeError:
+                self.print_error_and_exit(f"{self.args.mapping!r}: unable to read with {self.encoding!r}")
+
+        return mapping
+
+    def replace_lines_in_place(self, input_file: InputFile) -> None:
+        """
+        Write ``input_file`` back with matches replaced.
+
+        - Leaves files without matches untouched, so their modification times are kept.
+        - Streams replaced lines into a temporary file that atomically replaces the file, rather than buffering them.
+        """
+        text_stream = input_file.text_stream
+
+        # Renaming over a pipe or device would replace it with a regular file.
+        if not text_stream.seekable():
+            self.print_error(f"{input_file.file_name!r}: not a regular file")
+            return
+
+        unmatched_line_count = 0
+
+        # Search lines as iter_replaced_lines() replaces them, without their line endings.
+        for line in text.iter_normalized_lines(text_stream):
+            if self.pattern and self.pattern.search(line):
+                break
+
+            unmatched_line_count += 1
+        else:
+            return
+
+        # Read the file again from the start; lines before the first match are written unchanged.
+        text_stream.seek(0)
+        lines = iter(text_stream)
+        replaced_lines = chain(islice(lines, unmatched_line_count), self.iter_replaced_lines(lines))
+
+        io.replace_text_file(input_file.file_name, lines=replaced_lines, encoding=self.encoding,
+                             on_error=self.print_error)
+
     @override
     def validate_option_ranges(self) -> None:
         """Validate that option values fall within their allowed numeric or logical ranges."""
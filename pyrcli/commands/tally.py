@@ -4,14 +4,23 @@ import argparse
 import re
 import sys
 from collections.abc import Collection, Iterable
+from itertools import batched
 from typing import Final, NamedTuple, NoReturn, override
 
-from pyrcli.cli import TextProgram, text
+from pyrcli.cli import TextProgram
 from pyrcli.cli.ansi import ForegroundColors, RESET
 from pyrcli.cli.io import InputFile
 
-# Matches sequences of word characters bounded by word boundaries.
-_WORD_PATTERN: Final[re.Pattern[str]] = re.compile(r"\b\w+\b")
+# Maps ASCII word characters to b"a" and every other byte to b" ", so that words in ASCII text can be counted as the
+# number of b" a" pairs after translation.
+_ASCII_WORD_TABLE: Final[bytes] = b"".join(b"a" if byte < 128 and re.fullmatch(r"\w", chr(byte)) else b" " for byte in
+                                           range(256))
+
+# Number of lines joined into one chunk when counting a text stream.
+_LINE_BATCH_SIZE: Final[int] = 4096
+
+# Matches sequences of word characters; a longest sequence is always bounded by word boundaries.
+_WORD_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+")
 
 
 class _Counts(NamedTuple):
@@ -75,6 +84,8 @@ class Tally(TextProgram):
                             type=int)
         parser.add_argument("--count-width", default=8, help="pad counts to width N (default: 8; N >= 1)", metavar="N",
                             type=int)
+        parser.add_argument("-j", "--jobs", default=1, help="process N files in parallel (default: 1; N >= 1)",
+                            metavar="N", type=int)
         parser.add_argument("--color", choices=("on", "off"), default="on",
                             help="use color for counts and file names (default: on)")
         parser.add_argument("--latin1", action="store_true", help="read FILES as latin-1 (default: utf-8)")
@@ -83,21 +94,68 @@ class Tally(TextProgram):
 
         return parser
 
-    def calculate_counts(self, lines: Iterable[str]) -> _Counts:
-        """Return line, word, character, and maximum display width counts for ``lines``."""
+    def calculate_chunk_counts(self, chunks: Iterable[str]) -> _Counts:
+        """
+        Return line, word, character, and maximum display width counts for ``chunks`` of whole lines.
+
+        - Every line in a chunk ends with ``"\\n"`` except possibly the final line of the last chunk.
+        - Counts words and line widths only when their flags are set; otherwise they are 0.
+        - Counts words without building lists of matches, and expands tabs only in lines that contain them.
+        """
+        count_words, count_max_line_length = self.flags[1], self.flags[3]
+        tab_width = self.args.tab_width
         line_count, word_count, character_count, max_line_length = 0, 0, 0, 0
+        last_chunk = ""
+
+        for chunk in chunks:
+            character_count += len(chunk)
+            line_count += chunk.count("\n")
 
-        for raw_line in lines:
-            display_line = text.strip_trailing_newline(raw_line)
-            max_display_width = len(display_line.expandtabs(self.args.tab_width))
+            if count_words:
+                word_count += self.count_words(chunk)
 
-            character_count += len(raw_line)
+            if count_max_line_length:
+                display_lines = chunk.split("\n")
+
+                if "\t" in chunk:
+                    display_widths = (len(line.expandtabs(tab_width)) if "\t" in line else len(line) for line in
+                                      display_lines)
+                else:
+                    display_widths = map(len, display_lines)
+
+                max_line_length = max(max_line_length, max(display_widths))
+
+            last_chunk = chunk
+
+        # Count a final line without a line ending.
+        if last_chunk and not last_chunk.endswith("\n"):
             line_count += 1
-            max_line_length = max(max_display_width, max_line_length)
-            word_count += len(_WORD_PATTERN.findall(display_line))
 
         return _Counts(line_count, word_count, character_count, max_line_length)
 
+    def calculate_counts(self, lines: Iterable[str]) -> _Counts:
+        """Return line, word, character, and maximum display width counts for ``lines`` from a text stream."""
+        return self.calculate_chunk_counts("".join(batch) for batch in batched(lines, _LINE_BATCH_SIZE))
+
+    @staticmethod
+    def count_words(chunk: str) -> int:
+        """
+        Return the number of words in ``chunk``.
+
+        - Counts ASCII chunks by translating bytes and counting word starts in C.
+        - Counts other chunks with ``_WORD_PATTERN.subn()``, which does not build a list of matches.
+        """
+        if chunk.isascii():
+            translated = chunk.encode("ascii").translate(_ASCII_WORD_TABLE)
+            return translated.count(b" a") + translated.startswith(b"a")
+
+        return _WORD_PATTERN.subn("", chunk)[1]
+
+    @override
+    def export_worker_state(self) -> _Counts:
+        """Return the counts accumulated in a worker process."""
+        return self.totals
+
     @override
     def handle_redirected_input(self, input_lines: Iterable[str]) -> None:
         """Process input received from redirected standard input."""
@@ -132,6 +190,11 @@ class Tally(TextProgram):
             for index in (0, 1, 2):
                 self.flags[index] = True
 
+    @override
+    def merge_worker_state(self, state: _Counts) -> None:
+        """Accumulate counts from a worker process into the running totals."""
+        self.accumulate_counts(state)
+
     @override
     def post_execute(self, processed_files: Collection[str]) -> None:
         """Run post-execution logic after all input has been processed."""
@@ -154,37 +217,63 @@ class Tally(TextProgram):
         for index, count in enumerate(counts):
             if self.flags[index]:
                 if self.use_color:
-                    print(
+                    self.out.write(
                         f"{count_color}"
                         f"{count:>{padding},}"
-                        f"{RESET}",
-                        end=""
+                        f"{RESET}"
                     )
                 else:
-                    print(f"{count:>{padding},}", end="")
+                    self.out.write(f"{count:>{padding},}")
 
         if source_file:
             if self.use_color:
-                print(f" {source_file_color}{source_file}{RESET}")
+                self.out.write_line(f" {source_file_color}{source_file}{RESET}")
             else:
-                print(f" {source_file}")
+                self.out.write_line(f" {source_file}")
         else:
-            print()
+            self.out.write_line()
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
-        """Process the text stream from ``input_file``."""
-        counts = self.calculate_counts(input_file.text_stream)
+        """
+        Process the text stream from ``input_file``.
+
+        - Counts lines and characters of memory-mapped files from their bytes when no other counts are printed.
+        - Otherwise, decodes memory-mapped files in whole blocks rather than line by line.
+        """
+        mapped_lines = input_file.mapped_lines
+
+        if mapped_lines is None:
+            counts = self.calculate_counts(input_file.text_stream)
+        elif self.flags[1] or self.flags[3]:
+            counts = self.calculate_chunk_counts(mapped_lines.iter_decoded_blocks())
+        else:
+            line_count = mapped_lines.count_lines() if self.flags[0] else 0
+            character_count = mapped_lines.count_characters() if self.flags[2] else 0
+            counts = _Counts(line_count, 0, character_count, 0)
 
         self.accumulate_counts(counts)
         self.print_counts(counts, source_file=input_file.file_name, is_total=False)
 
+    @override
+    def supports_memory_mapping(self) -> bool:
+        """Return ``True``; regular files are counted from the memory map."""
+        return True
+
+    @override
+    def supports_parallel_processing(self) -> bool:
+        """Return ``True``; per-file counts are accumulated with ``merge_worker_state()``."""
+        return True
+
     @override
     def validate_option_ranges(self) -> None:
         """Validate that option values fall within their allowed numeric or logical ranges."""
         if self.args.count_width < 1:
             self.print_error_and_exit("--count-width must be >= 1")
 
+        if self.args.jobs < 1:
+            self.print_error_and_exit("--jobs must be >= 1")
+
         if self.args.tab_width < 1:
             self.print_error_and_exit("--tab-width must be >= 1")
 
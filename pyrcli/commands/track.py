@@ -1,20 +1,41 @@
 """Implements a program that prints the last part of files, optionally following new lines."""
 
 import argparse
+import codecs
+import os
 import sys
 import time
+from collections import deque
 from collections.abc import Collection, Iterable
-from threading import Thread
-from typing import Final, NoReturn, override
+from dataclasses import dataclass
+from io import IncrementalNewlineDecoder
+from itertools import islice
+from typing import BinaryIO, Final, NoReturn, override
 
-from pyrcli.cli import TextProgram, text
+from pyrcli.cli import TextProgram, io, text
 from pyrcli.cli.ansi import ForegroundColors
 from pyrcli.cli.io import InputFile
+from pyrcli.cli.watch import FileWatcher
 
-# Interval in seconds between file content polls when following.
+# Interval in seconds between file polls when following without inotify.
 _POLLING_INTERVAL: Final[float] = 0.5
 
 
+@dataclass(kw_only=True, slots=True)
+class _FollowedFile:
+    """
+    Read state of a followed file.
+
+    - ``stream`` stays open on the followed file, so text written to it after it is renamed or deleted can be read.
+    """
+    decoder: IncrementalNewlineDecoder
+    file_name: str
+    identity: tuple[int, int]
+    missing_since: float | None = None
+    offset: int
+    stream: BinaryIO
+
+
 class _Styles:
     """Namespace for ANSI styling constants."""
     COLON: Final[str] = ForegroundColors.BRIGHT_CYAN
@@ -49,72 +70,68 @@ class Track(TextProgram):
 
         return parser
 
-    @override
-    def post_execute(self, processed_files: Collection[str]) -> None:
-        """Run post-execution logic after all input has been processed."""
-        file_count = len(processed_files)
-
-        if self.args.follow and processed_files:
-            for thread in self.start_following_threads(processed_files, print_file_name_on_update=file_count > 1):
-                thread.join()
-
-    def follow_file(self, file_name: str, print_file_name_on_update: bool) -> None:
+    def follow_files(self, file_names: Iterable[str], *, print_file_name_on_update: bool) -> None:
         """
-        Continuously poll ``file_name`` and print lines appended since the previous read.
+        Print text appended to ``file_names`` as they change, until every file is deleted or inaccessible.
 
-        - The entire file is re-read on each poll; only newly appended lines are printed.
+        - Runs a single event loop for all files; changes are detected with ``FileWatcher``.
         """
-        try:
-            # Get the initial file content.
-            with open(file_name, mode="rt", encoding=self.encoding) as f:
-                previous_content = f.read()
-
-            # Follow file until Ctrl-C.
-            while True:
-                # Re-open the file with each iteration and check for changes.
-                with open(file_name, mode="rt", encoding=self.encoding) as f:
-                    next_content = f.read()
-
-                    if previous_content != next_content:
-                        print_index = 0
-
-                        if next_content.startswith(previous_content):
-                            print_index = len(previous_content)
-                        elif len(next_content) < len(previous_content):
-                            print(f"data removed in: {file_name!r}")
-                        else:
-                            print(f"data modified in: {file_name!r}")
-
-                        if print_file_name_on_update:
-                            self.print_file_header(file_name)
-
-                        print(next_content[print_index:])
-                        previous_content = next_content
-
-                time.sleep(_POLLING_INTERVAL)
-        except FileNotFoundError:
-            self.print_error(f"{file_name!r} has been deleted")
-        except (UnicodeDecodeError, OSError):
-            self.print_error(f"{file_name!r} is no longer accessible")
+        followed_files = {}
+
+        with FileWatcher(polling_interval=_POLLING_INTERVAL) as watcher:
+            # Start at the current end of each file; earlier content has already been printed.
+            for file_name in file_names:
+                try:
+                    watcher.add(file_name)
+                    followed_files[file_name] = self.open_followed_file(file_name, at_end=True)
+                except FileNotFoundError:
+                    self.print_error(f"{file_name!r} has been deleted")
+                except OSError:
+                    self.print_error(f"{file_name!r} is no longer accessible")
+
+            # Follow files until Ctrl-C.
+            try:
+                while followed_files:
+                    # Wake up regularly to re-check missing files, which may be replaced shortly after a rename or
+                    # delete.
+                    changed_file_names = watcher.wait(_POLLING_INTERVAL)
+
+                    # Visit changed and missing files in command-line order.
+                    for file_name in [file_name for file_name, followed_file in followed_files.items()
+                                      if file_name in changed_file_names or followed_file.missing_since is not None]:
+                        if not self.print_appended_text(followed_files[file_name],
+                                                        print_file_name_on_update=print_file_name_on_update):
+                            watcher.remove(file_name)
+                            followed_files.pop(file_name).stream.close()
+
+                    self.out.flush()  # Appended lines must be visible immediately when output is redirected.
+            finally:
+                for followed_file in followed_files.values():
+                    followed_file.stream.close()
 
     @override
     def handle_redirected_input(self, input_lines: Iterable[str]) -> None:
         """Process input received from redirected standard input."""
-        lines = list(input_lines)  # Materialize to a list; required by print_lines to compute line start.
-
         self.print_file_header(file_name="")
-        self.print_lines(lines)
+        self.print_lines(input_lines)
 
     @override
     def handle_terminal_input(self) -> None:
         """Read and process input interactively from the terminal."""
         while True:
-            self.print_lines(sys.stdin.readlines())  # print_lines requires a list to compute line start.
+            self.print_lines(sys.stdin)
+            self.out.flush()
 
             # --follow on standard input is an infinite loop until Ctrl-C.
             if not self.args.follow:
                 return
 
+    def new_follow_decoder(self) -> IncrementalNewlineDecoder:
+        """Return a decoder for appended bytes that keeps split characters and ``"\\r\\n"`` pairs between reads."""
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+
+        return IncrementalNewlineDecoder(decoder, translate=True)
+
     @override
     def normalize_options(self) -> None:
         """Apply derived defaults and adjust option values for consistent internal use."""
@@ -122,41 +139,124 @@ class Track(TextProgram):
         if not self.args.files and not self.args.stdin_files:
             self.args.no_file_name = True
 
+    def open_followed_file(self, file_name: str, *, at_end: bool) -> _FollowedFile:
+        """Open ``file_name`` for following from its current end, or from the start if ``at_end`` is ``False``."""
+        stream = open(file_name, mode="rb")
+        file_stat = os.fstat(stream.fileno())
+
+        return _FollowedFile(decoder=self.new_follow_decoder(), file_name=file_name,
+                             identity=(file_stat.st_dev, file_stat.st_ino), offset=file_stat.st_size if at_end else 0,
+                             stream=stream)
+
+    @override
+    def post_execute(self, processed_files: Collection[str]) -> None:
+        """Run post-execution logic after all input has been processed."""
+        if self.args.follow and processed_files:
+            self.out.flush()  # Write the initial output before following.
+            self.follow_files(processed_files, print_file_name_on_update=len(processed_files) > 1)
+
+    def print_appended_text(self, followed_file: _FollowedFile, *, print_file_name_on_update: bool) -> bool:
+        """
+        Print text appended to ``followed_file`` since the last read; return ``False`` if it can no longer be read.
+
+        - Only bytes past the last read offset are read.
+        - A renamed or replaced file (rotation) is drained to its end, then the new file is followed from the start.
+        - A truncated file (copy-truncate rotation) is followed from the start.
+        - A missing file is drained and reported as deleted only if it is still missing after one polling interval.
+        """
+        file_name = followed_file.file_name
+
+        try:
+            try:
+                file_stat = os.stat(file_name)
+            except FileNotFoundError:
+                self.print_new_text(followed_file, print_file_name_on_update=print_file_name_on_update)
+
+                # Allow one polling interval for the file to be replaced, as when a log is rotated.
+                if followed_file.missing_since is None:
+                    followed_file.missing_since = time.monotonic()
+                    return True
+
+                if time.monotonic() - followed_file.missing_since < _POLLING_INTERVAL:
+                    return True
+
+                self.print_error(f"{file_name!r} has been deleted")
+                return False
+
+            followed_file.missing_since = None
+
+            if (file_stat.st_dev, file_stat.st_ino) != followed_file.identity:
+                # Finish the rotated file before switching to the new one.
+                self.print_new_text(followed_file, print_file_name_on_update=print_file_name_on_update)
+                new_file = self.open_followed_file(file_name, at_end=False)
+
+                followed_file.stream.close()
+                followed_file.decoder = new_file.decoder
+                followed_file.identity = new_file.identity
+                followed_file.offset = new_file.offset
+                followed_file.stream = new_file.stream
+                self.print_notice(f"{file_name!r} has been replaced; following new file")
+            elif file_stat.st_size < followed_file.offset:
+                followed_file.decoder = self.new_follow_decoder()
+                followed_file.offset = 0
+                self.print_notice(f"{file_name!r} has been truncated")
+            elif file_stat.st_size == followed_file.offset:
+                return True
+
+            self.print_new_text(followed_file, print_file_name_on_update=print_file_name_on_update)
+        except (UnicodeDecodeError, OSError):
+            self.print_error(f"{file_name!r} is no longer accessible")
+            return False
+
+        return True
+
     def print_file_header(self, file_name: str) -> None:
         """Print the file header for ``file_name``."""
         if self.should_print_file_header():
-            print(self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME, colon_style=_Styles.COLON))
+            file_header = self.format_file_header(file_name, file_name_style=_Styles.FILE_NAME,
+                                                  colon_style=_Styles.COLON)
+
+            self.out.write_line(file_header)
 
-    def print_lines(self, lines: Collection[str]) -> None:
-        """Print lines to standard output."""
-        # Negative --lines: skip the first N lines.
+    def print_lines(self, lines: Iterable[str]) -> None:
+        """Print the last N lines, or skip the first N lines when ``--lines`` is negative; holds at most N lines."""
         if self.args.lines < 0:
-            start_index = abs(self.args.lines)
+            self.out.write_lines(islice(text.iter_normalized_lines(lines), -self.args.lines, None))
         else:
-            # Positive --lines: print the last N lines.
-            start_index = len(lines) - self.args.lines
+            self.out.write_lines(text.iter_normalized_lines(deque(lines, maxlen=self.args.lines)))
+
+    def print_new_text(self, followed_file: _FollowedFile, *, print_file_name_on_update: bool) -> None:
+        """Print the bytes of ``followed_file.stream`` past the read offset and advance the offset."""
+        followed_file.stream.seek(followed_file.offset)
+        data = followed_file.stream.read()
+
+        if not data:
+            return
+
+        followed_file.offset += len(data)
 
-        for index, line in enumerate(text.iter_normalized_lines(lines), start=1):
-            if index > start_index:
-                print(line)
+        if print_file_name_on_update:
+            self.print_file_header(followed_file.file_name)
+
+        self.out.write_line(followed_file.decoder.decode(data))
+
+    def print_notice(self, message: str) -> None:
+        """Print an informational ``message`` to standard error after pending output; does not set the error flag."""
+        self.out.flush()
+        print(f"{self.name}: {message}", file=sys.stderr)
 
     @override
     def process_input_file(self, input_file: InputFile) -> None:
         """Process the text stream from ``input_file``."""
         self.print_file_header(input_file.file_name)
-        self.print_lines(input_file.text_stream.readlines())
 
-    def start_following_threads(self, files: Iterable[str], *, print_file_name_on_update: bool) -> list[Thread]:
-        """Start a thread for each file and return the started ``Thread`` objects."""
-        threads = []
+        # Read regular files backward from the end; pipes and other streams must be read from the start.
+        if self.args.lines >= 0 and input_file.text_stream.seekable():
+            lines = io.read_last_lines(input_file.text_stream.buffer, self.args.lines, encoding=self.encoding)
 
-        for file_name in files:
-            thread = Thread(target=self.follow_file, args=(file_name, print_file_name_on_update),
-                            name=f"following-{file_name!r}")
-            thread.start()
-            threads.append(thread)
-
-        return threads
+            self.out.write_lines(text.iter_normalized_lines(lines))
+        else:
+            self.print_lines(input_file.text_stream)
 
 
 def main() -> int | NoReturn:
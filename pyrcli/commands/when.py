@@ -68,8 +68,8 @@ class When(CLIProgram):
             now = datetime.datetime.now()
 
             try:
-                print()
-                print(now.strftime(date_format))
+                self.out.write_line()
+                self.out.write_line(now.strftime(date_format))
             except ValueError:  # Raised for invalid format directives on Windows; unreachable on POSIX.
                 self.print_error_and_exit("invalid datetime format")
 
@@ -102,8 +102,8 @@ class When(CLIProgram):
         month = text_calendar.formatmonth(date.year, date.month, w=0, l=0).splitlines()
 
         # Print year header and the days of the week.
-        print(month[0])
-        print(month[1])
+        self.out.write_line(month[0])
+        self.out.write_line(month[1])
 
         # Print weeks highlighting the current day of the month.
         # Pad day to two characters; ensures " 1" cannot match " 11".
@@ -117,7 +117,7 @@ class When(CLIProgram):
                 output = output.replace(day, self.highlight(day))
                 found_day = True
 
-            print(output)
+            self.out.write_line(output)
 
     def print_quarter(self, text_calendar: calendar.TextCalendar) -> None:
         """Print all months in the current quarter."""
@@ -127,8 +127,8 @@ class When(CLIProgram):
         year = text_calendar.formatyear(date.year, w=2, l=1, c=6, m=3).splitlines()  # Use defaults for consistency.
 
         # Print year header and empty line.
-        print(year[0])
-        print()
+        self.out.write_line(year[0])
+        self.out.write_line()
 
         # Find current quarter.
         quarter_header_index = 2
@@ -143,8 +143,8 @@ class When(CLIProgram):
         year[quarter_header_index] = year[quarter_header_index].replace(month_name, self.highlight(month_name))
 
         # Print month names and weekdays.
-        print(year[quarter_header_index])
-        print(year[quarter_header_index + 1])
+        self.out.write_line(year[quarter_header_index])
+        self.out.write_line(year[quarter_header_index + 1])
 
         # Print weeks highlighting the current day of the month.
         # Pad day to two characters; ensures " 1" cannot match " 11".
@@ -162,7 +162,7 @@ class When(CLIProgram):
                 output = self.highlight_day_within_bounds(output, day, quarter_bounds)
                 found_day = True
 
-            print(output)
+            self.out.write_line(output)
 
     def print_year(self, text_calendar: calendar.TextCalendar) -> None:
         """Print all months in the current year."""
@@ -187,7 +187,7 @@ class When(CLIProgram):
                 output = self.highlight_day_within_bounds(output, day, quarter_bounds)
                 found_day = True
 
-            print(output)
+            self.out.write_line(output)
 
 
 def main() -> int | NoReturn:
@@ -0,0 +1,37 @@
+import io
+import sys
+import unittest
+from typing import final
+from unittest import mock
+
+from pyrcli.commands.dupe import Dupe
+
+
+@final
+class TestDupe(unittest.TestCase):
+    """Test the dupe command."""
+
+    def test_digest_matches_grouping(self) -> None:
+        """Test that --digest prints the same groups as grouping whole lines, including for piped carriage returns."""
+        contents = (
+            b"a\nb\na\nc\nb\na\n",
+            b"a\r\nb\ra\n",
+            b"a\r\nb\r\na\r\nc\r\n",
+        )
+
+        def run_dupe(*args: str, content: bytes) -> str:
+            """Run dupe with ``args`` on piped ``content`` and return its output."""
+            stdin = io.TextIOWrapper(io.BytesIO(content), encoding="utf-8", newline="\n")
+            stdout = io.StringIO()
+
+            with mock.patch.object(sys, "argv", ["dupe", *args]), mock.patch.object(sys, "stdin", stdin), \
+                    mock.patch.object(sys, "stdout", stdout):
+                Dupe().run()
+
+            return stdout.getvalue()
+
+        for content in contents:
+            for print_option in ("-c", "-d", "-u", "-g"):
+                with self.subTest(content=content, print_option=print_option):
+                    self.assertEqual(run_dupe(print_option, "--digest", "--color=off", content=content),
+                                     run_dupe(print_option, "--color=off", content=content))
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import unittest
+from typing import final
+from unittest import mock
+
+import requests
+
+from pyrcli.cli.http import async_client, client, get_body
+
+
+@final
+class TestHttp(unittest.IsolatedAsyncioTestCase):
+    """Test the http modules."""
+
+    async def asyncSetUp(self) -> None:
+        """Start a local HTTP/1.1 stub server that echoes each request as JSON."""
+        self.active_requests = 0
+        self.connection_count = 0
+        self.most_active_requests = 0
+        self.server = await asyncio.start_server(self.handle_connection, "127.0.0.1", 0)
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+
+    async def asyncTearDown(self) -> None:
+        """Close pooled client connections and stop the stub server."""
+        client.close_session()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer requests on one kept-alive connection until the client closes it.
+
+        - ``/slow`` waits before answering, ``/missing`` answers 404, and ``/text`` answers a non-JSON body.
+        """
+        self.connection_count += 1
+
+        try:
+            while request_line := await reader.readline():
+                method, target, _ = request_line.decode().split(" ", maxsplit=2)
+                headers = {}
+
+                while (header_line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = header_line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.active_requests += 1
+                self.most_active_requests = max(self.most_active_requests, self.active_requests)
+
+                if target.startswith("/slow"):
+                    await asyncio.sleep(0.02)
+
+                self.active_requests -= 1
+                status = "404 Not Found" if target == "/missing" else "200 OK"
+                response_body = b"not json" if target == "/text" else json.dumps({
+                    "method": method,
+                    "target": target,
+                    "accept": headers.get("accept"),
+                    "authorization": headers.get("authorization"),
+                    "content_type": headers.get("content-type"),
+                    "body": body.decode(),
+                }).encode()
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Length: {len(response_body)}\r\n\r\n".encode() +
+                             response_body)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_async_client(self) -> None:
+        """Test the async_client module."""
+        errors = []
+
+        # 1) GET builds the same headers as client.get and returns a response that get_body decodes.
+        response = await async_client.get(f"{self.url}/items", params={"q": "a b"},
+                                          auth_headers={"Authorization": "Bearer token"})
+        self.assertEqual(get_body(response, on_error=errors.append), {
+            "method": "GET",
+            "target": "/items?q=a+b",
+            "accept": "application/json",
+            "authorization": "Bearer token",
+            "content_type": None,
+            "body": "",
+        })
+        self.assertEqual(errors, [])
+
+        # 2) POST and PUT serialize data to JSON, or send it as a form when serialize_to_json is False.
+        body = get_body(await async_client.post(f"{self.url}/items", data={"name": "a"}), on_error=errors.append)
+        self.assertEqual((body["method"], body["content_type"], body["body"]),
+                         ("POST", "application/json", '{"name": "a"}'))
+        body = get_body(await async_client.put(f"{self.url}/items/1", data={"name": "b"}, serialize_to_json=False),
+                        on_error=errors.append)
+        self.assertEqual((body["method"], body["content_type"], body["body"]),
+                         ("PUT", "application/x-www-form-urlencoded; charset=utf-8", "name=b"))
+
+        # 3) DELETE.
+        body = get_body(await async_client.delete(f"{self.url}/items/1", accept="*/*"), on_error=errors.append)
+        self.assertEqual((body["method"], body["accept"]), ("DELETE", "*/*"))
+        self.assertEqual(errors, [])
+
+        # 4) Error statuses raise only when raise_on_error is True, and get_body reports invalid JSON.
+        self.assertEqual((await async_client.get(f"{self.url}/missing")).status_code, 404)
+
+        with self.assertRaises(requests.HTTPError):
+            await async_client.get(f"{self.url}/missing", raise_on_error=True)
+
+        self.assertIsNone(get_body(await async_client.get(f"{self.url}/text"), on_error=errors.append))
+        self.assertEqual(errors, ["response body is not valid json"])
+
+    async def test_client_session(self) -> None:
+        """Test connection reuse through the client module's session."""
+        # 1) Requests reuse one kept-alive connection.
+        for _ in range(3):
+            response = await asyncio.to_thread(client.get, f"{self.url}/items")
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.connection_count, 1)
+
+        # 2) set_pool_size and close_session close the session, so the next request opens a new connection.
+        client.set_pool_size(2)
+        await asyncio.to_thread(client.get, f"{self.url}/items")
+        self.assertEqual(self.connection_count, 2)
+
+        client.close_session()
+        await asyncio.to_thread(client.get, f"{self.url}/items")
+        self.assertEqual(self.connection_count, 3)
+
+        # 3) Concurrent first requests share one session.
+        client.close_session()
+
+        with mock.patch.object(requests, "Session", wraps=requests.Session) as session_class:
+            await async_client.gather(async_client.get(f"{self.url}/slow/{index}") for index in range(8))
+
+        self.assertEqual(session_class.call_count, 1)
+        client.set_pool_size(10)
+
+    async def test_gather(self) -> None:
+        """Test the gather function."""
+        # 1) Results are returned in order, with no more than limit requests in progress at once.
+        responses = await async_client.gather((async_client.get(f"{self.url}/slow/{index}") for index in range(12)),
+                                              limit=3)
+        self.assertEqual([response.json()["target"] for response in responses],
+                         [f"/slow/{index}" for index in range(12)])
+        self.assertLessEqual(self.most_active_requests, 3)
+        self.assertGreater(self.most_active_requests, 1)
+
+        # 2) Exceptions are raised, or returned in place when return_exceptions is True.
+        with self.assertRaises(requests.HTTPError):
+            await async_client.gather([async_client.get(f"{self.url}/missing", raise_on_error=True)])
+
+        results = await async_client.gather([async_client.get(f"{self.url}/items"),
+                                             async_client.get(f"{self.url}/missing", raise_on_error=True)],
+                                            return_exceptions=True)
+        self.assertEqual(results[0].status_code, 200)
+        self.assertIsInstance(results[1], requests.HTTPError)
+
+        # 3) Invalid limit.
+        with self.assertRaises(ValueError) as context:
+            await async_client.gather([], limit=0)
+
+        self.assertEqual(str(context.exception), "invalid concurrency limit: 0")
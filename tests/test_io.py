@@ -1,7 +1,11 @@
 import os
+import tempfile
+import time
 import unittest
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
 from typing import final
+from unittest import mock
 
 from pyrcli.cli import io
 
@@ -18,6 +22,145 @@ class TestIO(unittest.TestCase):
         for path in io.iter_descendant_paths(Path("/"), max_depth=1):
             self.assertIsInstance(path, Path)
 
+    def test_iter_path_entries(self) -> None:
+        """Test the iter_path_entries function and the PathEntry class."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.makedirs(os.path.join(temp_dir, "a", "b"))
+
+            with open(os.path.join(temp_dir, "a", "file.txt"), mode="w") as f:
+                f.write("text")
+
+            with open(os.path.join(temp_dir, "empty.txt"), mode="w"):
+                pass
+
+            os.symlink(os.path.join(temp_dir, "a"), os.path.join(temp_dir, "link"))
+            root = io.PathEntry.from_path(temp_dir + "/")
+
+            # 1) Starting points are normalized like pathlib.Path.
+            self.assertEqual((root.path, root.name, root.parent, root.depth),
+                             (temp_dir, os.path.basename(temp_dir), os.path.dirname(temp_dir), 0))
+
+            # 2) Paths are visited in the same order as os.walk, and symbolic links to directories are not traversed.
+            entries = list(io.iter_path_entries(root))
+            self.assertEqual([entry.path for entry in entries],
+                             [str(path) for path in io.iter_descendant_paths(Path(temp_dir))])
+            self.assertEqual(sorted(os.path.relpath(entry.path, temp_dir) for entry in entries),
+                             ["a", os.path.join("a", "b"), os.path.join("a", "file.txt"), "empty.txt", "link"])
+
+            # 3) File types, emptiness, and lstat() results come from the entries.
+            entries_by_name = {entry.name: entry for entry in entries}
+            self.assertTrue(entries_by_name["a"].is_dir())
+            self.assertTrue(entries_by_name["link"].is_dir())
+            self.assertTrue(entries_by_name["link"].is_symlink())
+            self.assertTrue(entries_by_name["b"].is_empty())
+            self.assertFalse(entries_by_name["a"].is_empty())
+            self.assertTrue(entries_by_name["empty.txt"].is_empty())
+            self.assertEqual(entries_by_name["file.txt"].lstat().st_size, 4)
+            self.assertEqual((entries_by_name["b"].depth, entries_by_name["b"].parent),
+                             (2, os.path.join(temp_dir, "a")))
+
+            # 4) Subdirectories deeper than max_depth are not traversed.
+            self.assertEqual(sorted(entry.name for entry in io.iter_path_entries(root, max_depth=1)),
+                             ["a", "empty.txt", "link"])
+
+            # 5) Threads list the same entries; sorted entries are yielded in the same order for any thread count.
+            sorted_paths = [entry.path for entry in io.iter_path_entries(root, sort_entries=True)]
+            self.assertEqual([os.path.relpath(path, temp_dir) for path in sorted_paths],
+                             ["a", "link", "empty.txt", os.path.join("a", "b"), os.path.join("a", "file.txt")])
+            self.assertEqual([entry.path for entry in io.iter_path_entries(root, sort_entries=True, thread_count=4)],
+                             sorted_paths)
+            self.assertCountEqual([entry.path for entry in io.iter_path_entries(root, thread_count=4)], sorted_paths)
+
+    def test_iter_path_entries_bounds_listings(self) -> None:
+        """Test that threads list at most a bounded number of directories ahead of the consumer."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(50):
+                os.makedirs(os.path.join(temp_dir, f"d{index:02}", "sub"))
+
+            root = io.PathEntry.from_path(temp_dir)
+            max_listings = io._LISTINGS_PER_THREAD * 2
+
+            for sort_entries in (True, False):
+                with mock.patch.object(io, "_list_directory", wraps=io._list_directory) as list_directory:
+                    path_entries = io.iter_path_entries(root, sort_entries=sort_entries, thread_count=2)
+                    next(path_entries)
+
+                    # Give the threads time to run ahead of a slow consumer.
+                    time.sleep(0.2)
+                    self.assertLessEqual(list_directory.call_count, max_listings + 1)
+
+                    self.assertEqual(sum(1 for _ in path_entries), 99)
+                    self.assertEqual(list_directory.call_count, 101)
+
+    def test_mapped_lines(self) -> None:
+        """Test the MappedLines class."""
+        contents = (
+            b"",
+            b"a\nb\n",
+            b"a\nb",
+            b"a\r\nb\rc\n\nd",
+            "caf\u00e9\n".encode("utf-8"),
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_name = os.path.join(temp_dir, "mapped.txt")
+
+            for content in contents:
+                with open(file_name, mode="wb") as f:
+                    f.write(content)
+
+                with open(file_name, encoding="utf-8") as f:
+                    text_lines = f.readlines()
+
+                for input_file in io.open_text_files([file_name], encoding="utf-8", memory_map=True, on_error=print):
+                    mapped_lines = input_file.mapped_lines
+
+                    # 1) Empty files are not mapped.
+                    if not content:
+                        self.assertIsNone(mapped_lines)
+                        continue
+
+                    # 2) Line counts match text-mode reads.
+                    self.assertEqual(mapped_lines.count_lines(), len(text_lines))
+
+                    # 3) Character counts and decoded blocks match text-mode reads.
+                    self.assertEqual(mapped_lines.count_characters(), len("".join(text_lines)))
+                    self.assertEqual("".join(mapped_lines.iter_decoded_blocks()), "".join(text_lines))
+
+            # 4) Bytes that are invalid in the encoding are reported when counting.
+            with open(file_name, mode="wb") as f:
+                f.write(b"a\n\xff\n")
+
+            for input_file in io.open_text_files([file_name], encoding="utf-8", memory_map=True, on_error=print):
+                with self.assertRaises(UnicodeDecodeError):
+                    input_file.mapped_lines.count_lines()
+
+                with self.assertRaises(UnicodeDecodeError):
+                    input_file.mapped_lines.count_characters()
+
+    def test_read_last_lines(self) -> None:
+        """Test the read_last_lines function."""
+        contents = (
+            b"",
+            b"a\nb\nc\n",
+            b"a\nb\nc",
+            b"a\r\nb\rc\n\nd\r",
+            "caf\u00e9\n\u00fcber\n".encode("utf-8"),
+            b"x" * 100_000 + b"\r\n" + b"y\r" * 40_000 + b"z\n" * 40_000,  # Spans several blocks.
+        )
+
+        for content in contents:
+            binary_stream = BytesIO(content)
+            text_lines = TextIOWrapper(BytesIO(content), encoding="utf-8").readlines()
+
+            # 1) Matches the tail of text-mode reads, including counts larger than the line count.
+            for line_count in (1, 2, 3, 50_000, 1_000_000):
+                self.assertEqual(io.read_last_lines(binary_stream, line_count, encoding="utf-8"),
+                                 text_lines[-line_count:])
+
+            # 2) Non-positive counts return no lines.
+            self.assertEqual(io.read_last_lines(binary_stream, 0, encoding="utf-8"), [])
+
     def test_read_text_files(self) -> None:
         """Test the read_text_files function."""
         errors = []
@@ -49,6 +192,47 @@ class TestIO(unittest.TestCase):
         self.assertEqual(len(errors), 1)
         self.assertEqual(errors[0], "'__pycache__': is a directory")
 
+    def test_replace_text_file(self) -> None:
+        """Test the replace_text_file function."""
+        errors = []
+
+        def on_error(error_message: str) -> None:
+            """Callback for on_error."""
+            errors.append(error_message)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_name = os.path.join(temp_dir, "replaced.txt")
+            link_name = os.path.join(temp_dir, "link.txt")
+
+            with open(file_name, mode="w", encoding="utf-8") as f:
+                f.write("old\r\n")
+
+            os.chmod(file_name, 0o640)
+            os.symlink(file_name, link_name)
+
+            # 1) Valid file: contents are replaced and permission bits are kept.
+            io.replace_text_file(file_name, lines=["a\n", "b"], encoding="utf-8", on_error=on_error)
+            self.assertEqual(errors, [])
+            self.assertEqual(Path(file_name).read_bytes(), b"a\nb\n")
+            self.assertEqual(os.stat(file_name).st_mode & 0o777, 0o640)
+
+            # 2) Symbolic links are followed rather than replaced.
+            io.replace_text_file(link_name, lines=["c"], encoding="utf-8", on_error=on_error)
+            self.assertEqual(errors, [])
+            self.assertTrue(os.path.islink(link_name))
+            self.assertEqual(Path(file_name).read_bytes(), b"c\n")
+
+            # 3) Encoding failure: the file is unchanged and no temporary file is left.
+            io.replace_text_file(file_name, lines=["d", "\u20ac"], encoding="iso-8859-1", on_error=on_error)
+            self.assertEqual(errors, [f"{file_name!r}: unable to write with 'iso-8859-1'"])
+            self.assertEqual(Path(file_name).read_bytes(), b"c\n")
+            self.assertEqual(sorted(os.listdir(temp_dir)), ["link.txt", "replaced.txt"])
+            errors.clear()
+
+            # 4) Invalid encoding.
+            io.replace_text_file(file_name, lines=["e"], encoding="invalid", on_error=on_error)
+            self.assertEqual(errors, [f"{file_name!r}: unknown encoding 'invalid'"])
+
     def test_write_text_file(self) -> None:
         """Test the write_text_file function."""
         errors = []
@@ -0,0 +1,75 @@
+import io
+import unittest
+from typing import final
+from unittest import mock
+
+from pyrcli.cli import output
+from pyrcli.cli.output import OutputSink
+
+
+@final
+class TestOutput(unittest.TestCase):
+    """Test the output module."""
+
+    def test_buffered_writes(self) -> None:
+        """Test that output is held until the buffer size is reached or flush() is called."""
+        stream = io.StringIO()
+        sink = OutputSink(stream=stream, buffer_size=16)
+
+        # 1) Pending output is not written.
+        sink.write_line("abc")
+        self.assertEqual(stream.getvalue(), "")
+
+        # 2) Exceeding the buffer size writes all pending output.
+        sink.write_lines(["defghij", "klmnop"])
+        self.assertEqual(stream.getvalue(), "abc\ndefghij\nklmnop\n")
+
+        # 3) flush() writes partial lines.
+        sink.write("q")
+        sink.write("r")
+        sink.flush()
+        self.assertEqual(stream.getvalue(), "abc\ndefghij\nklmnop\nqr")
+
+    def test_line_buffered_writes(self) -> None:
+        """Test that each line is written immediately when line buffering is enabled."""
+        stream = io.StringIO()
+        sink = OutputSink(stream=stream, line_buffered=True)
+
+        # 1) Complete lines are written immediately.
+        sink.write_line("abc")
+        self.assertEqual(stream.getvalue(), "abc\n")
+
+        sink.write_lines(["def", ""])
+        self.assertEqual(stream.getvalue(), "abc\ndef\n\n")
+
+        # 2) Partial lines are held until the line is complete.
+        sink.write("g")
+        self.assertEqual(stream.getvalue(), "abc\ndef\n\n")
+
+        sink.write_line()
+        self.assertEqual(stream.getvalue(), "abc\ndef\n\ng\n")
+
+    def test_binary_stream(self) -> None:
+        """Test that output is encoded with the stream encoding and written through the binary buffer."""
+        binary_stream = io.BytesIO()
+        stream = io.TextIOWrapper(binary_stream, encoding="utf-8", write_through=False)
+        sink = OutputSink(stream=stream)
+
+        # Text written directly to the stream must precede output written by the sink.
+        stream.write("first\n")
+        sink.write_line("señor")
+        sink.flush()
+        self.assertEqual(binary_stream.getvalue(), "first\nseñor\n".encode("utf-8"))
+
+    def test_translated_newlines(self) -> None:
+        """Test that newlines are translated by the text stream where the line separator is not a line feed."""
+        binary_stream = io.BytesIO()
+        stream = io.TextIOWrapper(binary_stream, encoding="utf-8", newline="\r\n", write_through=False)
+        sink = OutputSink(stream=stream)
+
+        with mock.patch.object(output.os, "linesep", "\r\n"):
+            stream.write("first\n")
+            sink.write_lines(["a", "b"])
+            sink.flush()
+
+        self.assertEqual(binary_stream.getvalue(), b"first\r\na\r\nb\r\n")
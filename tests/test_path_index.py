@@ -0,0 +1,161 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from typing import final
+from unittest import mock
+
+from pyrcli.cli import io
+from pyrcli.cli.path_index import PathIndex, find_indexed_root
+
+
+@final
+class TestPathIndex(unittest.TestCase):
+    """Test the path_index module."""
+
+    def test_path_index(self) -> None:
+        """Test building, querying, and incrementally updating a PathIndex."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tree = os.path.join(temp_dir, "tree")
+            os.makedirs(os.path.join(tree, "a", "b"))
+            os.makedirs(os.path.join(tree, "c"))
+
+            for file_name, content in (("a/main.py", "print()"), ("a/b/main_test.py", ""), ("c/notes.txt", "x")):
+                with open(os.path.join(tree, file_name), mode="w") as f:
+                    f.write(content)
+
+            def get_live_paths() -> list[str]:
+                """Return the paths found by traversing the tree."""
+                return sorted(entry.path for entry in io.iter_path_entries(io.PathEntry.from_path(tree)))
+
+            with PathIndex(os.path.join(temp_dir, "index.db")) as path_index:
+                path_index.update(tree)
+
+                # 1) The index records every path under the root.
+                self.assertEqual(path_index.get_roots(), [tree])
+                self.assertEqual(sorted(path.path for path in path_index.iter_paths(tree)), get_live_paths())
+
+                # 2) Queries are narrowed by name literals, type, emptiness, and depth.
+                self.assertEqual([path.name for path in path_index.iter_paths(tree, name_literals=["MAIN"])],
+                                 ["main.py", "main_test.py"])
+                self.assertEqual([path.name for path in path_index.iter_paths(tree, is_dir=True)], ["a", "c", "b"])
+                self.assertEqual([path.name for path in path_index.iter_paths(tree, empty_only=True)], ["main_test.py"])
+                self.assertEqual([path.name for path in path_index.iter_paths(tree, max_depth=1)], ["a", "c"])
+
+                # Subdirectories are read from the index of the root that contains them.
+                subdirectory = os.path.join(tree, "a")
+                self.assertEqual(find_indexed_root(subdirectory, path_index.get_roots()), tree)
+                self.assertIsNone(find_indexed_root(tree + "x", path_index.get_roots()))
+                self.assertEqual([(path.path, path.depth) for path in
+                                  path_index.iter_paths(subdirectory, max_depth=1, indexed_root=tree)],
+                                 [(os.path.join(subdirectory, "b"), 1), (os.path.join(subdirectory, "main.py"), 1)])
+                self.assertEqual([path.path for path in path_index.iter_paths(subdirectory, indexed_root=tree)],
+                                 [os.path.join(subdirectory, "b"), os.path.join(subdirectory, "main.py"),
+                                  os.path.join(subdirectory, "b", "main_test.py")])
+
+                # 3) Updates pick up added and removed paths.
+                shutil.rmtree(os.path.join(tree, "a", "b"))
+                os.remove(os.path.join(tree, "c", "notes.txt"))
+                os.makedirs(os.path.join(tree, "d", "e"))
+                path_index.update(tree)
+                self.assertEqual(sorted(path.path for path in path_index.iter_paths(tree)), get_live_paths())
+                self.assertEqual([path.name for path in path_index.iter_paths(tree, empty_only=True)], ["c", "e"])
+
+            # 4) Indexes are reopened from disk.
+            with PathIndex(os.path.join(temp_dir, "index.db")) as path_index:
+                self.assertEqual(sorted(path.path for path in path_index.iter_paths(tree)), get_live_paths())
+
+            # 5) Relative roots are keyed by absolute path, and paths are yielded relative to the root as queried.
+            working_directory = os.getcwd()
+            other_directory = os.path.join(temp_dir, "other")
+            os.makedirs(os.path.join(other_directory, "tree"))
+
+            try:
+                os.chdir(temp_dir)
+
+                with PathIndex("relative.db") as path_index:
+                    path_index.update("tree")
+                    self.assertEqual(path_index.get_roots(), [os.path.abspath("tree")])
+
+                    os.chdir(other_directory)
+                    self.assertEqual(list(path_index.iter_paths("tree")), [])
+                    relative_tree = os.path.join(os.pardir, "tree")
+                    self.assertEqual(sorted(path.path for path in path_index.iter_paths(relative_tree)),
+                                     sorted(os.path.join(os.pardir, os.path.relpath(path, temp_dir)) for path in
+                                            get_live_paths()))
+
+                    os.chdir(tree)
+                    self.assertEqual(sorted(path.path for path in path_index.iter_paths(os.curdir)),
+                                     sorted(os.path.relpath(path, tree) for path in get_live_paths()))
+            finally:
+                os.chdir(working_directory)
+
+    def test_path_index_other_databases(self) -> None:
+        """Test that databases other than indexes are left untouched."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_name = os.path.join(temp_dir, "other.db")
+
+            with sqlite3.connect(file_name) as connection:
+                connection.execute("CREATE TABLE users (name TEXT)")
+
+            connection.close()
+
+            # 1) Databases with tables but no index are not opened, for queries or updates.
+            for read_only in (True, False):
+                with self.assertRaises(sqlite3.DatabaseError):
+                    PathIndex(file_name, read_only=read_only)
+
+            with sqlite3.connect(file_name) as connection:
+                self.assertEqual(connection.execute("SELECT name FROM sqlite_master").fetchall(), [("users",)])
+
+            connection.close()
+
+            # 2) Empty databases become indexes only when opened for updates.
+            empty_file_name = os.path.join(temp_dir, "empty.db")
+            open(empty_file_name, mode="w").close()
+
+            with self.assertRaises(sqlite3.DatabaseError):
+                PathIndex(empty_file_name, read_only=True)
+
+            with PathIndex(empty_file_name) as path_index:
+                self.assertEqual(path_index.get_roots(), [])
+
+            with PathIndex(empty_file_name, read_only=True) as path_index:
+                self.assertEqual(path_index.get_roots(), [])
+
+    def test_path_index_unreadable_directories(self) -> None:
+        """Test that directories that cannot be listed are reported and never indexed as empty."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tree = os.path.join(temp_dir, "tree")
+            locked_directory = os.path.join(tree, "locked")
+            os.makedirs(locked_directory)
+            os.makedirs(os.path.join(tree, "empty"))
+
+            with open(os.path.join(locked_directory, "secret.txt"), mode="w") as f:
+                f.write("x")
+
+            list_readable_directory = io._list_directory
+
+            def list_directory(directory: io.PathEntry, *, sort_entries: bool) -> object:
+                """List ``directory`` unless it is the locked directory, as if it were not readable."""
+                if directory.path == locked_directory:
+                    raise PermissionError(locked_directory)
+
+                return list_readable_directory(directory, sort_entries=sort_entries)
+
+            errors = []
+
+            with PathIndex(os.path.join(temp_dir, "index.db")) as path_index:
+                # 1) Unreadable directories are reported and are not empty.
+                with mock.patch.object(io, "_list_directory", side_effect=list_directory):
+                    path_index.update(tree, on_error=errors.append)
+
+                self.assertEqual(errors, [f"{locked_directory!r}: permission denied"])
+                self.assertEqual([path.name for path in path_index.iter_paths(tree, empty_only=True)], ["empty"])
+                self.assertEqual([path.name for path in path_index.iter_paths(tree)], ["empty", "locked"])
+
+                # 2) They are listed again once readable, even though their modification time is unchanged.
+                path_index.update(tree)
+                self.assertEqual([path.name for path in path_index.iter_paths(tree)],
+                                 ["empty", "locked", "secret.txt"])
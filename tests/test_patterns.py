@@ -1,7 +1,10 @@
+import os
 import re
+import tempfile
 import unittest
+from unittest import mock
 
-from pyrcli.cli import patterns
+from pyrcli.cli import io, patterns
 
 
 class TestCompileAnyPattern(unittest.TestCase):
@@ -31,6 +34,30 @@ class TestCompileAnyPattern(unittest.TestCase):
 
         self.assertTrue(combined.search("abc"))
 
+    def test_many_literals_match_like_alternation(self):
+        literals = [f"w{index}x" for index in range(20)] + ["foo", "bar", "baz"]
+        test_patterns = patterns.compile_patterns(literals, ignore_case=False, on_error=print)
+        combined = patterns.compile_or_pattern(test_patterns, ignore_case=False)
+        alternation = re.compile("|".join(literals))
+
+        for text in ("foo bar", "xbazbarx", "ba", "w1xw12xw3", "w1w12x", ""):
+            self.assertEqual(combined.sub("<>", text), alternation.sub("<>", text))
+
+    def test_literals_with_shared_prefix_keep_leftmost_first_order(self):
+        # "ab" is a prefix of "abc": the alternation prefers the first listed literal at each position.
+        literals = ["ab", "abc"] + [f"w{index}x" for index in range(20)]
+        test_patterns = patterns.compile_patterns(literals, ignore_case=False, on_error=print)
+        combined = patterns.compile_or_pattern(test_patterns, ignore_case=False)
+
+        self.assertEqual(combined.sub("-", "abcw3x"), "-c-")
+
+    def test_many_literals_ignore_case(self):
+        literals = ["Foo", "BAR", "baz"] + [f"w{index}x" for index in range(20)]
+        test_patterns = patterns.compile_patterns(literals, ignore_case=True, on_error=print)
+        combined = patterns.compile_or_pattern(test_patterns, ignore_case=True)
+
+        self.assertEqual(combined.sub("-", "fOO Bar BAZ W7X qux"), "- - - - qux")
+
     def test_empty_pattern_list(self):
         combined = patterns.compile_or_pattern([], ignore_case=False)
 
@@ -38,6 +65,92 @@ class TestCompileAnyPattern(unittest.TestCase):
         self.assertTrue(combined.search("anything"))
 
 
+class TestCompileMappingPattern(unittest.TestCase):
+    def test_literal_keys_are_replaced_in_one_pass(self):
+        replacements = {"alice": "<a>", "bob": "<b>", "<a>": "never"}
+        replacements |= {f"w{index}x": str(index) for index in range(20)}
+        pattern, replacer = patterns.compile_mapping_pattern(replacements, ignore_case=False, on_error=print)
+
+        # Replacements are not matched again.
+        self.assertEqual(pattern.sub(replacer, "alice met bob at w7x"), "<a> met <b> at 7")
+
+    def test_literal_keys_ignore_case(self):
+        replacements = {"Alice": "<a>", "s": "<s>"}
+        pattern, replacer = patterns.compile_mapping_pattern(replacements, ignore_case=True, on_error=print)
+
+        self.assertEqual(pattern.sub(replacer, "ALICE \u017f"), "<a> <s>")
+
+    def test_regex_keys_are_replaced_by_group(self):
+        # Replacements are inserted literally, without expanding backslashes.
+        replacements = {"(a)(b)": "1", "[0-9]+": "\\N", "c(d)?": "3"}
+        pattern, replacer = patterns.compile_mapping_pattern(replacements, ignore_case=False, on_error=print)
+
+        self.assertEqual(pattern.sub(replacer, "ab 42 cd c"), "1 \\N 3 3")
+
+    def test_regex_keys_with_backreferences(self):
+        # Backreferences refer to the key's own groups, even after other keys.
+        replacements = {"a": "A", r"(b)\1": "B", r"(?P<c>c)(?P=c)": "C", r"(\w)(?(1)\1)": "D"}
+        pattern, replacer = patterns.compile_mapping_pattern(replacements, ignore_case=False, on_error=print)
+
+        self.assertEqual(pattern.sub(replacer, "ab bb aa cc dd"), "Ab B AA C D")
+        self.assertEqual(pattern.sub(replacer, "ab bb aa", count=2), "Ab B aa")
+
+    def test_regex_keys_that_cannot_be_combined(self):
+        # Keys that reuse a group name, or set global inline flags, are matched separately.
+        for replacements, text, expected in (({"(?P<x>a)": "1", "(?P<x>b)": "2"}, "abc", "12c"),
+                                             ({"(?i)x": "1", "y+": "2"}, "XxyyZ", "112Z")):
+            pattern, replacer = patterns.compile_mapping_pattern(replacements, ignore_case=False, on_error=print)
+
+            self.assertIsInstance(pattern, patterns.PatternAlternation)
+            self.assertEqual(pattern.sub(replacer, text), expected)
+
+    def test_pattern_alternation_matches_like_alternation(self):
+        # Empty matches, lookarounds, anchors, and lazy quantifiers match as in a single alternation.
+        keys = ["x*?", "(?=a)", "a*", "^", "b??", r"\b", "$"]
+
+        for text in ("", "xa  xb  ", "aab", "bxxa b"):
+            for count in range(3):
+                alternation = patterns.PatternAlternation([re.compile(key) for key in keys])
+                combined = re.compile("|".join(f"(?:{key})" for key in keys))
+
+                self.assertEqual(alternation.sub("<\\g<0>>", text, count=count),
+                                 combined.sub("<\\g<0>>", text, count=count))
+
+    def test_pattern_alternation_in_place(self):
+        # In-place replacement searches each line for a first match before rewriting the file.
+        replacements = {"aa": "X", r"(b)\1": "Y"}
+        pattern, replacer = patterns.compile_mapping_pattern(replacements, ignore_case=False, on_error=print)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_name = os.path.join(temp_dir, "file.txt")
+            io.write_text_file(file_name, lines=["cc\n", "abba\n", "aa\n"], encoding="utf-8", on_error=print)
+
+            with open(file_name, encoding="utf-8") as f:
+                lines = f.readlines()
+
+            self.assertIsInstance(pattern, patterns.PatternAlternation)
+            self.assertIsNone(pattern.search(lines[0]))
+            self.assertEqual(pattern.search(lines[1]).group(), "bb")
+            io.replace_text_file(file_name, lines=(pattern.sub(replacer, line) for line in lines), encoding="utf-8",
+                                 on_error=print)
+
+            with open(file_name, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "cc\naYa\nX\n")
+
+    def test_first_key_wins(self):
+        replacements = {"ab": "1", "abc": "2"}
+        pattern, replacer = patterns.compile_mapping_pattern(replacements, ignore_case=False, on_error=print)
+
+        self.assertEqual(pattern.sub(replacer, "abc"), "1c")
+
+    def test_invalid_and_empty_keys(self):
+        errors = []
+
+        self.assertIsNone(patterns.compile_mapping_pattern({"": "x", "[": "y"}, ignore_case=False,
+                                                           on_error=errors.append))
+        self.assertEqual(errors, ["invalid pattern: '['"])
+
+
 class TestCompilePatterns(unittest.TestCase):
     def test_compile_valid_patterns(self):
         test_patterns = ["abc", "def"]
@@ -91,6 +204,41 @@ class TestCompilePatterns(unittest.TestCase):
         self.assertEqual(len(errors), 2)
 
 
+class TestLiteralPattern(unittest.TestCase):
+    def test_literals_compile_to_literal_patterns(self):
+        compiled = patterns.compile_patterns(["req-42", "a b", "a.b", "x+"], ignore_case=False, on_error=print)
+
+        self.assertEqual([isinstance(p, patterns.LiteralPattern) for p in compiled], [True, True, False, False])
+
+    def test_search_matches_regex(self):
+        for ignore_case in (False, True):
+            flags = re.IGNORECASE if ignore_case else re.NOFLAG
+            literal = patterns.LiteralPattern("Ab", ignore_case=ignore_case)
+            regex = re.compile("Ab", flags=flags)
+
+            for text in ("xAby", "xaby", "ABAB", "a b", "", "caf\u00e9 ab"):
+                expected = regex.search(text)
+                actual = literal.search(text)
+
+                self.assertEqual(actual and actual.span(), expected and expected.span())
+                self.assertEqual(literal.contains(text), expected is not None)
+                self.assertEqual(literal.sub("-", text), regex.sub("-", text))
+                self.assertEqual([m.span() for m in literal.finditer(text)], [m.span() for m in regex.finditer(text)])
+
+    def test_ignore_case_follows_unicode_case_folding(self):
+        # re.IGNORECASE matches "s" with LATIN SMALL LETTER LONG S, which str.lower() does not.
+        literal = patterns.LiteralPattern("s", ignore_case=True)
+
+        self.assertTrue(literal.search("\u017f"))
+        self.assertTrue(literal.contains("\u017f"))
+
+    def test_matches_all_patterns_does_not_run_regex(self):
+        literal = patterns.LiteralPattern("ab", ignore_case=False)
+
+        with mock.patch.object(patterns.LiteralPattern, "search", side_effect=AssertionError):
+            self.assertTrue(patterns.matches_all_patterns("xaby", compiled_patterns=[literal]))
+
+
 class TestMatchesAllPatterns(unittest.TestCase):
     def test_all_patterns_match(self):
         text = "abcdef"
@@ -1,3 +1,6 @@
+import io
+import itertools
+import shlex
 import unittest
 from typing import final
 
@@ -115,6 +118,97 @@ class TestText(unittest.TestCase):
         raw = 'a "b '
         self.assertEqual(text.split_shell_tokens(raw), [raw])
 
+        # 5) Comments end the tokens, also within a word; a comment followed by another line is left to shlex.
+        self.assertEqual(text.split_shell_tokens("a b#c 'd"), ["a", "b"])
+        self.assertEqual(text.split_shell_tokens("a # b\nc"), ["a", "c"])
+
+        # 6) Every text built from up to four pieces splits as shlex splits it.
+        def split_with_shlex(raw_text: str, literal_quotes: bool) -> list[str]:
+            """Return the tokens of ``raw_text`` split with shlex, or a single field when shlex raises ValueError."""
+            lexer = shlex.shlex(raw_text, posix=True, punctuation_chars=False)
+            lexer.whitespace_split = True
+
+            if literal_quotes:
+                lexer.quotes = ""
+
+            try:
+                return list(lexer)
+            except ValueError:
+                return [raw_text]
+
+        pieces = ("a", " ", "'", '"', "\\", "#", "\n", "\t", "b c", "\v")
+
+        for piece_count in range(1, 5):
+            for raw in map("".join, itertools.product(pieces, repeat=piece_count)):
+                for literal_quotes in (False, True):
+                    self.assertEqual(text.split_shell_tokens(raw, literal_quotes=literal_quotes),
+                                     split_with_shlex(raw, literal_quotes), msg=repr(raw))
+
+    def test_splitter(self) -> None:
+        """Test the Splitter class."""
+        # 1) CSV mode matches split_csv for quoted, unquoted, empty, and multi-character separator input.
+        for separator in (" ", ",", r"\t", "::", '"'):
+            splitter = text.Splitter("csv", separator=separator)
+
+            for line in ("a  b", 'a,"b,c",d', "a\tb::c", "", 'x"y"z'):
+                self.assertEqual(splitter.split(line), text.split_csv(line, separator=separator, on_error=print))
+
+        # 2) Regex and shell modes.
+        self.assertEqual(text.Splitter("regex", pattern="x", ignore_case=True).split("Xbox3"), ["", "bo", "3"])
+        self.assertEqual(text.Splitter("shell").split('a "b c" d'), ["a", "b c", "d"])
+        self.assertEqual(text.Splitter("shell", literal_quotes=True).split('a "b c"'), ["a", '"b', 'c"'])
+
+        # 3) Splitting many lines.
+        self.assertEqual(list(text.Splitter("csv", separator=",").split_lines(["a,b", "c"])), [["a", "b"], ["c"]])
+
+        # 4) Splitting streams reads quoted CSV fields across lines and strips newlines in other modes.
+        self.assertEqual(list(text.Splitter("csv", separator=",").split_stream(io.StringIO('a,"b\nc"\nd,e\n'))),
+                         [["a", "b\nc"], ["d", "e"]])
+        self.assertEqual(list(text.Splitter("regex", pattern=",").split_stream(io.StringIO("a,b\nc\n"))),
+                         [["a", "b"], ["c"]])
+
+        # A quoted field left open at the end of the stream does not keep the last newline.
+        for max_fields in (None, 1, 4):
+            splitter = text.Splitter("csv", separator=",", max_fields=max_fields)
+            self.assertEqual(list(splitter.split_stream(io.StringIO('"abc\n'))), [["abc"]])
+            self.assertEqual(list(splitter.split_stream(io.StringIO('x\n"a,b\nc\n'))), [["x"], ["a,b\nc"]])
+
+        # 5) Field limits return the same fields as splitting everything, counting only non-empty fields when dropping.
+        cases = (
+            ("csv", {"separator": ","}, ('a,,b,"c,d",e', '"a""b",,"c', ',"x"y,z,"w', "a,b")),
+            ("csv", {"separator": " "}, ("a   b  c d", '  "a b"  c')),
+            ("csv", {"separator": "::"}, ("a::::b::c",)),
+            ("regex", {"pattern": r"(,)"}, ("a,,b,c",)),
+            ("regex", {"pattern": r"\s*"}, (" ab c",)),
+            ("shell", {}, ('a "" b c', "a b 'c", "a b c\\")),
+        )
+
+        for mode, settings, lines in cases:
+            for drop_empty in (False, True):
+                for max_fields in range(1, 5):
+                    splitter = text.Splitter(mode, **settings, drop_empty=drop_empty, max_fields=max_fields)
+
+                    for line in lines:
+                        fields = text.Splitter(mode, **settings).split(line)
+                        expected = [field for field in fields if field or not drop_empty][:max_fields]
+                        self.assertEqual(splitter.split(line), expected)
+
+        # 6) Field-limited streams read quoted CSV fields across lines.
+        splitter = text.Splitter("csv", separator=",", drop_empty=True, max_fields=2)
+        self.assertEqual(list(splitter.split_stream(io.StringIO(',a,"b\nc",d\n"e""",f,g\n'))),
+                         [["a", "b\nc"], ['e"', "f"]])
+
+        # 7) Invalid settings raise ValueError at construction.
+        for mode, settings, message in (("csv", {"separator": ""}, "invalid separator: ''"),
+                                        ("csv", {"separator": "\\x"}, "invalid separator: '\\\\x'"),
+                                        ("regex", {"pattern": "("}, "invalid pattern: '('"),
+                                        ("csv", {"max_fields": 0}, "invalid field limit: 0"),
+                                        ("fixed", {}, "invalid mode: 'fixed'")):
+            with self.assertRaises(ValueError) as context:
+                text.Splitter(mode, **settings)
+
+            self.assertEqual(str(context.exception), message)
+
     def test_strip_trailing_newline(self) -> None:
         """Test the strip_trailing_newline function."""
         lines = (
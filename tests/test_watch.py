@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from typing import final
+
+from pyrcli.cli.watch import FileWatcher
+
+
+@final
+class TestWatch(unittest.TestCase):
+    """Test the watch module."""
+
+    def test_file_watcher(self) -> None:
+        """Test the FileWatcher class with inotify, when available, and with stat polling."""
+        for use_inotify in (True, False):
+            with tempfile.TemporaryDirectory() as temp_dir, FileWatcher(polling_interval=0.01,
+                                                                        use_inotify=use_inotify) as watcher:
+                watched = os.path.join(temp_dir, "watched.txt")
+                unwatched = os.path.join(temp_dir, "unwatched.txt")
+
+                with open(watched, mode="w") as f:
+                    f.write("a\n")
+
+                watcher.add(watched)
+
+                # 1) No changes: wait() times out with an empty set.
+                self.assertEqual(watcher.wait(0.05), set())
+
+                # 2) Appending to a watched file reports it.
+                with open(watched, mode="a") as f:
+                    f.write("b\n")
+
+                self.assertEqual(watcher.wait(1.0), {watched})
+
+                # 3) Changes to other files in the same directory are not reported.
+                with open(unwatched, mode="w") as f:
+                    f.write("c\n")
+
+                self.assertEqual(watcher.wait(0.05), set())
+
+                # 4) Replacing a watched file reports it.
+                os.replace(unwatched, watched)
+                self.assertEqual(watcher.wait(1.0), {watched})
+
+                # 5) Removed files are no longer reported.
+                watcher.remove(watched)
+
+                with open(watched, mode="a") as f:
+                    f.write("d\n")
+
+                self.assertEqual(watcher.wait(0.05), set())
+
+            with tempfile.TemporaryDirectory() as link_dir, tempfile.TemporaryDirectory() as target_dir:
+                link = os.path.join(link_dir, "link.txt")
+                targets = [os.path.join(target_dir, "target.txt"), os.path.join(target_dir, "other", "target.txt")]
+                os.makedirs(os.path.dirname(targets[1]))
+
+                for target in targets:
+                    with open(target, mode="w") as f:
+                        f.write("a\n")
+
+                os.symlink(targets[0], link)
+
+                # 6) Appending to the target of a symbolic link in another directory reports the link, without polling
+                # when inotify is used.
+                with FileWatcher(polling_interval=60.0, use_inotify=use_inotify) as watcher:
+                    watcher.add(link)
+
+                    with open(targets[0], mode="a") as f:
+                        f.write("b\n")
+
+                    self.assertEqual(watcher.wait(1.0), {link})
+
+                # 7) Changes without inotify events, such as to a new target in an unwatched directory, are polled.
+                with FileWatcher(polling_interval=0.01, use_inotify=use_inotify) as watcher:
+                    watcher.add(link)
+                    os.symlink(targets[1], link + ".new")
+                    os.replace(link + ".new", link)
+                    self.assertEqual(watcher.wait(1.0), {link})
+
+                    with open(targets[1], mode="a") as f:
+                        f.write("b\n")
+
+                    self.assertEqual(watcher.wait(1.0), {link})